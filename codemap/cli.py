@@ -33,11 +33,18 @@ def cli():
     multiple=True,
     help="Additional patterns to exclude",
 )
-def init(path: str, lang: tuple[str, ...], exclude: tuple[str, ...]):
+@click.option(
+    "--rebuild",
+    is_flag=True,
+    help="Reparse every file instead of reusing the parse cache",
+)
+def init(path: str, lang: tuple[str, ...], exclude: tuple[str, ...], rebuild: bool):
     """Initialize codemap for a directory.
 
     Scans the directory and creates a .codemap/ folder with structural
     information about all code files, mirroring the project structure.
+    Files unchanged since the last run reuse their cached symbols unless
+    --rebuild is given.
     """
     from .core.indexer import Indexer
 
@@ -50,7 +57,7 @@ def init(path: str, lang: tuple[str, ...], exclude: tuple[str, ...]):
             languages=list(lang) if lang else None,
             exclude_patterns=list(exclude) if exclude else None,
         )
-        result = indexer.index_all()
+        result = indexer.index_all(rebuild=rebuild)
 
         click.echo(f"Found {result['total_files']} files")
         click.echo(f"Indexed {result['total_symbols']} symbols")
@@ -1,10 +1,10 @@
 """Core indexing functionality."""
 
-from .hasher import hash_file, hash_content
+from .hasher import hash_file, hash_files, hash_content
 from .map_store import MapStore
 from .indexer import Indexer
 
-__all__ = ["hash_file", "hash_content", "MapStore", "Indexer"]
+__all__ = ["hash_file", "hash_files", "hash_content", "MapStore", "Indexer"]
 
 # Optional watcher (requires watchdog)
 try:
@@ -3,7 +3,14 @@
 from __future__ import annotations
 
 import hashlib
+import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
+from typing import BinaryIO, Iterable, Optional
+
+# Large files are hashed in pieces of this size rather than read whole
+_CHUNK_SIZE = 1 << 20
 
 
 def hash_file(filepath: str | Path) -> str:
@@ -20,7 +27,53 @@ def hash_file(filepath: str | Path) -> str:
         PermissionError: If the file can't be read.
     """
     with open(filepath, "rb") as f:
-        return hashlib.sha256(f.read()).hexdigest()[:12]
+        # One read for the usual small file; reading a whole chunk would
+        # first allocate the full chunk-sized buffer
+        if os.fstat(f.fileno()).st_size <= _CHUNK_SIZE:
+            return hash_content(f.read())
+        return _hash_stream(f)
+
+
+def hash_files(
+    filepaths: Iterable[str | Path], max_workers: int | None = None
+) -> dict[str | Path, str]:
+    """Hash many files, reading and hashing them on a thread pool.
+
+    File reads and SHA256 over more than a couple of KB both release the
+    GIL, so threads hash files in parallel.
+
+    Args:
+        filepaths: Paths of the files to hash.
+        max_workers: Optional thread count. Defaults to os.cpu_count().
+
+    Returns:
+        Dict mapping each path to its hash. Files that can't be read
+        (missing, unreadable) are left out.
+    """
+    filepaths = list(filepaths)
+    workers = min(max_workers or os.cpu_count() or 1, len(filepaths))
+    if workers <= 1:
+        hashes = list(map(_try_hash_file, filepaths))
+    else:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            hashes = list(executor.map(_try_hash_file, filepaths))
+    return {path: h for path, h in zip(filepaths, hashes) if h is not None}
+
+
+def _try_hash_file(filepath: str | Path) -> Optional[str]:
+    """hash_file(), or None if the file can't be read."""
+    try:
+        return hash_file(filepath)
+    except OSError:
+        return None
+
+
+def _hash_stream(stream: BinaryIO) -> str:
+    """Hash everything left in a binary stream, reading it in chunks."""
+    digest = hashlib.sha256()
+    for chunk in iter(partial(stream.read, _CHUNK_SIZE), b""):
+        digest.update(chunk)
+    return digest.hexdigest()[:12]
 
 
 def hash_content(content: bytes) -> str:
@@ -3,18 +3,164 @@
 from __future__ import annotations
 
 import logging
+import os
+import sqlite3
+import sys
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache
+from importlib import metadata
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, Optional
 
-from ..parsers.base import Parser, Symbol
+from .. import __version__
+from ..parsers.base import Parser, Symbol, _worker_parser
+from ..parsers.parse_cache import ParseCache
 from ..parsers.python_parser import PythonParser
+from ..parsers.treesitter_base import skip_tree_cache
 from ..utils.config import Config, load_config
-from ..utils.file_utils import count_lines, discover_files, get_language
-from .hasher import hash_file
-from .map_store import MapStore
+from ..utils.file_utils import count_lines_in, discover_files, get_language
+from .hasher import hash_content, hash_file, hash_files
+from .map_store import FileEntry, MapStore
 
 logger = logging.getLogger(__name__)
 
+# Parsed symbols of unchanged files survive a full reindex in this file;
+# SQLite keeps its write-ahead log next to it
+PARSE_CACHE_FILE = "parse-cache.db"
+_PARSE_CACHE_FILES = (PARSE_CACHE_FILE, PARSE_CACHE_FILE + "-wal", PARSE_CACHE_FILE + "-shm")
+
+# Installed packages whose version changes what the parsers produce
+_PARSER_DISTRIBUTIONS = (
+    "tree-sitter",
+    "tree-sitter-c",
+    "tree-sitter-c-sharp",
+    "tree-sitter-cpp",
+    "tree-sitter-css",
+    "tree-sitter-go",
+    "tree-sitter-html",
+    "tree-sitter-java",
+    "tree-sitter-javascript",
+    "tree-sitter-kotlin",
+    "tree-sitter-language-pack",
+    "tree-sitter-php",
+    "tree-sitter-rust",
+    "tree-sitter-sql",
+    "tree-sitter-swift",
+    "tree-sitter-typescript",
+)
+
+# A file modified this recently may be written to again within the same
+# mtime tick, so its mtime isn't trusted to detect later changes
+_RACY_WINDOW_NS = 2_000_000_000
+
+# Below this many files to parse, index_all doesn't start worker processes
+_PARALLEL_MIN_FILES = 8
+
+
+@lru_cache(maxsize=None)
+def _parse_cache_version() -> str:
+    """Return the version the parse cache is keyed on.
+
+    Parser output depends on codemap itself, on the Python version (the ast
+    module parses Python files) and on the installed tree-sitter grammars,
+    so upgrading any of them empties the cache.
+    """
+    parts = [__version__, "python%d.%d" % sys.version_info[:2]]
+    for name in _PARSER_DISTRIBUTIONS:
+        try:
+            parts.append(f"{name}={metadata.version(name)}")
+        except metadata.PackageNotFoundError:
+            pass
+    return ";".join(parts)
+
+
+@dataclass(slots=True)
+class _SourceFile:
+    """A file read for indexing, before it's parsed."""
+
+    filepath: Path
+    language: str
+    parser: Parser
+    data: bytes  # As on disk, for the content hash
+    raw: bytes  # Newlines normalized, for parsing
+    mtime_ns: int
+
+
+def _parse_source(parser: Parser, raw: bytes, filepath: Path | str) -> list[Symbol]:
+    """Parse a file's content, treating syntax errors as a file without symbols.
+
+    Args:
+        parser: Parser for the file's language.
+        raw: The file's content with newlines normalized.
+        filepath: Path to the file.
+
+    Returns:
+        List of extracted symbols.
+    """
+    # Byte-capable parsers skip the decode/re-encode round trip
+    content = raw if parser.accepts_bytes else raw.decode("utf-8", errors="replace")
+
+    try:
+        try:
+            return parser.parse(content, str(filepath))
+        except (UnicodeDecodeError, SyntaxError):
+            if content is not raw:
+                raise
+            try:
+                raw.decode("utf-8")
+            except UnicodeDecodeError:
+                # Not valid UTF-8; parse with replacement characters instead
+                return parser.parse(raw.decode("utf-8", errors="replace"), str(filepath))
+            # Valid UTF-8, so the error is real and a second parse would repeat it
+            raise
+    except SyntaxError as e:
+        logger.warning(f"Syntax error in {filepath}: {e}")
+        return []
+
+
+def _try_parse_source(
+    parser: Parser, raw: bytes, filepath: Path | str
+) -> tuple[list[Symbol], Optional[str]]:
+    """_parse_source(), returning (symbols, None) or ([], message) on failure."""
+    try:
+        return _parse_source(parser, raw, filepath), None
+    except Exception as e:
+        return [], str(e)
+
+
+def _parse_in_pool(
+    item: tuple[type[Parser], bytes, str],
+) -> tuple[list[Symbol], Optional[str]]:
+    """Parse one (parser class, content, filepath) item in a worker process."""
+    parser_cls, raw, filepath = item
+    # Workers never reparse a file, so they keep no trees
+    with skip_tree_cache():
+        return _try_parse_source(_worker_parser(parser_cls), raw, filepath)
+
+
+def _symbol_keys(symbols: list[Symbol]) -> Counter:
+    """Count the symbols in a tree by what identifies them, ignoring line numbers.
+
+    Args:
+        symbols: Top-level symbols of a file.
+
+    Returns:
+        Counter of (qualified name, type, signature, docstring) tuples.
+    """
+    keys: Counter = Counter()
+    stack = [(symbol, "") for symbol in symbols]
+    while stack:
+        symbol, parent = stack.pop()
+        name = f"{parent}.{symbol.name}" if parent else symbol.name
+        keys[(name, symbol.type, symbol.signature, symbol.docstring)] += 1
+        if symbol.children:
+            stack.extend((child, name) for child in symbol.children)
+    return keys
+
 
 class Indexer:
     """Orchestrates the indexing of a codebase."""
@@ -47,6 +193,18 @@ class Indexer:
         self.map_store = MapStore(self.root)
         self._parsers: dict[str, Parser] = {}
         self._init_parsers()
+        # Opened on first parse, so read-only use never creates .codemap/
+        self._parse_cache: Optional[ParseCache] = None
+        self._parse_cache_failed = False
+
+        # Held while the index changes: flush_pending() runs on a timer thread
+        # and the watcher calls update_file() from its own
+        self._lock = threading.RLock()
+
+        # Debounced updates: files waiting for the timer to flush them
+        self._pending: dict[Path, None] = {}
+        self._pending_lock = threading.Lock()
+        self._pending_timer: Optional[threading.Timer] = None
 
     def _init_parsers(self) -> None:
         """Initialize language parsers."""
@@ -145,43 +303,76 @@ class Indexer:
         indexer.map_store = MapStore.load(root)
         return indexer
 
-    def index_all(self) -> dict:
+    def index_all(self, max_workers: int | None = None, rebuild: bool = False) -> dict:
         """Index all files in the root directory.
 
+        Files missing from the parse cache are parsed in worker processes
+        when there are enough of them; the map store is only updated here.
+
+        Args:
+            max_workers: Optional worker process count. Defaults to
+                os.cpu_count(); 1 parses everything in this process.
+            rebuild: Drop the parse cache first, so every file is parsed.
+
         Returns:
             Dictionary with indexing statistics.
         """
-        # Clear any existing codemap
-        self.map_store.clear()
-
-        # Set metadata
-        self.map_store.set_metadata(
-            root=str(self.root),
-            config=self.config.to_dict(),
-        )
-
-        total_files = 0
-        total_symbols = 0
-        errors = []
+        with self._lock:
+            if rebuild:
+                # Clear everything; the cache is reopened empty on first use
+                if self._parse_cache is not None:
+                    self._parse_cache.close()
+                    self._parse_cache = None
+                self.map_store.clear()
+            else:
+                # Clear any existing codemap, keeping the parse cache
+                self.map_store.clear(keep=_PARSE_CACHE_FILES)
+
+            # Set metadata
+            self.map_store.set_metadata(
+                root=str(self.root),
+                config=self.config.to_dict(),
+            )
 
-        for filepath in discover_files(self.root, self.config):
-            try:
-                symbols = self._index_file(filepath)
+            total_files = 0
+            total_symbols = 0
+            errors = []
+            pending: list[_SourceFile] = []
+
+            for filepath in discover_files(self.root, self.config):
+                try:
+                    source = self._read_source(filepath)
+                    if source is not None:
+                        symbols = self._get_cached_symbols(source)
+                        if symbols is None:
+                            pending.append(source)
+                            continue
+                        self._store_file(source, symbols)
+                        total_symbols += self._count_symbols(symbols)
+                    total_files += 1
+                except Exception as e:
+                    logger.warning(f"Failed to index {filepath}: {e}")
+                    errors.append((str(filepath), str(e)))
+
+            for source, (symbols, error) in zip(pending, self._parse_pending(pending, max_workers)):
+                if error is not None:
+                    logger.warning(f"Failed to index {source.filepath}: {error}")
+                    errors.append((str(source.filepath), error))
+                    continue
+                self._put_cached_symbols(source, symbols)
+                self._store_file(source, symbols)
                 total_files += 1
                 total_symbols += self._count_symbols(symbols)
-            except Exception as e:
-                logger.warning(f"Failed to index {filepath}: {e}")
-                errors.append((str(filepath), str(e)))
 
-        # Update stats and save
-        self.map_store.update_stats()
-        self.map_store.save()
+            # Update stats and save
+            self.map_store.update_stats()
+            self.save()
 
-        return {
-            "total_files": total_files,
-            "total_symbols": total_symbols,
-            "errors": errors,
-        }
+            return {
+                "total_files": total_files,
+                "total_symbols": total_symbols,
+                "errors": errors,
+            }
 
     def _index_file(self, filepath: Path) -> list[Symbol]:
         """Index a single file.
@@ -192,45 +383,143 @@ class Indexer:
         Returns:
             List of extracted symbols.
         """
+        source = self._read_source(filepath)
+        if source is None:
+            return []
+
+        symbols = self._get_cached_symbols(source)
+        if symbols is None:
+            symbols = _parse_source(source.parser, source.raw, source.filepath)
+            self._put_cached_symbols(source, symbols)
+
+        self._store_file(source, symbols)
+        return symbols
+
+    def _read_source(self, filepath: Path) -> Optional[_SourceFile]:
+        """Read a file for indexing.
+
+        Args:
+            filepath: Path to the file.
+
+        Returns:
+            The file's content and parser, or None if no parser handles it.
+        """
         language = get_language(filepath)
         if not language:
-            return []
+            return None
 
         parser = self._parsers.get(language)
         if not parser:
             logger.debug(f"No parser for language {language}")
-            return []
+            return None
 
-        # Read file content
-        try:
-            content = filepath.read_text(encoding="utf-8")
-        except UnicodeDecodeError:
-            # Try with errors='replace' for non-UTF-8 files
-            content = filepath.read_text(encoding="utf-8", errors="replace")
+        # Read file content once as bytes, with universal newlines as a
+        # text-mode read would give
+        with open(filepath, "rb") as f:
+            stat = os.fstat(f.fileno())
+            data = f.read()
+        raw = data
+        if b"\r" in raw:
+            raw = raw.replace(b"\r\n", b"\n").replace(b"\r", b"\n")
 
-        # Parse symbols
-        try:
-            symbols = parser.parse(content, str(filepath))
-        except SyntaxError as e:
-            logger.warning(f"Syntax error in {filepath}: {e}")
-            symbols = []
+        # Record the stat signature only if it describes exactly what was read
+        mtime_ns = 0
+        if len(data) == stat.st_size and stat.st_mtime_ns < time.time_ns() - _RACY_WINDOW_NS:
+            mtime_ns = stat.st_mtime_ns
 
+        return _SourceFile(filepath, language, parser, data, raw, mtime_ns)
+
+    def _store_file(self, source: _SourceFile, symbols: list[Symbol]) -> None:
+        """Record a parsed file in the map store.
+
+        Args:
+            source: The file as read by _read_source().
+            symbols: Symbols parsed from it.
+        """
         # Get relative path
         try:
-            rel_path = str(filepath.relative_to(self.root))
+            rel_path = str(source.filepath.relative_to(self.root))
         except ValueError:
-            rel_path = str(filepath)
+            rel_path = str(source.filepath)
 
-        # Update map store
         self.map_store.update_file(
             rel_path=rel_path,
-            hash=hash_file(filepath),
-            language=language,
-            lines=count_lines(filepath),
+            hash=hash_content(source.data),
+            language=source.language,
+            lines=count_lines_in(source.raw),
             symbols=symbols,
+            mtime_ns=source.mtime_ns,
+            size=len(source.data),
         )
 
-        return symbols
+    def _parse_pending(
+        self, pending: list[_SourceFile], max_workers: int | None = None
+    ) -> Iterator[tuple[list[Symbol], Optional[str]]]:
+        """Parse files, across worker processes when there are enough of them.
+
+        Args:
+            pending: Files to parse.
+            max_workers: Optional worker process count. Defaults to os.cpu_count().
+
+        Yields:
+            (symbols, error) for each file in order; error is None on success.
+        """
+        workers = min(max_workers or os.cpu_count() or 1, len(pending))
+        # Starting workers costs more than parsing a handful of files
+        if workers <= 1 or len(pending) < _PARALLEL_MIN_FILES:
+            for source in pending:
+                # Trees are only kept for files reparsed by update_file
+                with skip_tree_cache():
+                    result = _try_parse_source(source.parser, source.raw, source.filepath)
+                yield result
+            return
+
+        items = [(type(s.parser), s.raw, str(s.filepath)) for s in pending]
+        chunksize = max(1, len(items) // (4 * workers))
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            yield from executor.map(_parse_in_pool, items, chunksize=chunksize)
+
+    def _get_cached_symbols(self, source: _SourceFile) -> Optional[list[Symbol]]:
+        """Return symbols cached for the file's exact content, if any."""
+        cache = self._get_parse_cache()
+        if cache is None:
+            return None
+        return cache.get(str(source.filepath), source.raw)
+
+    def _put_cached_symbols(self, source: _SourceFile, symbols: list[Symbol]) -> None:
+        """Store the symbols parsed from the file's content."""
+        cache = self._get_parse_cache()
+        if cache is not None:
+            cache.put(str(source.filepath), source.raw, symbols)
+
+    def _get_parse_cache(self) -> Optional[ParseCache]:
+        """Open the parse cache in .codemap/, or None if it can't be used."""
+        if self._parse_cache is None and not self._parse_cache_failed:
+            try:
+                self.map_store.codemap_dir.mkdir(parents=True, exist_ok=True)
+                self._parse_cache = ParseCache(
+                    self.map_store.codemap_dir / PARSE_CACHE_FILE,
+                    version=_parse_cache_version(),
+                )
+            except (OSError, sqlite3.Error) as e:
+                logger.debug(f"Parse cache not available: {e}")
+                self._parse_cache_failed = True
+        return self._parse_cache
+
+    def save(self) -> None:
+        """Write changed maps to disk and commit pending parse cache writes."""
+        with self._lock:
+            self.map_store.save()
+            if self._parse_cache is not None:
+                self._parse_cache.flush()
+
+    def close(self) -> None:
+        """Apply pending updates and close the parse cache, if it was opened."""
+        with self._lock:
+            self.flush_pending()
+            if self._parse_cache is not None:
+                self._parse_cache.close()
+                self._parse_cache = None
 
     def _count_symbols(self, symbols: list[Symbol] | None) -> int:
         """Count total symbols including children.
@@ -249,72 +538,142 @@ class Indexer:
                 count += self._count_symbols(symbol.children)
         return count
 
-    def update_file(self, filepath: str | Path) -> dict:
+    def update_file(self, filepath: str | Path, save: bool = True) -> dict:
         """Update index for a single file.
 
         Args:
             filepath: Path to the file to reindex.
+            save: Write the changed maps to disk. Callers updating several
+                files pass False and call save() once at the end.
 
         Returns:
             Dictionary with update statistics.
         """
-        filepath = Path(filepath).resolve()
+        with self._lock:
+            filepath = Path(filepath).resolve()
 
-        if not filepath.exists():
-            # File was deleted, remove from index
+            if not filepath.exists():
+                # File was deleted, remove from index
+                try:
+                    rel_path = str(filepath.relative_to(self.root))
+                except ValueError:
+                    rel_path = str(filepath)
+
+                old_entry = self.map_store.get_file(rel_path)
+                removed = self.map_store.remove_file(rel_path)
+                if removed:
+                    self.map_store.adjust_stats(-1, -self._count_symbols(old_entry.symbols))
+                if save:
+                    self.save()
+
+                return {
+                    "removed": removed,
+                    "symbols_changed": 0,
+                }
+
+            # Re-index the file
             try:
                 rel_path = str(filepath.relative_to(self.root))
-            except ValueError:
-                rel_path = str(filepath)
+                old_entry = self.map_store.get_file(rel_path)
+                old_symbols = old_entry.symbols if old_entry else []
+
+                self._index_file(filepath)
+                new_entry = self.map_store.get_file(rel_path)
+                new_symbols = new_entry.symbols if new_entry else []
+
+                # Only this file's directory map is rewritten, and the stats are
+                # adjusted rather than recounted from every directory map
+                self.map_store.adjust_stats(
+                    (new_entry is not None) - (old_entry is not None),
+                    self._count_symbols(new_symbols) - self._count_symbols(old_symbols),
+                )
+                if save:
+                    self.save()
+
+                old_keys = _symbol_keys(old_symbols)
+                new_keys = _symbol_keys(new_symbols)
+                changed = (old_keys - new_keys) + (new_keys - old_keys)
+                return {
+                    "removed": False,
+                    "symbols_changed": sum(changed.values()),
+                }
+            except Exception as e:
+                logger.error(f"Failed to update {filepath}: {e}")
+                raise
 
-            removed = self.map_store.remove_file(rel_path)
-            self.map_store.update_stats()
-            self.map_store.save()
+    def update_all_stale(self) -> dict:
+        """Update all stale files.
+
+        Returns:
+            Dictionary with update statistics.
+        """
+        with self._lock:
+            stale_files = self.validate_all()
+            updated = 0
+            errors = []
+
+            for filepath in stale_files:
+                try:
+                    self.update_file(self.root / filepath, save=False)
+                    updated += 1
+                except Exception as e:
+                    errors.append((filepath, str(e)))
+
+            if stale_files:
+                self.save()
 
             return {
-                "removed": removed,
-                "symbols_changed": 0,
+                "updated": updated,
+                "errors": errors,
             }
 
-        # Re-index the file
-        try:
-            old_entry = self.map_store.get_file(
-                str(filepath.relative_to(self.root))
-            )
-            old_symbol_count = 0
-            if old_entry:
-                old_symbol_count = self._count_symbols(old_entry.symbols)
+    def schedule_update(self, filepath: str | Path, debounce_seconds: float = 0.1) -> None:
+        """Update a file once writes to it have settled.
 
-            symbols = self._index_file(filepath)
-            new_symbol_count = self._count_symbols(symbols)
+        Editors often write a file several times in quick succession. Each
+        call restarts the timer, and when it fires every file scheduled in
+        the meantime is reindexed once, with a single save.
 
-            self.map_store.update_stats()
-            self.map_store.save()
+        Args:
+            filepath: Path to the changed file.
+            debounce_seconds: Time to wait for further changes.
+        """
+        with self._pending_lock:
+            self._pending[Path(filepath).resolve()] = None
 
-            return {
-                "removed": False,
-                "symbols_changed": abs(new_symbol_count - old_symbol_count),
-            }
-        except Exception as e:
-            logger.error(f"Failed to update {filepath}: {e}")
-            raise
+            if self._pending_timer is not None:
+                self._pending_timer.cancel()
 
-    def update_all_stale(self) -> dict:
-        """Update all stale files.
+            self._pending_timer = threading.Timer(debounce_seconds, self.flush_pending)
+            self._pending_timer.daemon = True
+            self._pending_timer.start()
+
+    def flush_pending(self) -> dict:
+        """Apply updates queued by schedule_update now.
 
         Returns:
             Dictionary with update statistics.
         """
-        stale_files = self.validate_all()
-        updated = 0
-        errors = []
-
-        for filepath in stale_files:
-            try:
-                self.update_file(self.root / filepath)
-                updated += 1
-            except Exception as e:
-                errors.append((filepath, str(e)))
+        with self._lock:
+            with self._pending_lock:
+                pending = list(self._pending)
+                self._pending.clear()
+                if self._pending_timer is not None:
+                    self._pending_timer.cancel()
+                    self._pending_timer = None
+
+            updated = 0
+            errors = []
+
+            for filepath in pending:
+                try:
+                    self.update_file(filepath, save=False)
+                    updated += 1
+                except Exception as e:
+                    errors.append((str(filepath), str(e)))
+
+            if pending:
+                self.save()
 
         return {
             "updated": updated,
@@ -328,25 +687,46 @@ class Indexer:
             List of relative paths for stale files.
         """
         stale = []
-
-        for rel_path, entry in self.map_store.get_all_files():
-            filepath = self.root / rel_path
-
-            if not filepath.exists():
-                # File was deleted
+        # Files whose mtime and size are unchanged aren't read at all
+        entries = [
+            (rel_path, entry)
+            for rel_path, entry in self.map_store.get_all_files()
+            if not self._stat_matches(self.root / rel_path, entry)
+        ]
+        current = hash_files(self.root / rel_path for rel_path, _ in entries)
+
+        for rel_path, entry in entries:
+            current_hash = current.get(self.root / rel_path)
+            if current_hash is None:
+                # Deleted, or present but unreadable
+                filepath = self.root / rel_path
+                if filepath.exists():
+                    logger.warning(f"Failed to hash {filepath}")
                 stale.append(rel_path)
-                continue
-
-            try:
-                current_hash = hash_file(filepath)
-                if current_hash != entry.hash:
-                    stale.append(rel_path)
-            except Exception as e:
-                logger.warning(f"Failed to hash {filepath}: {e}")
+            elif current_hash != entry.hash:
                 stale.append(rel_path)
 
         return stale
 
+    def _stat_matches(self, filepath: Path, entry: FileEntry) -> bool:
+        """Check whether a file's mtime and size are the ones recorded at indexing.
+
+        Args:
+            filepath: Path to the file.
+            entry: The file's entry in the map store.
+
+        Returns:
+            True if the file is unchanged without reading it, False if it
+            has to be hashed to tell.
+        """
+        if not entry.mtime_ns:
+            return False
+        try:
+            stat = os.stat(filepath)
+        except OSError:
+            return False
+        return stat.st_mtime_ns == entry.mtime_ns and stat.st_size == entry.size
+
     def validate_file(self, filepath: str | Path) -> bool:
         """Validate a single file's hash.
 
@@ -367,6 +747,8 @@ class Indexer:
             return False
 
         full_path = self.root / rel_path
+        if self._stat_matches(full_path, entry):
+            return True
         if not full_path.exists():
             return False
 
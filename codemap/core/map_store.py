@@ -3,7 +3,10 @@
 from __future__ import annotations
 
 import json
+import os
 import shutil
+import sys
+import threading
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
@@ -11,6 +14,15 @@ from typing import Any, Iterator, Optional
 
 from ..parsers.base import Symbol
 
+# orjson is an optional dependency that reads and writes the maps much faster
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
 
 @dataclass
 class FileEntry:
@@ -21,16 +33,23 @@ class FileEntry:
     language: str
     lines: int
     symbols: list[Symbol]
+    # Stat signature the file had when hashed; mtime_ns is 0 when unknown
+    mtime_ns: int = 0
+    size: int = 0
 
     def to_dict(self) -> dict:
         """Convert to dictionary for JSON serialization."""
-        return {
+        result = {
             "hash": self.hash,
             "indexed_at": self.indexed_at,
             "language": self.language,
             "lines": self.lines,
             "symbols": [s.to_dict() for s in self.symbols],
         }
+        if self.mtime_ns:
+            result["mtime_ns"] = self.mtime_ns
+            result["size"] = self.size
+        return result
 
     @classmethod
     def from_dict(cls, data: dict) -> "FileEntry":
@@ -38,9 +57,11 @@ class FileEntry:
         return cls(
             hash=data["hash"],
             indexed_at=data["indexed_at"],
-            language=data["language"],
+            language=sys.intern(data["language"]),
             lines=data["lines"],
             symbols=[Symbol.from_dict(s) for s in data.get("symbols", [])],
+            mtime_ns=data.get("mtime_ns", 0),
+            size=data.get("size", 0),
         )
 
 
@@ -128,6 +149,9 @@ class MapStore:
         self.codemap_dir = self.root / self.CODEMAP_DIR
         self._manifest: Optional[RootManifest] = None
         self._dir_maps: dict[str, DirectoryMap] = {}  # Cache for directory maps
+        self._dirty: set[str] = set()  # Directories changed since the last save
+        # One copy of each symbol name and signature read from disk
+        self._strings: dict[str, str] = {}
 
     @property
     def manifest(self) -> RootManifest:
@@ -174,8 +198,7 @@ class MapStore:
             return RootManifest()
 
         try:
-            with open(manifest_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            data = _loads(manifest_path.read_bytes())
             return RootManifest.from_dict(data)
         except (json.JSONDecodeError, KeyError):
             return RootManifest()
@@ -211,9 +234,10 @@ class MapStore:
             dir_map = DirectoryMap(directory=directory)
         else:
             try:
-                with open(map_path, "r", encoding="utf-8") as f:
-                    data = json.load(f)
+                data = _loads(map_path.read_bytes())
                 dir_map = DirectoryMap.from_dict(data)
+                for entry in dir_map.files.values():
+                    _share_strings(entry.symbols, self._strings)
             except (json.JSONDecodeError, KeyError):
                 dir_map = DirectoryMap(directory=directory)
 
@@ -236,9 +260,7 @@ class MapStore:
         # Create parent directories
         map_path.parent.mkdir(parents=True, exist_ok=True)
 
-        data = dir_map.to_dict()
-        with open(map_path, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, sort_keys=True)
+        _write_json(map_path, dir_map.to_dict())
 
     def save_manifest(self) -> None:
         """Save the root manifest."""
@@ -246,15 +268,14 @@ class MapStore:
         self.manifest.generated_at = datetime.now(timezone.utc).isoformat()
 
         manifest_path = self.codemap_dir / self.MANIFEST_FILE
-        data = self.manifest.to_dict()
-        with open(manifest_path, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, sort_keys=True)
+        _write_json(manifest_path, self.manifest.to_dict())
 
     def save(self) -> None:
         """Save all modified directory maps and the manifest."""
-        # Save all cached directory maps
-        for directory in list(self._dir_maps.keys()):
+        # Directory maps that were only read are left as they are on disk
+        for directory in sorted(self._dirty):
             self._save_dir_map(directory)
+        self._dirty.clear()
 
         # Save manifest
         self.save_manifest()
@@ -266,6 +287,8 @@ class MapStore:
         language: str,
         lines: int,
         symbols: list[Symbol],
+        mtime_ns: int = 0,
+        size: int = 0,
     ) -> None:
         """Update or add a file entry.
 
@@ -275,6 +298,9 @@ class MapStore:
             language: Programming language.
             lines: Number of lines in file.
             symbols: List of extracted symbols.
+            mtime_ns: File modification time the hash was taken at, or 0
+                if it can't be trusted to detect changes.
+            size: File size the hash was taken at.
         """
         # Determine which directory this file belongs to
         path = Path(rel_path)
@@ -291,8 +317,12 @@ class MapStore:
             language=language,
             lines=lines,
             symbols=symbols,
+            mtime_ns=mtime_ns,
+            size=size,
         )
 
+        self._dirty.add(directory)
+
         # Ensure directory is in the manifest
         if directory not in self.manifest.directories:
             self.manifest.directories.append(directory)
@@ -313,6 +343,7 @@ class MapStore:
         dir_map = self._load_dir_map(directory)
         if filename in dir_map.files:
             del dir_map.files[filename]
+            self._dirty.add(directory)
 
             # If directory is now empty, remove it from manifest and cache
             if not dir_map.files:
@@ -320,6 +351,7 @@ class MapStore:
                     self.manifest.directories.remove(directory)
                 if directory in self._dir_maps:
                     del self._dir_maps[directory]
+                self._dirty.discard(directory)
                 # Remove the empty directory's codemap file
                 map_path = self._get_dir_map_path(directory)
                 if map_path.exists():
@@ -460,6 +492,23 @@ class MapStore:
             "last_full_index": datetime.now(timezone.utc).isoformat(),
         }
 
+    def adjust_stats(self, files_delta: int, symbols_delta: int) -> None:
+        """Adjust the manifest's totals after files were added, changed or removed.
+
+        Cheaper than update_stats(), which loads every directory map to
+        recount. Falls back to it if the manifest has no totals yet.
+
+        Args:
+            files_delta: Change in the number of indexed files.
+            symbols_delta: Change in the total number of symbols.
+        """
+        stats = self.manifest.stats
+        if "total_files" not in stats or "total_symbols" not in stats:
+            self.update_stats()
+            return
+        stats["total_files"] += files_delta
+        stats["total_symbols"] += symbols_delta
+
     def _count_symbols(self, symbols: list[Symbol] | None) -> int:
         """Count total symbols including children.
 
@@ -502,12 +551,81 @@ class MapStore:
                 else:
                     yield filename, entry
 
-    def clear(self) -> None:
-        """Remove the entire .codemap directory."""
+    def clear(self, keep: tuple[str, ...] = ()) -> None:
+        """Remove the .codemap directory.
+
+        Args:
+            keep: Names of top-level entries in .codemap to leave in place.
+        """
         if self.codemap_dir.exists():
-            shutil.rmtree(self.codemap_dir)
+            if keep:
+                for child in self.codemap_dir.iterdir():
+                    if child.name in keep:
+                        continue
+                    if child.is_dir() and not child.is_symlink():
+                        shutil.rmtree(child)
+                    else:
+                        child.unlink()
+            else:
+                shutil.rmtree(self.codemap_dir)
         self._manifest = RootManifest()
         self._dir_maps.clear()
+        self._dirty.clear()
+        self._strings.clear()
+
+
+def _share_strings(symbols: list[Symbol], strings: dict[str, str]) -> None:
+    """Replace symbol names and signatures with the pool's copy of equal strings.
+
+    Names like __init__ or signatures like (self) recur across a codebase;
+    each parsed JSON file would otherwise hold its own copies.
+    """
+    stack = list(symbols)
+    while stack:
+        symbol = stack.pop()
+        symbol.name = strings.setdefault(symbol.name, symbol.name)
+        if symbol.signature is not None:
+            symbol.signature = strings.setdefault(symbol.signature, symbol.signature)
+        if symbol.children:
+            stack.extend(symbol.children)
+
+
+def _dumps(data: dict) -> bytes:
+    """Serialize to indented JSON with sorted keys, using orjson if installed.
+
+    Both paths produce the same bytes: non-ASCII text is written as UTF-8.
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS)
+    return json.dumps(data, indent=2, sort_keys=True, ensure_ascii=False).encode("utf-8")
+
+
+def _loads(data: bytes) -> Any:
+    """Parse JSON bytes, using orjson if installed.
+
+    Raises:
+        json.JSONDecodeError: If the data isn't valid JSON (orjson's error
+            is a subclass).
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _write_json(path: Path, data: dict) -> None:
+    """Write JSON through a temporary file, so readers never see it half-written."""
+    # One temporary file per writing thread, so concurrent saves can't mix
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        with open(tmp_path, "wb") as f:
+            f.write(_dumps(data))
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
 
 
 # Legacy compatibility aliases
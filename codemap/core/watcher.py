@@ -235,13 +235,10 @@ class CodeMapWatcher:
 
         try:
             if event_type == "deleted":
-                # Remove from index
-                removed = self.indexer.map_store.remove_file(rel_path)
-                if removed:
-                    self.indexer.map_store.update_stats()
-                    self.indexer.map_store.save()
-                    if self.on_update:
-                        self.on_update(rel_path, 0)
+                # Remove from index; update_file drops files that no longer exist
+                result = self.indexer.update_file(filepath)
+                if result["removed"] and self.on_update:
+                    self.on_update(rel_path, 0)
             else:
                 # Update file (created or modified)
                 result = self.indexer.update_file(filepath)
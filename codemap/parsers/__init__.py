@@ -1,9 +1,18 @@
 """Language parsers for symbol extraction."""
 
-from .base import Parser, Symbol
+from .base import Parser, Symbol, SymbolTable, pack_symbols, unpack_symbols
+from .parse_cache import ParseCache
 from .python_parser import PythonParser
 
-__all__ = ["Parser", "Symbol", "PythonParser"]
+__all__ = [
+    "Parser",
+    "Symbol",
+    "SymbolTable",
+    "ParseCache",
+    "PythonParser",
+    "pack_symbols",
+    "unpack_symbols",
+]
 
 # Optional tree-sitter parsers - each imports gracefully if grammar is available
 
@@ -2,12 +2,32 @@
 
 from __future__ import annotations
 
+import json
+import os
+import sys
 from abc import ABC, abstractmethod
+from array import array
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
+from functools import partial
 from typing import Optional
 
+# msgpack is an optional dependency used for compact symbol serialization
+try:
+    import msgpack
 
-@dataclass
+    MSGPACK_AVAILABLE = True
+except ImportError:
+    msgpack = None
+    MSGPACK_AVAILABLE = False
+
+
+# Symbol types are a small closed set; interning them lets every Symbol
+# loaded from a map share one string object per type.
+_intern = sys.intern
+
+
+@dataclass(slots=True)
 class Symbol:
     """Represents a code symbol (class, function, method, etc.)."""
 
@@ -43,13 +63,177 @@ class Symbol:
         children = [cls.from_dict(c) for c in data.get("children", [])]
         return cls(
             name=data["name"],
-            type=data["type"],
+            type=_intern(data["type"]),
             lines=tuple(data["lines"]),
             signature=data.get("signature"),
             docstring=data.get("docstring"),
             children=children if children else [],
         )
 
+    def to_list(self) -> list:
+        """Convert symbol to a compact positional list for binary serialization."""
+        return [
+            self.name,
+            self.type,
+            self.lines[0],
+            self.lines[1],
+            self.signature,
+            self.docstring,
+            [c.to_list() for c in self.children] if self.children else [],
+        ]
+
+    @classmethod
+    def from_list(cls, data: list) -> "Symbol":
+        """Create a Symbol from the compact list produced by to_list()."""
+        name, type_, start, end, signature, docstring, children = data
+        return cls(
+            name=name,
+            type=_intern(type_),
+            lines=(start, end),
+            signature=signature,
+            docstring=docstring,
+            children=[cls.from_list(c) for c in children],
+        )
+
+
+def pack_symbols(symbols: list[Symbol]) -> bytes:
+    """Serialize a list of symbols to bytes.
+
+    Uses msgpack when installed, falling back to compact JSON. Both formats
+    avoid pickle, so cached data can be loaded without executing code.
+
+    Args:
+        symbols: Symbols to serialize.
+
+    Returns:
+        Serialized bytes suitable for unpack_symbols().
+    """
+    data = [s.to_list() for s in symbols]
+    if MSGPACK_AVAILABLE:
+        return msgpack.packb(data, use_bin_type=True)
+    return json.dumps(data, separators=(",", ":")).encode("utf-8")
+
+
+def unpack_symbols(data: bytes) -> list[Symbol]:
+    """Deserialize symbols produced by pack_symbols().
+
+    Args:
+        data: Bytes produced by pack_symbols().
+
+    Returns:
+        List of Symbol objects.
+    """
+    if MSGPACK_AVAILABLE:
+        raw = msgpack.unpackb(data, raw=False)
+    else:
+        raw = json.loads(data)
+    return [Symbol.from_list(item) for item in raw]
+
+
+class SymbolTable:
+    """Column-oriented view of a symbol tree.
+
+    Each field is stored in its own parallel array, one row per symbol.
+    Rows are laid out so that every symbol's children are contiguous:
+    the children of row ``i`` are rows ``child_offsets[i]`` up to
+    ``child_offsets[i + 1]``, and the top-level symbols are rows
+    ``0 .. top_level - 1``. Line numbers live in compact int arrays.
+    """
+
+    def __init__(self) -> None:
+        self.names: list[str] = []
+        self.types: list[str] = []
+        self.start_lines = array("i")
+        self.end_lines = array("i")
+        self.signatures: list[Optional[str]] = []
+        self.docstrings: list[Optional[str]] = []
+        self.child_offsets = array("i")
+        self.top_level = 0
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def _append(self, symbol: Symbol) -> None:
+        self.names.append(symbol.name)
+        self.types.append(symbol.type)
+        self.start_lines.append(symbol.lines[0])
+        self.end_lines.append(symbol.lines[1])
+        self.signatures.append(symbol.signature)
+        self.docstrings.append(symbol.docstring)
+
+    @classmethod
+    def from_symbols(cls, symbols: list[Symbol]) -> "SymbolTable":
+        """Build a table from a list of top-level symbols."""
+        table = cls()
+        pending = list(symbols)
+        for symbol in pending:
+            table._append(symbol)
+        table.top_level = len(pending)
+
+        # Breadth-first: each row's children are appended as one block
+        for symbol in pending:
+            table.child_offsets.append(len(table.names))
+            for child in symbol.children or ():
+                table._append(child)
+                pending.append(child)
+        table.child_offsets.append(len(table.names))
+        return table
+
+    def children(self, row: int) -> range:
+        """Return the row indices of a symbol's children."""
+        return range(self.child_offsets[row], self.child_offsets[row + 1])
+
+    def rows_of_type(self, symbol_type: str) -> list[int]:
+        """Return the rows whose symbol type matches."""
+        return [i for i, t in enumerate(self.types) if t == symbol_type]
+
+    def rows_at_line(self, line: int) -> list[int]:
+        """Return the rows whose line range contains the given line."""
+        return [
+            i
+            for i, (start, end) in enumerate(zip(self.start_lines, self.end_lines))
+            if start <= line <= end
+        ]
+
+    def symbol(self, row: int) -> Symbol:
+        """Materialize one row, including its children, as a Symbol."""
+        return Symbol(
+            name=self.names[row],
+            type=self.types[row],
+            lines=(self.start_lines[row], self.end_lines[row]),
+            signature=self.signatures[row],
+            docstring=self.docstrings[row],
+            children=[self.symbol(c) for c in self.children(row)],
+        )
+
+    def to_symbols(self) -> list[Symbol]:
+        """Convert the table back to a list of top-level symbols."""
+        return [self.symbol(row) for row in range(self.top_level)]
+
+
+# Parser instances owned by the current worker process, keyed by parser class.
+# Tree-sitter parsers are not picklable, so each worker builds its own once.
+_WORKER_PARSERS: dict[type, "Parser"] = {}
+
+
+def _init_worker(parser_cls: type["Parser"]) -> None:
+    """Process-pool initializer that builds the worker's parser instance."""
+    _WORKER_PARSERS[parser_cls] = parser_cls()
+
+
+def _worker_parser(parser_cls: type["Parser"]) -> "Parser":
+    """Return the worker's parser instance of a class, building it once."""
+    parser = _WORKER_PARSERS.get(parser_cls)
+    if parser is None:
+        parser = _WORKER_PARSERS[parser_cls] = parser_cls()
+    return parser
+
+
+def _parse_in_worker(parser_cls: type["Parser"], item: tuple[str, str]) -> list[Symbol]:
+    """Parse one (source, filepath) item with the worker's cached parser."""
+    source, filepath = item
+    return _worker_parser(parser_cls).parse(source, filepath)
+
 
 class Parser(ABC):
     """Abstract base class for language parsers."""
@@ -60,12 +244,16 @@ class Parser(ABC):
     # Language name
     language: str = ""
 
+    # Whether parse() takes raw UTF-8 bytes as well as str
+    accepts_bytes: bool = False
+
     @abstractmethod
-    def parse(self, source: str, filepath: str = "") -> list[Symbol]:
+    def parse(self, source: str | bytes, filepath: str = "") -> list[Symbol]:
         """Parse source code and extract symbols.
 
         Args:
-            source: The source code to parse.
+            source: The source code to parse. Bytes are only passed to
+                parsers that set accepts_bytes.
             filepath: Optional file path for error messages.
 
         Returns:
@@ -85,4 +273,46 @@ class Parser(ABC):
         Returns:
             True if this parser handles the file's extension.
         """
-        return any(filepath.endswith(ext) for ext in self.extensions)
+        return filepath.endswith(tuple(self.extensions))
+
+    def parse_table(self, source: str, filepath: str = "") -> SymbolTable:
+        """Parse source code into a column-oriented SymbolTable.
+
+        Args:
+            source: The source code to parse.
+            filepath: Optional file path for error messages.
+
+        Returns:
+            SymbolTable holding every symbol in the file.
+
+        Raises:
+            SyntaxError: If the source code has syntax errors.
+        """
+        return SymbolTable.from_symbols(self.parse(source, filepath))
+
+    @classmethod
+    def parse_batch(
+        cls, files: list[tuple[str, str]], max_workers: int | None = None
+    ) -> list[list[Symbol]]:
+        """Parse many files in parallel across CPU cores.
+
+        Args:
+            files: List of (source, filepath) tuples.
+            max_workers: Optional worker count. Defaults to os.cpu_count().
+
+        Returns:
+            List of symbol lists, in the same order as files.
+
+        Raises:
+            SyntaxError: If any source has syntax errors.
+        """
+        workers = max_workers or os.cpu_count() or 1
+        if workers == 1 or len(files) < 2:
+            parser = cls()
+            return [parser.parse(source, filepath) for source, filepath in files]
+
+        chunksize = max(1, len(files) // (4 * workers))
+        with ProcessPoolExecutor(
+            max_workers=workers, initializer=_init_worker, initargs=(cls,)
+        ) as executor:
+            return list(executor.map(partial(_parse_in_worker, cls), files, chunksize=chunksize))
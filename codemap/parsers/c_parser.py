@@ -69,7 +69,7 @@ class CParser(TreeSitterParser):
                 return None
         return source_bytes[current.start_byte:current.end_byte].decode("utf-8")
 
-    def _extract_symbol(self, node, source_bytes):
+    def _extract_symbol(self, node, source_bytes, parent_kind=None):
         """Override to handle C-specific node structures."""
         mapping = self.config.node_mappings.get(node.type)
         if not mapping:
@@ -166,4 +166,4 @@ class CParser(TreeSitterParser):
                 children=None,
             )
 
-        return super()._extract_symbol(node, source_bytes)
+        return super()._extract_symbol(node, source_bytes, parent_kind)
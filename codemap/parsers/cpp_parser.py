@@ -140,7 +140,7 @@ class CppParser(TreeSitterParser):
             children=None,
         )
 
-    def _extract_symbol(self, node, source_bytes):
+    def _extract_symbol(self, node, source_bytes, parent_kind=None):
         """Override to handle C++-specific node structures."""
         mapping = self.config.node_mappings.get(node.type)
         if not mapping:
@@ -262,4 +262,4 @@ class CppParser(TreeSitterParser):
                         )
             return None
 
-        return super()._extract_symbol(node, source_bytes)
+        return super()._extract_symbol(node, source_bytes, parent_kind)
@@ -5,22 +5,29 @@ from __future__ import annotations
 from typing import Optional
 
 from .base import Parser, Symbol
+from .treesitter_base import TreeCache, _get_language, reparse
 
 # Tree-sitter imports - optional dependency
 try:
-    from tree_sitter import Language, Parser as TSParser
-    import tree_sitter_css as ts_css
+    from tree_sitter import Parser as TSParser
+    import tree_sitter_css  # noqa: F401
 
     TREE_SITTER_AVAILABLE = True
 except ImportError:
     TREE_SITTER_AVAILABLE = False
 
 
+# Symbol type by a selector's leading character: ID, class, or a
+# pseudo-class on the root such as :root
+_SELECTOR_TYPES = {"#": "id", ".": "class", ":": "pseudo"}
+
+
 class CssParser(Parser):
     """Parser for CSS files - indexes selectors, keyframes, and media queries."""
 
     extensions = [".css"]
     language = "css"
+    accepts_bytes = True
 
     def __init__(self):
         if not TREE_SITTER_AVAILABLE:
@@ -28,20 +35,25 @@ class CssParser(Parser):
                 "tree-sitter and tree-sitter-css are required. "
                 "Install with: pip install tree-sitter tree-sitter-css"
             )
-        self._parser = TSParser(Language(ts_css.language()))
+        self._parser = TSParser(_get_language("css"))
+        self._tree_cache = TreeCache()
 
-    def parse(self, source: str, filepath: str = "") -> list[Symbol]:
+    def parse(self, source: str | bytes, filepath: str = "") -> list[Symbol]:
         """Parse CSS source and extract symbols.
 
         Args:
             source: The CSS source code
-            filepath: Optional path to the file being parsed
+            filepath: Optional path to the file being parsed; when given,
+                the file's previous tree is edited and reused
 
         Returns:
             List of Symbol objects representing CSS rules
         """
-        source_bytes = source.encode("utf-8")
-        tree = self._parser.parse(source_bytes)
+        source_bytes = source if isinstance(source, bytes) else source.encode("utf-8")
+        # Blank files have no symbols; isspace() stops at the first other byte
+        if not source_bytes or source_bytes.isspace():
+            return []
+        tree = reparse(self._parser, self._tree_cache, source_bytes, filepath)
         return self._extract_symbols(tree.root_node, source_bytes)
 
     def _extract_symbols(self, node, source_bytes: bytes) -> list[Symbol]:
@@ -182,23 +194,9 @@ class CssParser(Parser):
         return symbols
 
     def _get_selector_type(self, selector: str) -> str:
-        """Determine the type of CSS selector."""
-        selector = selector.strip()
-
-        # Check for ID selector
-        if selector.startswith("#"):
-            return "id"
-
-        # Check for class selector
-        if selector.startswith("."):
-            return "class"
-
-        # Check for pseudo-class on root
-        if selector.startswith(":"):
-            return "pseudo"
-
-        # Element selector or complex selector
-        return "selector"
+        """Determine the type of CSS selector from its first character."""
+        # Element and other selectors fall back to the generic type
+        return _SELECTOR_TYPES.get(selector.lstrip()[:1], "selector")
 
     def _get_selector_name(self, selector: str) -> str:
         """Get a clean name from a selector."""
@@ -4,12 +4,11 @@ from __future__ import annotations
 
 from typing import Optional
 
-from .treesitter_base import TreeSitterParser, LanguageConfig, NodeMapping
+from .treesitter_base import TreeSitterParser, LanguageConfig, NodeMapping, TreeCache
 from .base import Symbol
 
 # Tree-sitter imports - uses language-pack since standalone dart package unavailable
 try:
-    from tree_sitter import Parser as TSParser
     from tree_sitter_language_pack import get_language
     TREE_SITTER_AVAILABLE = True
 except ImportError:
@@ -82,7 +81,8 @@ class DartParser(TreeSitterParser):
                 "tree-sitter and tree-sitter-language-pack are required. "
                 "Install with: pip install tree-sitter tree-sitter-language-pack"
             )
-        self._parser = TSParser(get_language("dart"))
+        self._language = get_language("dart")
+        self._tree_cache = TreeCache()
 
     def _extract_symbols(self, node, source_bytes: bytes) -> list[Symbol]:
         """Extract symbols from AST node."""
@@ -5,11 +5,12 @@ from __future__ import annotations
 from typing import Optional
 
 from .base import Parser, Symbol
+from .treesitter_base import TreeCache, _get_language, reparse
 
 # Tree-sitter imports - optional dependency
 try:
-    from tree_sitter import Language, Parser as TSParser
-    import tree_sitter_html as ts_html
+    from tree_sitter import Parser as TSParser
+    import tree_sitter_html  # noqa: F401
 
     TREE_SITTER_AVAILABLE = True
 except ImportError:
@@ -34,6 +35,7 @@ class HtmlParser(Parser):
 
     extensions = [".html", ".htm"]
     language = "html"
+    accepts_bytes = True
 
     def __init__(self):
         if not TREE_SITTER_AVAILABLE:
@@ -41,54 +43,71 @@ class HtmlParser(Parser):
                 "tree-sitter and tree-sitter-html are required. "
                 "Install with: pip install tree-sitter tree-sitter-html"
             )
-        self._parser = TSParser(Language(ts_html.language()))
+        self._parser = TSParser(_get_language("html"))
+        self._tree_cache = TreeCache()
 
-    def parse(self, source: str, filepath: str = "") -> list[Symbol]:
+    def parse(self, source: str | bytes, filepath: str = "") -> list[Symbol]:
         """Parse HTML source and extract symbols.
 
         Args:
             source: The HTML source code
-            filepath: Optional path to the file being parsed
+            filepath: Optional path to the file being parsed; when given,
+                the file's previous tree is edited and reused
 
         Returns:
             List of Symbol objects representing HTML elements
         """
-        source_bytes = source.encode("utf-8")
-        tree = self._parser.parse(source_bytes)
+        source_bytes = source if isinstance(source, bytes) else source.encode("utf-8")
+        # Blank files have no symbols; isspace() stops at the first other byte
+        if not source_bytes or source_bytes.isspace():
+            return []
+        tree = reparse(self._parser, self._tree_cache, source_bytes, filepath)
         return self._extract_symbols(tree.root_node, source_bytes)
 
     def _extract_symbols(self, node, source_bytes: bytes) -> list[Symbol]:
-        """Extract symbols from AST node recursively."""
-        symbols = []
+        """Extract symbols from AST node.
 
-        for child in node.children:
-            if child.type == "element":
-                result = self._process_element(child, source_bytes)
-                symbols.extend(result)
-            elif child.type == "doctype":
-                # Skip doctype
-                continue
-            else:
-                # Recurse into other nodes
-                symbols.extend(self._extract_symbols(child, source_bytes))
+        Indexed elements become symbols holding the indexed elements nested
+        inside them; elements that aren't indexed are transparent, their
+        indexed descendants attaching to the nearest indexed ancestor. The
+        walk uses an explicit stack and visits every node once, so deep
+        markup neither recurses nor revisits subtrees.
+        """
+        symbols: list[Symbol] = []
+        created: list[Symbol] = []
+        # (node, list its symbols go into, still outside any element)
+        stack = [(node, symbols, True)]
+
+        while stack:
+            current, out, top_level = stack.pop()
+
+            if current.type == "element":
+                symbol = self._extract_element(current, source_bytes)
+                if symbol is not None:
+                    out.append(symbol)
+                    created.append(symbol)
+                    out = symbol.children
+                # Inside elements only nested elements can yield symbols
+                stack.extend(
+                    (child, out, False)
+                    for child in reversed(current.children)
+                    if child.type == "element"
+                )
+            elif top_level and current.type != "doctype":
+                stack.extend((child, out, True) for child in reversed(current.children))
+
+        for symbol in created:
+            if not symbol.children:
+                symbol.children = None
 
         return symbols
 
-    def _process_element(self, node, source_bytes: bytes) -> list[Symbol]:
-        """Process an element node and return symbols (either the element or its children)."""
-        symbol = self._extract_element(node, source_bytes)
-        if symbol:
-            return [symbol]
-
-        # Element not indexed, but check for indexed children
-        children = []
-        for child in node.children:
-            if child.type == "element":
-                children.extend(self._process_element(child, source_bytes))
-        return children
-
     def _extract_element(self, node, source_bytes: bytes) -> Optional[Symbol]:
-        """Extract a symbol from an HTML element."""
+        """Extract a symbol from an HTML element, without its children.
+
+        Returns None if the element isn't indexed. The returned symbol's
+        children list is empty for the caller to fill.
+        """
         # Find the start tag or self-closing tag
         start_tag = None
         for child in node.children:
@@ -114,57 +133,27 @@ class HtmlParser(Parser):
         element_id = attrs.get("id")
         element_class = attrs.get("class")
 
-        # Extract nested elements first
-        children = self._extract_nested_elements(node, source_bytes)
-
-        # Determine if this element should be indexed
-        should_index = False
-        symbol_type = "element"
-        name = tag_name
-
         if element_id:
             # Elements with IDs are always indexed
-            should_index = True
             symbol_type = "id"
             name = f"#{element_id}"
         elif tag_name.lower() in SEMANTIC_ELEMENTS:
             # Semantic elements are indexed
-            should_index = True
             symbol_type = "element"
             name = f"<{tag_name}>"
             if element_class:
                 name = f"<{tag_name}.{element_class.split()[0]}>"
+        else:
+            return None
 
-        if should_index:
-            return Symbol(
-                name=name,
-                type=symbol_type,
-                lines=(node.start_point[0] + 1, node.end_point[0] + 1),
-                signature=self._build_signature(tag_name, attrs),
-                docstring=None,
-                children=children if children else None,
-            )
-
-        # Even if not indexed, we might have indexed children
-        if children:
-            # Return children at this level if parent not indexed
-            return None  # Children will be collected by parent
-
-        return None
-
-    def _extract_nested_elements(self, node, source_bytes: bytes) -> list[Symbol]:
-        """Extract nested indexable elements."""
-        children = []
-        for child in node.children:
-            if child.type == "element":
-                # Check if this element should be indexed
-                symbol = self._extract_element(child, source_bytes)
-                if symbol:
-                    children.append(symbol)
-                else:
-                    # Recurse to find deeper indexed elements
-                    children.extend(self._extract_nested_elements(child, source_bytes))
-        return children
+        return Symbol(
+            name=name,
+            type=symbol_type,
+            lines=(node.start_point[0] + 1, node.end_point[0] + 1),
+            signature=self._build_signature(tag_name, attrs),
+            docstring=None,
+            children=[],
+        )
 
     def _get_attributes(self, start_tag, source_bytes: bytes) -> dict[str, str]:
         """Extract attributes from a start tag."""
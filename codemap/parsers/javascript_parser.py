@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import functools
 from typing import Optional
 
 from .base import Parser, Symbol
@@ -18,11 +19,30 @@ except ImportError:
     Node = None
 
 
+# Top-level node types that can yield a symbol; everything else (imports,
+# comments, control flow) is skipped before dispatch.
+_INTERESTING_TYPES = frozenset({
+    "class_declaration",
+    "function_declaration",
+    "lexical_declaration",
+    "variable_declaration",
+    "expression_statement",
+    "export_statement",
+})
+
+
+@functools.lru_cache(maxsize=None)
+def _get_js_language() -> "Language":
+    """Return the shared JavaScript Language, building it on first use."""
+    return Language(tsjs.language())
+
+
 class JavaScriptParser(Parser):
     """Parser for JavaScript files using tree-sitter."""
 
     extensions = [".js", ".jsx", ".mjs", ".cjs"]
     language = "javascript"
+    accepts_bytes = True
 
     def __init__(self):
         """Initialize the JavaScript parser."""
@@ -31,9 +51,9 @@ class JavaScriptParser(Parser):
                 "tree-sitter and tree-sitter-javascript are required. "
                 "Install with: pip install tree-sitter tree-sitter-javascript"
             )
-        self._parser = TSParser(Language(tsjs.language()))
+        self._parser = TSParser(_get_js_language())
 
-    def parse(self, source: str, filepath: str = "") -> list[Symbol]:
+    def parse(self, source: str | bytes, filepath: str = "") -> list[Symbol]:
         """Parse JavaScript source code and extract symbols.
 
         Args:
@@ -44,7 +64,7 @@ class JavaScriptParser(Parser):
             List of top-level Symbol objects.
         """
         # Convert to bytes for tree-sitter (it uses byte offsets)
-        source_bytes = source.encode("utf-8")
+        source_bytes = source if isinstance(source, bytes) else source.encode("utf-8")
         tree = self._parser.parse(source_bytes)
         return self._extract_symbols(tree.root_node, source_bytes)
 
@@ -61,6 +81,8 @@ class JavaScriptParser(Parser):
         symbols = []
 
         for child in node.children:
+            if child.type not in _INTERESTING_TYPES:
+                continue
             symbol = self._parse_node(child, source_bytes)
             if symbol:
                 symbols.append(symbol)
@@ -413,8 +435,9 @@ class JavaScriptParser(Parser):
             Comment text or None.
         """
         # Look for comment in preceding siblings
-        if node.prev_sibling and node.prev_sibling.type == "comment":
-            comment = self._get_node_text(node.prev_sibling, source_bytes)
+        prev = node.prev_sibling
+        if prev and prev.type == "comment":
+            comment = self._get_node_text(prev, source_bytes)
             # Clean up JSDoc comment
             if comment.startswith("/**"):
                 comment = comment[3:-2].strip()
@@ -46,9 +46,9 @@ class KotlinParser(TreeSitterParser):
     extensions = [".kt", ".kts"]
     language = "kotlin"
 
-    def _extract_symbol(self, node, source_bytes):
+    def _extract_symbol(self, node, source_bytes, parent_kind=None):
         """Override to handle interface detection."""
-        symbol = super()._extract_symbol(node, source_bytes)
+        symbol = super()._extract_symbol(node, source_bytes, parent_kind)
         if symbol and node.type == "class_declaration":
             # Check if it's an interface
             if is_kotlin_interface(node):
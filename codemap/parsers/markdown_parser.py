@@ -1,6 +1,7 @@
 """Markdown parser for indexing headers and sections."""
 
 import re
+from bisect import bisect_right
 from typing import Optional
 
 from .base import Parser, Symbol
@@ -22,8 +23,9 @@ class MarkdownParser(Parser):
         Returns:
             List of Symbol objects representing headers
         """
-        lines = source.split('\n')
-        total_lines = len(lines)
+        # Offsets of each line start; lines are sliced from source on demand
+        line_starts = self._line_starts(source)
+        total_lines = len(line_starts)
 
         # Find all headers with their positions
         headers: list[tuple[int, int, str, int]] = []  # (level, line_num, title, char_pos)
@@ -34,7 +36,7 @@ class MarkdownParser(Parser):
             level = len(hashes)  # 2 for ##, 3 for ###
 
             # Calculate line number from character position
-            line_num = source[:match.start()].count('\n') + 1
+            line_num = bisect_right(line_starts, match.start())
 
             headers.append((level, line_num, title, match.start()))
 
@@ -62,7 +64,9 @@ class MarkdownParser(Parser):
                 type=symbol_type,
                 lines=(start_line, end_line),
                 signature=None,
-                docstring=self._extract_first_paragraph(lines, start_line, end_line),
+                docstring=self._extract_first_paragraph(
+                    source, line_starts, start_line, end_line
+                ),
                 children=[],
             )
 
@@ -93,18 +97,32 @@ class MarkdownParser(Parser):
 
         return symbols
 
+    @staticmethod
+    def _line_starts(source: str) -> list[int]:
+        """Return the character offset at which each line of source begins."""
+        line_starts = [0]
+        append = line_starts.append
+        find = source.find
+        i = find('\n')
+        while i != -1:
+            append(i + 1)
+            i = find('\n', i + 1)
+        return line_starts
+
     def _extract_first_paragraph(
-        self, lines: list[str], start_line: int, end_line: int
+        self, source: str, line_starts: list[int], start_line: int, end_line: int
     ) -> Optional[str]:
         """Extract first non-empty paragraph after the header."""
         # Start from line after header
         content_lines = []
         in_paragraph = False
+        total_lines = len(line_starts)
 
         for i in range(start_line, min(end_line, start_line + 10)):
-            if i >= len(lines):
+            if i >= total_lines:
                 break
-            line = lines[i].strip()
+            line_end = line_starts[i + 1] - 1 if i + 1 < total_lines else len(source)
+            line = source[line_starts[i]:line_end].strip()
 
             # Skip the header line itself
             if i == start_line - 1:
@@ -119,7 +137,7 @@ class MarkdownParser(Parser):
                 break
 
             # Skip code blocks, lists, etc.
-            if line.startswith('```') or line.startswith('#'):
+            if line.startswith(('```', '#')):
                 break
 
             in_paragraph = True
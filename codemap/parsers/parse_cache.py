@@ -0,0 +1,222 @@
+"""Persistent cache of parsed symbols, stored in SQLite."""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Optional
+
+from .base import Symbol, pack_symbols, unpack_symbols
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS cache (
+    path TEXT PRIMARY KEY,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    content_hash TEXT NOT NULL,
+    symbols BLOB NOT NULL,
+    last_used REAL NOT NULL
+)
+"""
+
+_META_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+)
+"""
+
+# Row-count checks scan the table, so eviction only runs every so many writes
+_EVICT_EVERY = 256
+
+# Writes are committed in batches of this many; flush() commits the rest
+_COMMIT_EVERY = 64
+
+
+class ParseCache:
+    """Symbols of previously parsed files, reused across sessions.
+
+    Entries are keyed by path and validated against the file's size and
+    content hash, so an edited file is always re-parsed. When the caller
+    has not read the file yet, a matching mtime and size is enough to
+    skip reading it at all.
+
+    Symbols are stored with pack_symbols(), never pickle, so a cache file
+    cannot execute code when loaded.
+
+    The cache records the version string it was opened with; opening it
+    with a different one (after the parsers changed) empties it.
+
+    Hits are recorded in memory and new entries are committed in batches,
+    so reads never wait on a write transaction. Call flush() or close() to
+    persist what is still pending.
+    """
+
+    def __init__(self, db_path: str | Path, max_entries: int = 10000, version: str = ""):
+        """Open (or create) the cache database.
+
+        Args:
+            db_path: Path of the SQLite database file.
+            max_entries: Least recently used entries beyond this are evicted.
+            version: Version of the parsers whose output is cached. Entries
+                stored under any other version are dropped.
+        """
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._writes = 0
+        # last_used times of hits, written by flush() or before eviction
+        self._touched: dict[str, float] = {}
+        self._conn = sqlite3.connect(str(db_path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(_SCHEMA)
+        self._conn.execute(_META_SCHEMA)
+        row = self._conn.execute("SELECT value FROM meta WHERE key = 'version'").fetchone()
+        if row is None or row[0] != version:
+            self._conn.execute("DELETE FROM cache")
+            self._conn.execute(
+                "INSERT OR REPLACE INTO meta VALUES ('version', ?)", (version,)
+            )
+        self._conn.commit()
+
+    def get_or_parse(
+        self,
+        path: str,
+        source: str | bytes | None,
+        parse_fn: Callable[[], list[Symbol]],
+    ) -> list[Symbol]:
+        """Return cached symbols for a file, parsing and storing on a miss.
+
+        Args:
+            path: File path, used as the cache key.
+            source: The file's current content, or None to compare the
+                file's mtime and size and read it only if they changed.
+            parse_fn: Called with no arguments to parse the file on a miss.
+
+        Returns:
+            List of top-level Symbol objects.
+
+        Raises:
+            OSError: If source is None and the file can't be read.
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT mtime_ns, size, content_hash, symbols FROM cache WHERE path = ?",
+                (path,),
+            ).fetchone()
+
+        # Content from the caller (an unsaved buffer, say) may not be what is
+        # on disk, so only content read here is recorded against the mtime
+        mtime_ns = 0
+        if source is None:
+            stat = os.stat(path)
+            if row is not None and row[0] == stat.st_mtime_ns and row[1] == stat.st_size:
+                self._touch(path)
+                return unpack_symbols(row[3])
+            source = Path(path).read_bytes()
+            if len(source) == stat.st_size:
+                mtime_ns = stat.st_mtime_ns
+
+        content = source if isinstance(source, bytes) else source.encode("utf-8")
+        content_hash = hashlib.sha256(content).hexdigest()[:12]
+        if row is not None and row[1] == len(content) and row[2] == content_hash:
+            self._touch(path)
+            return unpack_symbols(row[3])
+
+        symbols = parse_fn()
+        self._store(path, mtime_ns, len(content), content_hash, symbols)
+        return symbols
+
+    def get(self, path: str, source: str | bytes) -> Optional[list[Symbol]]:
+        """Return cached symbols if they were parsed from exactly this content."""
+        content = source if isinstance(source, bytes) else source.encode("utf-8")
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT size, content_hash, symbols FROM cache WHERE path = ?", (path,)
+            ).fetchone()
+        if row is None or row[0] != len(content):
+            return None
+        if row[1] != hashlib.sha256(content).hexdigest()[:12]:
+            return None
+        self._touch(path)
+        return unpack_symbols(row[2])
+
+    def put(self, path: str, source: str | bytes, symbols: list[Symbol]) -> None:
+        """Store the symbols parsed from a file's content."""
+        content = source if isinstance(source, bytes) else source.encode("utf-8")
+        self._store(path, 0, len(content), hashlib.sha256(content).hexdigest()[:12], symbols)
+
+    def invalidate(self, path: str) -> None:
+        """Drop the entry for a path, if any."""
+        with self._lock:
+            self._touched.pop(path, None)
+            self._conn.execute("DELETE FROM cache WHERE path = ?", (path,))
+            self._conn.commit()
+
+    def flush(self) -> None:
+        """Record pending hits and commit pending writes."""
+        with self._lock:
+            self._flush_touched()
+            self._conn.commit()
+
+    def close(self) -> None:
+        """Flush pending changes and close the database connection."""
+        with self._lock:
+            self._flush_touched()
+            self._conn.commit()
+            self._conn.close()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM cache").fetchone()[0]
+
+    def _touch(self, path: str) -> None:
+        """Mark an entry as recently used."""
+        with self._lock:
+            self._touched[path] = time.time()
+
+    def _flush_touched(self) -> None:
+        """Write the recorded hit times. The caller holds the lock."""
+        if self._touched:
+            self._conn.executemany(
+                "UPDATE cache SET last_used = ? WHERE path = ?",
+                [(used, path) for path, used in self._touched.items()],
+            )
+            self._touched.clear()
+
+    def _store(
+        self,
+        path: str,
+        mtime_ns: int,
+        size: int,
+        content_hash: str,
+        symbols: list[Symbol],
+    ) -> None:
+        """Insert or replace an entry, evicting old entries periodically."""
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO cache VALUES (?, ?, ?, ?, ?, ?)",
+                (path, mtime_ns, size, content_hash, pack_symbols(symbols), time.time()),
+            )
+            self._touched.pop(path, None)
+            self._writes += 1
+            if self._writes % _EVICT_EVERY == 0:
+                self._flush_touched()
+                self._evict()
+            if self._writes % _COMMIT_EVERY == 0:
+                self._conn.commit()
+
+    def _evict(self) -> None:
+        """Delete the least recently used entries beyond max_entries."""
+        count = self._conn.execute("SELECT COUNT(*) FROM cache").fetchone()[0]
+        excess = count - self.max_entries
+        if excess > 0:
+            self._conn.execute(
+                "DELETE FROM cache WHERE path IN "
+                "(SELECT path FROM cache ORDER BY last_used LIMIT ?)",
+                (excess,),
+            )
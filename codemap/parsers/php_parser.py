@@ -2,7 +2,13 @@
 
 from __future__ import annotations
 
-from .treesitter_base import TreeSitterParser, LanguageConfig, NodeMapping
+import functools
+import importlib.util
+
+from .treesitter_base import TreeSitterParser, LanguageConfig, NodeMapping, TreeCache, TREE_SITTER_AVAILABLE
+
+# Probe for the grammar once instead of paying for a failed import per parser
+_PHP_AVAILABLE = TREE_SITTER_AVAILABLE and importlib.util.find_spec("tree_sitter_php") is not None
 
 
 PHP_CONFIG = LanguageConfig(
@@ -57,6 +63,15 @@ PHP_CONFIG = LanguageConfig(
 )
 
 
+@functools.lru_cache(maxsize=None)
+def _get_php_language():
+    """Return the shared php_only Language, building it on first use."""
+    from tree_sitter import Language
+    from tree_sitter_php import language_php
+
+    return Language(language_php())
+
+
 class PHPParser(TreeSitterParser):
     """Parser for PHP files using tree-sitter.
 
@@ -74,22 +89,12 @@ class PHPParser(TreeSitterParser):
 
     def __init__(self):
         """Initialize the PHP parser with the php_only grammar."""
-        from .base import Parser
-
-        try:
-            from tree_sitter import Language, Parser as TSParser
-        except ImportError:
+        if not _PHP_AVAILABLE:
             raise ImportError(
                 "tree-sitter and tree-sitter-php are required. "
                 "Install with: pip install tree-sitter tree-sitter-php"
             )
 
-        try:
-            # Use php_only grammar for pure PHP files (no HTML interpolation)
-            from tree_sitter_php import language_php
-            self._parser = TSParser(Language(language_php()))
-        except ImportError:
-            raise ImportError(
-                "tree-sitter-php is required. "
-                "Install with: pip install tree-sitter-php"
-            )
+        # Use php_only grammar for pure PHP files (no HTML interpolation)
+        self._language = _get_php_language()
+        self._tree_cache = TreeCache()
@@ -3,22 +3,122 @@
 from __future__ import annotations
 
 import ast
-from typing import Union
+import inspect
+import sys
+from functools import partial
+from typing import Optional, Union
 
 from .base import Parser, Symbol
 
+# Node types whose source form needs no parentheses when used as a prefix
+_ATOM_TYPES = (ast.Name, ast.Attribute, ast.Subscript)
+
+
+def _simple_expr(node: ast.expr) -> Optional[str]:
+    """Render the common annotation shapes without a full unparse.
+
+    Handles names, dotted attributes, subscripts, ``X | Y`` unions and
+    simple constants, producing the same text as ast.unparse().
+
+    Args:
+        node: AST expression node.
+
+    Returns:
+        Source text, or None if the node needs the general unparser.
+    """
+    node_type = type(node)
+    if node_type is ast.Name:
+        return node.id
+    if node_type is ast.Attribute:
+        if type(node.value) not in _ATOM_TYPES:
+            return None
+        value = _simple_expr(node.value)
+        return None if value is None else f"{value}.{node.attr}"
+    if node_type is ast.Subscript:
+        if type(node.value) not in _ATOM_TYPES:
+            return None
+        value = _simple_expr(node.value)
+        index = node.slice
+        if type(index) is ast.Tuple:
+            if len(index.elts) < 2:
+                return None
+            parts = [_simple_expr(e) for e in index.elts]
+            inner = None if None in parts else ", ".join(parts)
+        else:
+            inner = _simple_expr(index)
+        if value is None or inner is None:
+            return None
+        return f"{value}[{inner}]"
+    if node_type is ast.BinOp:
+        # Left-nested unions such as ``int | str | None``
+        if type(node.op) is not ast.BitOr or type(node.right) is ast.BinOp:
+            return None
+        if type(node.left) is ast.BinOp and type(node.left.op) is not ast.BitOr:
+            return None
+        left = _simple_expr(node.left)
+        right = _simple_expr(node.right)
+        if left is None or right is None:
+            return None
+        return f"{left} | {right}"
+    if node_type is ast.Constant:
+        value = node.value
+        if value is None or value is True or value is False or type(value) is int:
+            return repr(value)
+        if (
+            type(value) is str
+            and node.kind is None
+            and value.isprintable()
+            and "'" not in value
+            and '"' not in value
+            and "\\" not in value
+        ):
+            return repr(value)
+    return None
+
+
+def _fast_unparse(node: ast.expr) -> str:
+    """Unparse an expression, skipping ast.unparse() for common shapes."""
+    text = _simple_expr(node)
+    return text if text is not None else ast.unparse(node)
+
+
+def _fast_docstring(node: ast.AST) -> Optional[str]:
+    """Return a definition's cleaned docstring, like ast.get_docstring().
+
+    Checks exact node types instead of going through get_docstring's
+    isinstance tests, which include the deprecated ast.Str shim.
+    """
+    body = node.body
+    if not body or type(body[0]) is not ast.Expr:
+        return None
+    value = body[0].value
+    if type(value) is not ast.Constant or type(value.value) is not str:
+        return None
+    text = value.value
+    if "\n" not in text:
+        # One-line docstrings: cleandoc only expands tabs and strips the left
+        return text.expandtabs().lstrip()
+    return inspect.cleandoc(text)
+
+
+def _start_line_with_decorators(node: ast.stmt) -> int:
+    """Return the first line of a definition, including its decorators."""
+    return min([d.lineno for d in node.decorator_list], default=node.lineno)
+
 
 class PythonParser(Parser):
     """Parser for Python files using stdlib ast module."""
 
     extensions = [".py", ".pyi"]
     language = "python"
+    accepts_bytes = True
 
-    def parse(self, source: str, filepath: str = "") -> list[Symbol]:
+    def parse(self, source: str | bytes, filepath: str = "") -> list[Symbol]:
         """Parse Python source code and extract symbols.
 
         Args:
-            source: Python source code.
+            source: Python source code, as text or as bytes (in which case
+                ast honours any PEP 263 coding declaration).
             filepath: Optional file path for error messages.
 
         Returns:
@@ -41,13 +141,9 @@ class PythonParser(Parser):
         """
         symbols = []
         for node in nodes:
-            if isinstance(node, ast.ClassDef):
-                symbols.append(self._parse_class(node))
-            elif isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
-                symbol_type = (
-                    "async_function" if isinstance(node, ast.AsyncFunctionDef) else "function"
-                )
-                symbols.append(self._parse_function(node, symbol_type))
+            handler = _TOP_LEVEL_DISPATCH.get(type(node))
+            if handler is not None:
+                symbols.append(handler(self, node))
         return symbols
 
     def _parse_class(self, node: ast.ClassDef) -> Symbol:
@@ -61,25 +157,16 @@ class PythonParser(Parser):
         """
         children = []
         for item in node.body:
-            if isinstance(item, (ast.FunctionDef, ast.AsyncFunctionDef)):
-                method_type = (
-                    "async_method" if isinstance(item, ast.AsyncFunctionDef) else "method"
-                )
-                children.append(self._parse_function(item, method_type))
-            elif isinstance(item, ast.ClassDef):
-                # Handle nested classes
-                children.append(self._parse_class(item))
-
-        # Include decorators in line range
-        start_line = node.lineno
-        if node.decorator_list:
-            start_line = min(d.lineno for d in node.decorator_list)
+            # Methods and nested classes
+            handler = _CLASS_BODY_DISPATCH.get(type(item))
+            if handler is not None:
+                children.append(handler(self, item))
 
         return Symbol(
             name=node.name,
             type="class",
-            lines=(start_line, node.end_lineno or node.lineno),
-            docstring=ast.get_docstring(node),
+            lines=(_start_line_with_decorators(node), node.end_lineno or node.lineno),
+            docstring=_fast_docstring(node),
             children=children,
         )
 
@@ -95,17 +182,14 @@ class PythonParser(Parser):
         Returns:
             Symbol representing the function/method.
         """
-        # Include decorators in line range
-        start_line = node.lineno
-        if node.decorator_list:
-            start_line = min(d.lineno for d in node.decorator_list)
-
         return Symbol(
             name=node.name,
             type=symbol_type,
-            lines=(start_line, node.end_lineno or node.lineno),
-            signature=self._get_signature(node),
-            docstring=ast.get_docstring(node),
+            lines=(_start_line_with_decorators(node), node.end_lineno or node.lineno),
+            # Most signatures repeat across a codebase ("(self)", "(self, other)");
+            # interning lets every symbol share one string per distinct signature
+            signature=sys.intern(self._get_signature(node)),
+            docstring=_fast_docstring(node),
         )
 
     def _get_signature(self, node: Union[ast.FunctionDef, ast.AsyncFunctionDef]) -> str:
@@ -117,6 +201,18 @@ class PythonParser(Parser):
         Returns:
             String representation of the function signature.
         """
+        arguments = node.args
+        if not (
+            arguments.posonlyargs
+            or arguments.vararg
+            or arguments.kwonlyargs
+            or arguments.kwarg
+            or arguments.defaults
+        ):
+            # Most functions only take plain positional parameters
+            params = ", ".join([self._format_arg(arg) for arg in arguments.args])
+            return f"({params}){self._format_returns(node)}"
+
         args = []
 
         # Handle positional-only args (Python 3.8+)
@@ -125,16 +221,13 @@ class PythonParser(Parser):
         if node.args.posonlyargs:
             args.append("/")
 
-        # Regular positional args
-        num_defaults = len(node.args.defaults)
-        num_args = len(node.args.args)
+        # Regular positional args; defaults line up with the tail of the list
+        defaults = node.args.defaults
+        first_default = len(node.args.args) - len(defaults)
         for i, arg in enumerate(node.args.args):
             arg_str = self._format_arg(arg)
-            # Check if this arg has a default value
-            default_idx = i - (num_args - num_defaults)
-            if default_idx >= 0:
-                default = node.args.defaults[default_idx]
-                arg_str += f"={self._format_default(default)}"
+            if i >= first_default:
+                arg_str += f"={self._format_default(defaults[i - first_default])}"
             args.append(arg_str)
 
         # *args
@@ -154,16 +247,23 @@ class PythonParser(Parser):
         if node.args.kwarg:
             args.append(f"**{self._format_arg(node.args.kwarg)}")
 
-        sig = f"({', '.join(args)})"
+        return f"({', '.join(args)}){self._format_returns(node)}"
+
+    def _format_returns(self, node: Union[ast.FunctionDef, ast.AsyncFunctionDef]) -> str:
+        """Format a function's return annotation.
+
+        Args:
+            node: AST function node.
 
-        # Return type
+        Returns:
+            " -> <annotation>", or an empty string if there is none.
+        """
         if node.returns:
             try:
-                sig += f" -> {ast.unparse(node.returns)}"
+                return f" -> {_fast_unparse(node.returns)}"
             except Exception:
                 pass
-
-        return sig
+        return ""
 
     def _format_arg(self, arg: ast.arg) -> str:
         """Format a function argument.
@@ -176,7 +276,7 @@ class PythonParser(Parser):
         """
         if arg.annotation:
             try:
-                return f"{arg.arg}: {ast.unparse(arg.annotation)}"
+                return f"{arg.arg}: {_fast_unparse(arg.annotation)}"
             except Exception:
                 return arg.arg
         return arg.arg
@@ -191,10 +291,24 @@ class PythonParser(Parser):
             String representation of the default value.
         """
         try:
-            result = ast.unparse(node)
+            result = _fast_unparse(node)
             # Truncate very long defaults
             if len(result) > 20:
                 return "..."
             return result
         except Exception:
             return "..."
+
+
+# AST node type -> handler, keyed on the exact type (AST classes are leaves,
+# so this matches isinstance without walking the MRO)
+_TOP_LEVEL_DISPATCH = {
+    ast.ClassDef: PythonParser._parse_class,
+    ast.FunctionDef: partial(PythonParser._parse_function, symbol_type="function"),
+    ast.AsyncFunctionDef: partial(PythonParser._parse_function, symbol_type="async_function"),
+}
+_CLASS_BODY_DISPATCH = {
+    ast.ClassDef: PythonParser._parse_class,
+    ast.FunctionDef: partial(PythonParser._parse_function, symbol_type="method"),
+    ast.AsyncFunctionDef: partial(PythonParser._parse_function, symbol_type="async_method"),
+}
@@ -113,24 +113,32 @@ class SQLParser(TreeSitterParser):
         """
         symbols = []
 
+        mappings = self.config.node_mappings
         for child in node.children:
+            child_type = child.type
             # Handle direct mappings (e.g., create_table)
-            if child.type in self.config.node_mappings:
+            if child_type in mappings:
                 symbol = self._extract_symbol(child, source_bytes)
                 if symbol:
                     symbols.append(symbol)
             # Handle statement wrappers (SQL-specific)
-            elif child.type == "statement":
+            elif child_type == "statement":
                 # Extract from inside statement wrapper
                 for stmt_child in child.children:
-                    if stmt_child.type in self.config.node_mappings:
+                    if stmt_child.type in mappings:
                         symbol = self._extract_symbol(stmt_child, source_bytes)
                         if symbol:
                             symbols.append(symbol)
 
         return symbols
 
-    def _extract_name(self, node: "Node", mapping: NodeMapping, source_bytes: bytes) -> str:
+    def _extract_name(
+        self,
+        node: "Node",
+        mapping: NodeMapping,
+        source_bytes: bytes,
+        index: dict[str, "Node"] | None = None,
+    ) -> str:
         """Extract symbol name from node.
 
         Override to handle SQL's object_reference -> identifier pattern.
@@ -140,7 +148,7 @@ class SQLParser(TreeSitterParser):
             name_children = [name_children]
 
         for child_type in name_children:
-            name_node = self._find_child(node, child_type)
+            name_node = self._find_child(node, child_type, index)
             if name_node:
                 # If this is an object_reference, get the identifier inside it
                 if name_node.type == "object_reference":
@@ -151,7 +159,9 @@ class SQLParser(TreeSitterParser):
 
         return "<anonymous>"
 
-    def _extract_children(self, body_node: "Node", source_bytes: bytes) -> list[Symbol]:
+    def _extract_children(
+        self, body_node: "Node", source_bytes: bytes, parent_kind: Optional[str] = None
+    ) -> list[Symbol]:
         """Extract child symbols from a body node.
 
         Override to handle column_definitions structure where columns
@@ -165,7 +175,13 @@ class SQLParser(TreeSitterParser):
                     children.append(symbol)
         return children
 
-    def _extract_signature(self, node: "Node", mapping: NodeMapping, source_bytes: bytes) -> Optional[str]:
+    def _extract_signature(
+        self,
+        node: "Node",
+        mapping: NodeMapping,
+        source_bytes: bytes,
+        index: dict[str, "Node"] | None = None,
+    ) -> Optional[str]:
         """Extract function signature.
 
         Override to extract parameter types from function_arguments.
@@ -173,27 +189,20 @@ class SQLParser(TreeSitterParser):
         if not mapping.signature_child:
             return None
 
-        sig_node = self._find_child(node, mapping.signature_child)
+        sig_node = self._find_child(node, mapping.signature_child, index)
         if sig_node:
             sig_text = self._get_node_text(sig_node, source_bytes)
 
-            # Try to get return type
-            returns_node = self._find_child(node, "keyword_returns")
-            if returns_node:
-                # Find the type node after RETURNS keyword
-                found_returns = False
-                for child in node.children:
-                    if found_returns and child.type not in ("keyword_returns",):
-                        # This should be the return type
-                        if child.type == "int":
-                            sig_text += " -> INT"
-                        elif child.type in ("varchar", "char", "text"):
-                            sig_text += f" -> {self._get_node_text(child, source_bytes).upper()}"
-                        elif child.type == "identifier":
-                            sig_text += f" -> {self._get_node_text(child, source_bytes)}"
-                        break
-                    if child.type == "keyword_returns":
-                        found_returns = True
+            # The return type is the node right after the RETURNS keyword
+            returns_node = self._find_child(node, "keyword_returns", index)
+            return_type = returns_node.next_sibling if returns_node else None
+            if return_type is not None:
+                if return_type.type == "int":
+                    sig_text += " -> INT"
+                elif return_type.type in ("varchar", "char", "text"):
+                    sig_text += f" -> {self._get_node_text(return_type, source_bytes).upper()}"
+                elif return_type.type == "identifier":
+                    sig_text += f" -> {self._get_node_text(return_type, source_bytes)}"
 
             return sig_text if sig_text != "()" else None
         return None
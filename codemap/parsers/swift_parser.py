@@ -5,16 +5,14 @@ from __future__ import annotations
 from .treesitter_base import TreeSitterParser, LanguageConfig, NodeMapping
 
 
-def get_swift_class_type(node) -> str:
-    """Determine if a class_declaration is a class, struct, or enum."""
-    for child in node.children:
-        if child.type == "enum":
-            return "enum"
-        if child.type == "struct":
-            return "class"  # Treat structs as classes
-        if child.type == "class":
-            return "class"
-    return "class"
+def get_swift_class_type(node, index: dict | None = None) -> str:
+    """Determine if a class_declaration is a class, struct, or enum.
+
+    Structs are treated as classes, so only the enum keyword matters.
+    """
+    if index is None:
+        index = TreeSitterParser._child_index(node)
+    return "enum" if "enum" in index else "class"
 
 
 SWIFT_CONFIG = LanguageConfig(
@@ -53,19 +51,15 @@ class SwiftParser(TreeSitterParser):
     extensions = [".swift"]
     language = "swift"
 
-    def _extract_symbol(self, node, source_bytes):
+    def _extract_symbol(self, node, source_bytes, parent_kind=None):
         """Override to handle enum detection and body type variations."""
         # Handle class_declaration which can be struct, class, or enum
         if node.type == "class_declaration":
-            symbol_type = get_swift_class_type(node)
-
-            # Find the name
-            name = ""
-            for child in node.children:
-                if child.type == "type_identifier":
-                    name = source_bytes[child.start_byte:child.end_byte].decode("utf-8")
-                    break
+            # One pass over the children drives kind, name and body lookups
+            index = self._child_index(node)
+            symbol_type = get_swift_class_type(node, index)
 
+            name = self._get_node_text(index.get("type_identifier"), source_bytes)
             if not name:
                 return None
 
@@ -74,10 +68,9 @@ class SwiftParser(TreeSitterParser):
 
             # Find children from body
             children = []
-            for child in node.children:
-                if child.type in ["class_body", "enum_class_body"]:
-                    children = self._extract_children(child, source_bytes)
-                    break
+            body = index.get("class_body") or index.get("enum_class_body")
+            if body is not None:
+                children = self._extract_children(body, source_bytes, symbol_type)
 
             from .base import Symbol
             return Symbol(
@@ -89,4 +82,4 @@ class SwiftParser(TreeSitterParser):
                 children=children if children else None,
             )
 
-        return super()._extract_symbol(node, source_bytes)
+        return super()._extract_symbol(node, source_bytes, parent_kind)
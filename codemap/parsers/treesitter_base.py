@@ -2,20 +2,339 @@
 
 from __future__ import annotations
 
+import contextvars
+import functools
+import importlib
+import queue
+import threading
 from abc import abstractmethod
+from collections import OrderedDict
+from contextlib import contextmanager
 from dataclasses import dataclass, field
-from typing import Optional, Callable
+from typing import Iterator, Optional, Callable
 
 from .base import Parser, Symbol
 
 # Tree-sitter imports - optional dependency
 try:
-    from tree_sitter import Language, Parser as TSParser, Node
+    from tree_sitter import Language, Parser as TSParser, Node, Tree
     TREE_SITTER_AVAILABLE = True
 except ImportError:
     TREE_SITTER_AVAILABLE = False
     TSParser = None
     Node = None
+    Tree = None
+
+
+@functools.lru_cache(maxsize=None)
+def _get_language(grammar_module: str) -> "Language":
+    """Return the shared Language for a grammar module, loading it on first use."""
+    grammar = importlib.import_module(f"tree_sitter_{grammar_module}")
+    return Language(grammar.language())
+
+
+# Idle tree-sitter parsers per grammar. A TSParser must not be used by two
+# threads at once, so parse() borrows one from the pool and returns it after.
+_PARSER_POOL: dict[str, queue.SimpleQueue] = {}
+_POOL_LOCK = threading.Lock()
+
+
+def _acquire_parser(key: str, language: "Language") -> "TSParser":
+    """Borrow an idle parser for a grammar, creating one if none is free."""
+    with _POOL_LOCK:
+        pool = _PARSER_POOL.get(key)
+        if pool is None:
+            pool = _PARSER_POOL[key] = queue.SimpleQueue()
+    try:
+        return pool.get_nowait()
+    except queue.Empty:
+        return TSParser(language)
+
+
+def _release_parser(key: str, parser: "TSParser") -> None:
+    """Return a borrowed parser to its grammar's pool."""
+    _PARSER_POOL[key].put(parser)
+
+
+def _point_at(source_bytes: bytes, offset: int) -> tuple[int, int]:
+    """Return the (row, byte column) tree-sitter point for a byte offset."""
+    row = source_bytes.count(b"\n", 0, offset)
+    column = offset - (source_bytes.rfind(b"\n", 0, offset) + 1)
+    return (row, column)
+
+
+def compute_input_edit(old_bytes: bytes, new_bytes: bytes) -> dict | None:
+    """Describe the change between two sources as tree-sitter edit arguments.
+
+    The edit spans from the end of the common prefix to the start of the
+    common suffix. Prefix and suffix lengths are found by binary search over
+    slice comparisons so the scanning happens in C.
+
+    Args:
+        old_bytes: Previously parsed source.
+        new_bytes: New source.
+
+    Returns:
+        Keyword arguments for Tree.edit(), or None if the sources are equal.
+    """
+    if old_bytes == new_bytes:
+        return None
+
+    limit = min(len(old_bytes), len(new_bytes))
+    lo, hi = 0, limit
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if old_bytes[:mid] == new_bytes[:mid]:
+            lo = mid
+        else:
+            hi = mid - 1
+    prefix = lo
+
+    lo, hi = 0, limit - prefix
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if old_bytes[len(old_bytes) - mid:] == new_bytes[len(new_bytes) - mid:]:
+            lo = mid
+        else:
+            hi = mid - 1
+    suffix = lo
+
+    old_end = len(old_bytes) - suffix
+    new_end = len(new_bytes) - suffix
+    return {
+        "start_byte": prefix,
+        "old_end_byte": old_end,
+        "new_end_byte": new_end,
+        "start_point": _point_at(old_bytes, prefix),
+        "old_end_point": _point_at(old_bytes, old_end),
+        "new_end_point": _point_at(new_bytes, new_end),
+    }
+
+
+# Cleared by skip_tree_cache() while files are parsed only once
+_KEEP_TREES: contextvars.ContextVar[bool] = contextvars.ContextVar("_KEEP_TREES", default=True)
+
+
+@contextmanager
+def skip_tree_cache() -> Iterator[None]:
+    """Don't keep trees for files parsed inside this block.
+
+    A bulk index parses every file once, so trees kept for incremental
+    reparsing would only hold memory. Entries for those files are dropped.
+    """
+    token = _KEEP_TREES.set(False)
+    try:
+        yield
+    finally:
+        _KEEP_TREES.reset(token)
+
+
+class TreeCache:
+    """Bounded LRU cache of the last parsed (source_bytes, tree) per file."""
+
+    def __init__(self, capacity: int = 256):
+        self.capacity = capacity
+        self._entries: OrderedDict[str, tuple[bytes, object]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def take(self, filepath: str) -> tuple[bytes, object] | None:
+        """Remove and return the cached entry so the caller owns the tree."""
+        with self._lock:
+            return self._entries.pop(filepath, None)
+
+    def put(self, filepath: str, source_bytes: bytes, tree: object) -> None:
+        """Store the latest tree for a file, evicting the oldest if full."""
+        if not _KEEP_TREES.get():
+            return
+        with self._lock:
+            self._entries[filepath] = (source_bytes, tree)
+            self._entries.move_to_end(filepath)
+            while len(self._entries) > self.capacity:
+                self._entries.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+def reparse(
+    parser: "TSParser", tree_cache: TreeCache, source_bytes: bytes, filepath: str
+) -> "Tree":
+    """Parse source, editing and reusing the cached tree for filepath if any.
+
+    For parsers that keep their own TSParser rather than using the pool.
+    """
+    if not filepath:
+        return parser.parse(source_bytes)
+
+    cached = tree_cache.take(filepath)
+    if cached is None:
+        tree = parser.parse(source_bytes)
+    else:
+        old_bytes, old_tree = cached
+        edit = compute_input_edit(old_bytes, source_bytes)
+        if edit is not None:
+            old_tree.edit(**edit)
+        tree = parser.parse(source_bytes, old_tree)
+    tree_cache.put(filepath, source_bytes, tree)
+    return tree
+
+
+# Docstrings are capped at this many characters; a UTF-8 character is at
+# most four bytes, so that many bytes of kept text always covers the cap.
+_DOC_MAX_CHARS = 150
+_DOC_MAX_BYTES = 4 * _DOC_MAX_CHARS
+
+
+def _decode_capped(text: bytes) -> str:
+    """Decode at most the bytes needed for the docstring cap."""
+    if len(text) > _DOC_MAX_BYTES:
+        # Back up to a character boundary so the slice stays valid UTF-8
+        end = _DOC_MAX_BYTES
+        while text[end] & 0xC0 == 0x80:
+            end -= 1
+        text = text[:end]
+    return text.decode("utf-8")[:_DOC_MAX_CHARS]
+
+
+def _clean_jsdoc(comment: bytes) -> Optional[str]:
+    """Clean a /** ... */ block, dropping '*' gutters and @tag lines.
+
+    Stops scanning once enough text is kept to fill the docstring cap, so
+    long license headers cost the same as short comments.
+    """
+    lines = []
+    size = 0
+    for line in comment[3:-2].strip().split(b"\n"):
+        line = line.strip().lstrip(b"*").strip()
+        if line and not line.startswith(b"@"):
+            lines.append(line)
+            size += len(line) + 1
+            if size > _DOC_MAX_BYTES:
+                break
+    return _decode_capped(b" ".join(lines)) if lines else None
+
+
+def _clean_triple_slash(comment: bytes) -> str:
+    """Clean a /// doc comment (C#, Rust, Swift)."""
+    return _decode_capped(comment[3:].strip())
+
+
+def _clean_line(comment: bytes) -> str:
+    """Clean a // line comment."""
+    return _decode_capped(comment[2:].strip())
+
+
+def _clean_hash(comment: bytes) -> str:
+    """Clean a # line comment."""
+    return _decode_capped(comment[1:].strip())
+
+
+# Comment marker -> cleaner, probed longest prefix first by _clean_comment
+_PREFIX_TABLE: dict[bytes, Callable[[bytes], Optional[str]]] = {
+    b"/**": _clean_jsdoc,
+    b"///": _clean_triple_slash,
+    b"//": _clean_line,
+    b"#": _clean_hash,
+}
+
+# Functions declared inside a mapped body are members of the enclosing symbol
+_MEMBER_TYPES = {"function": "method", "async_function": "async_method"}
+
+# Set by TreeSitterParser.parse_lazy() while it extracts symbols
+_DEFER_DETAILS: contextvars.ContextVar[bool] = contextvars.ContextVar(
+    "_DEFER_DETAILS", default=False
+)
+
+# Slot descriptors backing Symbol's signature and docstring fields
+_SIGNATURE_SLOT = Symbol.__dict__["signature"]
+_DOCSTRING_SLOT = Symbol.__dict__["docstring"]
+
+
+class LazySymbol(Symbol):
+    """Symbol whose signature and docstring are extracted on first access.
+
+    Keeps a reference to its tree-sitter node until both details have been
+    read. Use materialize() for an eager, picklable Symbol.
+    """
+
+    __slots__ = ("_parser", "_node", "_mapping", "_source_bytes")
+
+    def __init__(
+        self,
+        name: str,
+        type: str,
+        lines: tuple[int, int],
+        children: Optional[list[Symbol]],
+        parser: "TreeSitterParser",
+        node: "Node",
+        mapping: "NodeMapping",
+        source_bytes: bytes,
+    ):
+        self.name = name
+        self.type = type
+        self.lines = lines
+        self.children = children
+        self._parser = parser
+        self._node = node
+        self._mapping = mapping
+        self._source_bytes = source_bytes
+
+    def _release_node(self) -> None:
+        """Drop the node reference once nothing is left to extract."""
+        try:
+            _SIGNATURE_SLOT.__get__(self)
+            _DOCSTRING_SLOT.__get__(self)
+        except AttributeError:
+            return
+        self._parser = self._node = self._mapping = self._source_bytes = None
+
+    @property
+    def signature(self) -> Optional[str]:
+        try:
+            return _SIGNATURE_SLOT.__get__(self)
+        except AttributeError:
+            value = None
+            if self._mapping.signature_child:
+                value = self._parser._extract_signature(
+                    self._node, self._mapping, self._source_bytes
+                )
+            _SIGNATURE_SLOT.__set__(self, value)
+            self._release_node()
+            return value
+
+    @signature.setter
+    def signature(self, value: Optional[str]) -> None:
+        _SIGNATURE_SLOT.__set__(self, value)
+
+    @property
+    def docstring(self) -> Optional[str]:
+        try:
+            return _DOCSTRING_SLOT.__get__(self)
+        except AttributeError:
+            value = self._parser._extract_docstring(self._node, self._source_bytes)
+            _DOCSTRING_SLOT.__set__(self, value)
+            self._release_node()
+            return value
+
+    @docstring.setter
+    def docstring(self, value: Optional[str]) -> None:
+        _DOCSTRING_SLOT.__set__(self, value)
+
+    def materialize(self) -> Symbol:
+        """Return an eager Symbol copy with every detail extracted."""
+        children = self.children
+        return Symbol(
+            name=self.name,
+            type=self.type,
+            lines=self.lines,
+            signature=self.signature,
+            docstring=self.docstring,
+            children=[
+                c.materialize() if isinstance(c, LazySymbol) else c for c in children
+            ]
+            if children
+            else None,
+        )
 
 
 @dataclass
@@ -50,11 +369,18 @@ class LanguageConfig:
     # JSDoc-style comment prefix (e.g., "/**" for JS, "///" for C#)
     doc_comment_prefix: str | None = None
 
+    # Every node type the top-level walk acts on (mapped or wrapper)
+    symbol_node_types: frozenset[str] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self.symbol_node_types = frozenset(self.node_mappings) | frozenset(self.export_wrappers)
+
 
 class TreeSitterParser(Parser):
     """Base parser using tree-sitter with configuration-driven extraction."""
 
     config: LanguageConfig  # Subclasses must define this
+    accepts_bytes = True
 
     def __init__(self):
         if not TREE_SITTER_AVAILABLE:
@@ -63,10 +389,8 @@ class TreeSitterParser(Parser):
                 f"Install with: pip install tree-sitter tree-sitter-{self.config.name}"
             )
 
-        # Dynamically import the grammar module
-        import importlib
-        grammar = importlib.import_module(f"tree_sitter_{self.config.grammar_module}")
-        self._parser = TSParser(Language(grammar.language()))
+        self._language = _get_language(self.config.grammar_module)
+        self._tree_cache = TreeCache()
 
     @property
     def extensions(self) -> list[str]:
@@ -76,37 +400,107 @@ class TreeSitterParser(Parser):
     def language(self) -> str:
         return self.config.name
 
-    def parse(self, source: str, filepath: str = "") -> list[Symbol]:
-        """Parse source code and extract symbols."""
-        source_bytes = source.encode("utf-8")
-        tree = self._parser.parse(source_bytes)
+    def parse(self, source: str | bytes, filepath: str = "") -> list[Symbol]:
+        """Parse source code and extract symbols.
+
+        When filepath is given, the previous tree for that file is reused so
+        tree-sitter only re-parses the edited region.
+        """
+        tree, source_bytes = self._parse_tree(source, filepath)
         return self._extract_symbols(tree.root_node, source_bytes)
 
+    def parse_lazy(self, source: str | bytes, filepath: str = "") -> list[Symbol]:
+        """Parse source code, deferring signature and docstring extraction.
+
+        Symbols built from the node mappings are LazySymbol instances whose
+        details are only extracted when read, which suits outline-only
+        consumers. Symbols from language-specific overrides stay eager.
+        """
+        tree, source_bytes = self._parse_tree(source, filepath, keep_tree=True)
+        token = _DEFER_DETAILS.set(True)
+        try:
+            return self._extract_symbols(tree.root_node, source_bytes)
+        finally:
+            _DEFER_DETAILS.reset(token)
+
+    def _parse_tree(
+        self, source: str | bytes, filepath: str = "", keep_tree: bool = False
+    ) -> tuple["Tree", bytes]:
+        """Parse source into a tree, reusing the cached tree for filepath.
+
+        With keep_tree, the cache receives a copy so that a later incremental
+        edit cannot shift nodes the caller still holds.
+        """
+        source_bytes = source if isinstance(source, bytes) else source.encode("utf-8")
+        old_tree = None
+        if filepath:
+            cached = self._tree_cache.take(filepath)
+            if cached is not None:
+                old_bytes, old_tree = cached
+                edit = compute_input_edit(old_bytes, source_bytes)
+                if edit is not None:
+                    old_tree.edit(**edit)
+
+        key = self.config.grammar_module
+        parser = _acquire_parser(key, self._language)
+        try:
+            if old_tree is not None:
+                tree = parser.parse(source_bytes, old_tree)
+            else:
+                tree = parser.parse(source_bytes)
+        finally:
+            _release_parser(key, parser)
+
+        if filepath:
+            self._tree_cache.put(filepath, source_bytes, tree.copy() if keep_tree else tree)
+        return tree, source_bytes
+
     def _extract_symbols(self, node: "Node", source_bytes: bytes) -> list[Symbol]:
         """Extract symbols from AST node."""
         symbols = []
 
+        # node.children is built natively in one call and cached on the node;
+        # stepping a TreeCursor from Python costs one round-trip per sibling
+        # and measured about 3x slower, so sibling loops iterate children.
+        mappings = self.config.node_mappings
+        symbol_node_types = self.config.symbol_node_types
         for child in node.children:
-            # Check if this is a mapped node type
-            if child.type in self.config.node_mappings:
+            child_type = child.type
+            # One set probe rejects the common case of an unmapped node
+            if child_type not in symbol_node_types:
+                continue
+
+            if child_type in mappings:
                 symbol = self._extract_symbol(child, source_bytes)
                 if symbol:
                     symbols.append(symbol)
-
-            # Check for export wrappers
-            elif child.type in self.config.export_wrappers:
+            else:
+                # Export wrappers
                 symbols.extend(self._extract_from_wrapper(child, source_bytes))
 
         return symbols
 
-    def _extract_symbol(self, node: "Node", source_bytes: bytes) -> Optional[Symbol]:
-        """Extract a symbol from a node using the mapping configuration."""
+    def _extract_symbol(
+        self, node: "Node", source_bytes: bytes, parent_kind: Optional[str] = None
+    ) -> Optional[Symbol]:
+        """Extract a symbol from a node using the mapping configuration.
+
+        Args:
+            node: The mapped node.
+            source_bytes: Source code as bytes.
+            parent_kind: Symbol type of the enclosing symbol when the node
+                sits inside a mapped body. Functions found there are emitted
+                as methods.
+        """
         mapping = self.config.node_mappings.get(node.type)
         if not mapping:
             return None
 
+        # Index the children once; name, signature and body lookups share it
+        index = self._child_index(node)
+
         # Extract name
-        name = self._extract_name(node, mapping, source_bytes)
+        name = self._extract_name(node, mapping, source_bytes, index)
         if not name:
             return None
 
@@ -114,54 +508,78 @@ class TreeSitterParser(Parser):
         symbol_type = mapping.symbol_type
         if mapping.is_async_check and mapping.is_async_check(node):
             symbol_type = f"async_{symbol_type}"
+        if parent_kind is not None:
+            symbol_type = _MEMBER_TYPES.get(symbol_type, symbol_type)
+
+        # Extract children
+        children = []
+        if mapping.body_child:
+            body = self._find_child(node, mapping.body_child, index)
+            if body:
+                children = self._extract_children(body, source_bytes, symbol_type)
+
+        lines = (node.start_point[0] + 1, node.end_point[0] + 1)
+        if _DEFER_DETAILS.get():
+            return LazySymbol(
+                name, symbol_type, lines, children or None, self, node, mapping, source_bytes
+            )
 
         # Extract signature
         signature = None
         if mapping.signature_child:
-            signature = self._extract_signature(node, mapping, source_bytes)
+            signature = self._extract_signature(node, mapping, source_bytes, index)
 
         # Extract docstring
         docstring = self._extract_docstring(node, source_bytes)
 
-        # Extract children
-        children = []
-        if mapping.body_child:
-            body = self._find_child(node, mapping.body_child)
-            if body:
-                children = self._extract_children(body, source_bytes)
-
         return Symbol(
             name=name,
             type=symbol_type,
-            lines=(node.start_point[0] + 1, node.end_point[0] + 1),
+            lines=lines,
             signature=signature,
             docstring=docstring,
             children=children if children else None,
         )
 
-    def _extract_name(self, node: "Node", mapping: NodeMapping, source_bytes: bytes) -> str:
+    def _extract_name(
+        self,
+        node: "Node",
+        mapping: NodeMapping,
+        source_bytes: bytes,
+        index: dict[str, "Node"] | None = None,
+    ) -> str:
         """Extract symbol name from node."""
         name_children = mapping.name_child
         if isinstance(name_children, str):
             name_children = [name_children]
 
+        if index is None:
+            index = self._child_index(node)
         for child_type in name_children:
-            name_node = self._find_child(node, child_type)
+            name_node = index.get(child_type)
             if name_node:
                 return self._get_node_text(name_node, source_bytes)
 
         return "<anonymous>"
 
-    def _extract_signature(self, node: "Node", mapping: NodeMapping, source_bytes: bytes) -> Optional[str]:
+    def _extract_signature(
+        self,
+        node: "Node",
+        mapping: NodeMapping,
+        source_bytes: bytes,
+        index: dict[str, "Node"] | None = None,
+    ) -> Optional[str]:
         """Extract function/method signature."""
         if not mapping.signature_child:
             return None
 
-        sig_node = self._find_child(node, mapping.signature_child)
+        if index is None:
+            index = self._child_index(node)
+        sig_node = index.get(mapping.signature_child)
         if sig_node:
             sig = self._get_node_text(sig_node, source_bytes)
             # Also try to get return type
-            return_node = self._find_child(node, "return_type") or self._find_child(node, "type_annotation")
+            return_node = index.get("return_type") or index.get("type_annotation")
             if return_node:
                 sig += f" : {self._get_node_text(return_node, source_bytes)}"
             return sig
@@ -169,62 +587,39 @@ class TreeSitterParser(Parser):
 
     def _extract_docstring(self, node: "Node", source_bytes: bytes) -> Optional[str]:
         """Extract docstring from preceding comment."""
-        if node.prev_sibling and node.prev_sibling.type in self.config.comment_types:
-            comment = self._get_node_text(node.prev_sibling, source_bytes)
-            return self._clean_comment(comment)
+        prev = node.prev_sibling
+        if prev and prev.type in self.config.comment_types:
+            # Hand over raw bytes; _clean_comment decodes only what it keeps
+            return self._clean_comment(source_bytes[prev.start_byte:prev.end_byte])
         return None
 
-    def _clean_comment(self, comment: str) -> Optional[str]:
-        """Clean up a comment to extract docstring content."""
+    def _clean_comment(self, comment: bytes) -> Optional[str]:
+        """Clean up a raw comment to extract docstring content."""
         if not comment:
             return None
 
-        # Handle different comment styles
-        if comment.startswith("/**"):
-            # JSDoc style
-            comment = comment[3:-2].strip()
-            lines = []
-            for line in comment.split("\n"):
-                line = line.strip().lstrip("*").strip()
-                if line and not line.startswith("@"):
-                    lines.append(line)
-            return " ".join(lines)[:150] if lines else None
-        elif comment.startswith("///"):
-            # C#/Rust doc comment
-            return comment[3:].strip()[:150]
-        elif comment.startswith("//"):
-            return comment[2:].strip()[:150]
-        elif comment.startswith("#"):
-            return comment[1:].strip()[:150]
-
-        return comment.strip()[:150] if comment.strip() else None
-
-    def _extract_children(self, body_node: "Node", source_bytes: bytes) -> list[Symbol]:
+        # Dispatch on the comment marker, longest prefix first
+        handler = (
+            _PREFIX_TABLE.get(comment[:3])
+            or _PREFIX_TABLE.get(comment[:2])
+            or _PREFIX_TABLE.get(comment[:1])
+        )
+        if handler:
+            return handler(comment)
+
+        comment = comment.strip()
+        return _decode_capped(comment) if comment else None
+
+    def _extract_children(
+        self, body_node: "Node", source_bytes: bytes, parent_kind: Optional[str] = None
+    ) -> list[Symbol]:
         """Extract child symbols from a body node."""
         children = []
+        mappings = self.config.node_mappings
         for child in body_node.children:
-            if child.type in self.config.node_mappings:
-                symbol = self._extract_symbol(child, source_bytes)
+            if child.type in mappings:
+                symbol = self._extract_symbol(child, source_bytes, parent_kind=parent_kind)
                 if symbol:
-                    # Convert function to method if inside a class
-                    if symbol.type == "function":
-                        symbol = Symbol(
-                            name=symbol.name,
-                            type="method",
-                            lines=symbol.lines,
-                            signature=symbol.signature,
-                            docstring=symbol.docstring,
-                            children=symbol.children,
-                        )
-                    elif symbol.type == "async_function":
-                        symbol = Symbol(
-                            name=symbol.name,
-                            type="async_method",
-                            lines=symbol.lines,
-                            signature=symbol.signature,
-                            docstring=symbol.docstring,
-                            children=symbol.children,
-                        )
                     children.append(symbol)
         return children
 
@@ -238,8 +633,20 @@ class TreeSitterParser(Parser):
                     symbols.append(symbol)
         return symbols
 
-    def _find_child(self, node: "Node", child_type: str) -> Optional["Node"]:
-        """Find a child node by type."""
+    @staticmethod
+    def _child_index(node: "Node") -> dict[str, "Node"]:
+        """Map each child type to the first child of that type."""
+        index: dict[str, "Node"] = {}
+        for child in node.children:
+            index.setdefault(child.type, child)
+        return index
+
+    def _find_child(
+        self, node: "Node", child_type: str, index: dict[str, "Node"] | None = None
+    ) -> Optional["Node"]:
+        """Find a child node by type, using a prebuilt child index if given."""
+        if index is not None:
+            return index.get(child_type)
         for child in node.children:
             if child.type == child_type:
                 return child
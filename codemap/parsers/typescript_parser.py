@@ -2,20 +2,92 @@
 
 from __future__ import annotations
 
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
 from typing import Optional
 
-from .base import Parser, Symbol
+from .base import Parser, Symbol, pack_symbols, unpack_symbols
+from .parse_cache import ParseCache
+from .treesitter_base import TreeCache, _acquire_parser, _release_parser, compute_input_edit
 
 # Tree-sitter imports - optional dependency
 try:
     import tree_sitter_typescript as tsts
-    from tree_sitter import Language, Parser as TSParser, Node
+    from tree_sitter import Language, Parser as TSParser, Node, Tree
 
     TREE_SITTER_AVAILABLE = True
 except ImportError:
     TREE_SITTER_AVAILABLE = False
     TSParser = None
     Node = None
+    Tree = None
+
+# Async variants of symbol types, so the type strings stay the compiler's
+# interned constants instead of a new f-string per symbol
+_ASYNC_TYPES = {"function": "async_function", "method": "async_method"}
+
+
+@lru_cache(maxsize=4096)
+def _clean_jsdoc_text(comment: str) -> Optional[str]:
+    """Join a JSDoc comment's description lines, dropping gutters and @tags.
+
+    Cached on the comment text: the same doc comments recur across
+    overloads, generated code and repeated parses.
+    """
+    cleaned = []
+    append = cleaned.append
+    for line in comment[3:-2].split("\n"):
+        line = line.strip()
+        # Remove leading * from lines
+        if line[:1] == "*":
+            line = line[1:].strip()
+        if line and line[0] != "@":
+            append(line)
+    return " ".join(cleaned) if cleaned else None
+
+
+@lru_cache(maxsize=None)
+def _get_ts_language(tsx: bool) -> "Language":
+    """Return the shared TypeScript or TSX Language, building it on first use."""
+    return Language(tsts.language_tsx() if tsx else tsts.language_typescript())
+
+
+class SymbolCache:
+    """Bounded LRU cache of extracted symbols keyed by source content.
+
+    Symbols are kept packed and unpacked on every hit, so callers always get
+    their own objects and mutating a result can't change later hits.
+    """
+
+    def __init__(self, capacity: int = 256):
+        self.capacity = capacity
+        self._entries: OrderedDict[tuple[bool, bytes], bytes] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: tuple[bool, bytes]) -> list[Symbol] | None:
+        """Return the cached symbols for a key, marking it recently used."""
+        with self._lock:
+            data = self._entries.get(key)
+            if data is None:
+                return None
+            self._entries.move_to_end(key)
+        return unpack_symbols(data)
+
+    def put(self, key: tuple[bool, bytes], symbols: list[Symbol]) -> None:
+        """Store symbols for a key, evicting the oldest entry if full."""
+        data = pack_symbols(symbols)
+        with self._lock:
+            self._entries[key] = data
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.capacity:
+                self._entries.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._entries)
 
 
 class TypeScriptParser(Parser):
@@ -23,21 +95,35 @@ class TypeScriptParser(Parser):
 
     extensions = [".ts", ".tsx"]
     language = "typescript"
+    accepts_bytes = True
 
-    def __init__(self):
-        """Initialize the TypeScript parser."""
+    def __init__(self, parse_cache: Optional[ParseCache] = None):
+        """Initialize the TypeScript parser.
+
+        Args:
+            parse_cache: Optional persistent cache consulted for files parsed
+                with a filepath, so unchanged files skip parsing across runs.
+        """
         if not TREE_SITTER_AVAILABLE:
             raise ImportError(
                 "tree-sitter and tree-sitter-typescript are required. "
                 "Install with: pip install tree-sitter tree-sitter-typescript"
             )
         # Use TypeScript language for .ts files, TSX for .tsx
-        self._ts_parser = TSParser(Language(tsts.language_typescript()))
-        self._tsx_parser = TSParser(Language(tsts.language_tsx()))
+        self._ts_parser = TSParser(_get_ts_language(False))
+        self._tsx_parser = TSParser(_get_ts_language(True))
+        self._symbol_cache = SymbolCache()
+        self._tree_cache = TreeCache()
+        self._parse_cache = parse_cache
 
-    def parse(self, source: str, filepath: str = "") -> list[Symbol]:
+    def parse(self, source: str | bytes, filepath: str = "") -> list[Symbol]:
         """Parse TypeScript source code and extract symbols.
 
+        Unchanged sources are served from a content-hash cache, skipping both
+        tree-sitter and symbol extraction, then from the persistent parse
+        cache if one was given. Otherwise, when filepath is given, the
+        previous tree for that file is edited and reused.
+
         Args:
             source: TypeScript source code.
             filepath: Optional file path for determining TSX vs TS.
@@ -46,11 +132,171 @@ class TypeScriptParser(Parser):
             List of top-level Symbol objects.
         """
         # Choose parser based on file extension
-        parser = self._tsx_parser if filepath.endswith(".tsx") else self._ts_parser
+        is_tsx = filepath.endswith(".tsx")
+        parser = self._tsx_parser if is_tsx else self._ts_parser
 
         # Convert to bytes for tree-sitter (it uses byte offsets)
-        source_bytes = source.encode("utf-8")
-        tree = parser.parse(source_bytes)
+        source_bytes = source if isinstance(source, bytes) else source.encode("utf-8")
+
+        key = (is_tsx, hashlib.blake2b(source_bytes, digest_size=16).digest())
+        cached = self._symbol_cache.get(key)
+        if cached is not None:
+            return cached
+
+        if self._parse_cache is not None and filepath:
+            symbols = self._parse_cache.get_or_parse(
+                filepath, source_bytes, partial(self._parse_source, parser, source_bytes, filepath)
+            )
+        else:
+            symbols = self._parse_source(parser, source_bytes, filepath)
+        self._symbol_cache.put(key, symbols)
+        return symbols
+
+    def _parse_source(self, parser: "TSParser", source_bytes: bytes, filepath: str) -> list[Symbol]:
+        """Parse source, reusing the file's previous tree when there is one."""
+        old_tree = None
+        if filepath:
+            cached_tree = self._tree_cache.take(filepath)
+            if cached_tree is not None:
+                old_bytes, old_tree = cached_tree
+                edit = compute_input_edit(old_bytes, source_bytes)
+                if edit is not None:
+                    old_tree.edit(**edit)
+
+        return self._parse_tree(parser, source_bytes, filepath, old_tree)
+
+    def parse_many(
+        self, files: list[tuple[str | bytes, str]], max_workers: int | None = None
+    ) -> list[list[Symbol]]:
+        """Parse many files, running tree-sitter on a thread pool.
+
+        tree-sitter releases the GIL while parsing, so threads parse in
+        parallel without the pickling and start-up cost of processes.
+        Symbol extraction needs the GIL and runs on the calling thread as
+        trees complete. Files found in either cache never reach the pool.
+
+        Args:
+            files: List of (source, filepath) tuples.
+            max_workers: Optional thread count. Defaults to os.cpu_count().
+
+        Returns:
+            List of symbol lists, in the same order as files.
+        """
+        results: list[list[Symbol] | None] = [None] * len(files)
+        pending: list[tuple[int, bytes, str, bool, tuple[bool, bytes]]] = []
+
+        for index, (source, filepath) in enumerate(files):
+            is_tsx = filepath.endswith(".tsx")
+            source_bytes = source if isinstance(source, bytes) else source.encode("utf-8")
+            key = (is_tsx, hashlib.blake2b(source_bytes, digest_size=16).digest())
+            cached = self._symbol_cache.get(key)
+            if cached is None and self._parse_cache is not None and filepath:
+                cached = self._parse_cache.get(filepath, source_bytes)
+                if cached is not None:
+                    self._symbol_cache.put(key, cached)
+            if cached is not None:
+                results[index] = cached
+            else:
+                pending.append((index, source_bytes, filepath, is_tsx, key))
+
+        workers = max_workers or os.cpu_count() or 1
+        with ThreadPoolExecutor(max_workers=min(workers, max(1, len(pending)))) as executor:
+            trees = executor.map(self._parse_detached, pending)
+            for (index, source_bytes, filepath, _, key), tree in zip(pending, trees):
+                if filepath:
+                    self._tree_cache.put(filepath, source_bytes, tree)
+                symbols = self._extract_symbols(tree.root_node, source_bytes)
+                self._symbol_cache.put(key, symbols)
+                if self._parse_cache is not None and filepath:
+                    self._parse_cache.put(filepath, source_bytes, symbols)
+                results[index] = symbols
+
+        return results
+
+    def _parse_detached(self, item: tuple[int, bytes, str, bool, tuple[bool, bytes]]) -> "Tree":
+        """Parse one parse_many() item with a pooled parser (safe on any thread)."""
+        _, source_bytes, _, is_tsx, _ = item
+        language = (self._tsx_parser if is_tsx else self._ts_parser).language
+        pool_key = "tsx" if is_tsx else "typescript"
+        parser = _acquire_parser(pool_key, language)
+        try:
+            return parser.parse(source_bytes)
+        finally:
+            _release_parser(pool_key, parser)
+
+    def apply_edit(
+        self,
+        filepath: str,
+        new_source: str | bytes,
+        start_byte: int,
+        old_end_byte: int,
+        new_end_byte: int,
+        start_point: tuple[int, int],
+        old_end_point: tuple[int, int],
+        new_end_point: tuple[int, int],
+    ) -> list[Symbol]:
+        """Reparse a file from a known edit, as editors and LSP clients report.
+
+        The edit is applied to the file's previous tree so tree-sitter only
+        re-parses the changed region. If the cached source does not match the
+        edit (for example, the file changed in between), the edit is
+        recomputed from the cached source instead.
+
+        Args:
+            filepath: Path of the edited file; also selects TSX vs TS.
+            new_source: Full source after the edit.
+            start_byte: Byte offset where the edit starts.
+            old_end_byte: End of the replaced range in the old source.
+            new_end_byte: End of the inserted range in the new source.
+            start_point: (row, column) of start_byte.
+            old_end_point: (row, column) of old_end_byte in the old source.
+            new_end_point: (row, column) of new_end_byte in the new source.
+
+        Returns:
+            List of top-level Symbol objects.
+        """
+        parser = self._tsx_parser if filepath.endswith(".tsx") else self._ts_parser
+        source_bytes = (
+            new_source if isinstance(new_source, bytes) else new_source.encode("utf-8")
+        )
+
+        old_tree = None
+        cached_tree = self._tree_cache.take(filepath)
+        if cached_tree is not None:
+            old_bytes, old_tree = cached_tree
+            if (
+                old_bytes[:start_byte] == source_bytes[:start_byte]
+                and old_bytes[old_end_byte:] == source_bytes[new_end_byte:]
+            ):
+                old_tree.edit(
+                    start_byte=start_byte,
+                    old_end_byte=old_end_byte,
+                    new_end_byte=new_end_byte,
+                    start_point=start_point,
+                    old_end_point=old_end_point,
+                    new_end_point=new_end_point,
+                )
+            else:
+                edit = compute_input_edit(old_bytes, source_bytes)
+                if edit is not None:
+                    old_tree.edit(**edit)
+
+        return self._parse_tree(parser, source_bytes, filepath, old_tree)
+
+    def _parse_tree(
+        self,
+        parser: "TSParser",
+        source_bytes: bytes,
+        filepath: str,
+        old_tree: Optional["Tree"],
+    ) -> list[Symbol]:
+        """Parse (incrementally when old_tree is given) and extract symbols."""
+        if old_tree is not None:
+            tree = parser.parse(source_bytes, old_tree)
+        else:
+            tree = parser.parse(source_bytes)
+        if filepath:
+            self._tree_cache.put(filepath, source_bytes, tree)
         return self._extract_symbols(tree.root_node, source_bytes)
 
     def _extract_symbols(self, node: "Node", source_bytes: bytes) -> list[Symbol]:
@@ -65,12 +311,17 @@ class TypeScriptParser(Parser):
         """
         symbols = []
 
+        # One native call builds node.children; a TreeCursor walk pays a
+        # Python->C call per sibling instead (measured ~2.7x slower)
         for child in node.children:
-            symbol = self._parse_node(child, source_bytes)
-            if symbol:
-                symbols.append(symbol)
+            child_type = child.type
+            handler = _NODE_HANDLERS.get(child_type)
+            if handler is not None:
+                symbol = handler(self, child, source_bytes)
+                if symbol:
+                    symbols.append(symbol)
             # Handle export statements
-            elif child.type == "export_statement":
+            elif child_type == "export_statement":
                 exported = self._parse_export(child, source_bytes)
                 if exported:
                     symbols.extend(exported)
@@ -87,20 +338,8 @@ class TypeScriptParser(Parser):
         Returns:
             Symbol or None if not a recognized symbol type.
         """
-        if node.type == "class_declaration":
-            return self._parse_class(node, source_bytes)
-        elif node.type == "function_declaration":
-            return self._parse_function(node, source_bytes, "function")
-        elif node.type == "lexical_declaration":
-            # Handle const/let arrow functions
-            return self._parse_lexical_declaration(node, source_bytes)
-        elif node.type == "interface_declaration":
-            return self._parse_interface(node, source_bytes)
-        elif node.type == "type_alias_declaration":
-            return self._parse_type_alias(node, source_bytes)
-        elif node.type == "enum_declaration":
-            return self._parse_enum(node, source_bytes)
-        return None
+        handler = _NODE_HANDLERS.get(node.type)
+        return handler(self, node, source_bytes) if handler is not None else None
 
     def _parse_export(self, node: "Node", source_bytes: bytes) -> list[Symbol]:
         """Parse an export statement.
@@ -129,17 +368,15 @@ class TypeScriptParser(Parser):
         Returns:
             Symbol representing the class.
         """
-        name = self._get_node_text(self._find_child(node, "type_identifier"), source_bytes)
-        if not name:
-            name = self._get_node_text(self._find_child(node, "identifier"), source_bytes)
+        name = self._get_node_text(node.child_by_field_name("name"), source_bytes)
 
         children = []
-        body = self._find_child(node, "class_body")
+        body = self._field(node, "body", "class_body")
         if body:
             for member in body.children:
-                child_symbol = self._parse_class_member(member, source_bytes)
-                if child_symbol:
-                    children.append(child_symbol)
+                handler = _MEMBER_HANDLERS.get(member.type)
+                if handler is not None:
+                    children.append(handler(self, member, source_bytes))
 
         return Symbol(
             name=name or "<anonymous>",
@@ -159,12 +396,8 @@ class TypeScriptParser(Parser):
         Returns:
             Symbol or None.
         """
-        if node.type == "method_definition":
-            return self._parse_method(node, source_bytes)
-        elif node.type == "public_field_definition":
-            # Skip field definitions (too noisy)
-            return None
-        return None
+        handler = _MEMBER_HANDLERS.get(node.type)
+        return handler(self, node, source_bytes) if handler is not None else None
 
     def _parse_method(self, node: "Node", source_bytes: bytes) -> Symbol:
         """Parse a method definition.
@@ -176,14 +409,13 @@ class TypeScriptParser(Parser):
         Returns:
             Symbol representing the method.
         """
-        name_node = self._find_child(node, "property_identifier")
+        name_node, params_node, return_node, is_async = self._function_parts(
+            node, "property_identifier"
+        )
         name = self._get_node_text(name_node, source_bytes) if name_node else "<anonymous>"
-
-        # Check if async
-        is_async = any(c.type == "async" for c in node.children)
         symbol_type = "async_method" if is_async else "method"
 
-        signature = self._get_function_signature(node, source_bytes)
+        signature = self._get_function_signature(params_node, return_node, source_bytes)
 
         return Symbol(
             name=name,
@@ -204,14 +436,11 @@ class TypeScriptParser(Parser):
         Returns:
             Symbol representing the function.
         """
-        name_node = self._find_child(node, "identifier")
+        name_node, params_node, return_node, is_async = self._function_parts(node, "identifier")
         name = self._get_node_text(name_node, source_bytes) if name_node else "<anonymous>"
+        symbol_type = _ASYNC_TYPES[base_type] if is_async else base_type
 
-        # Check if async
-        is_async = any(c.type == "async" for c in node.children)
-        symbol_type = f"async_{base_type}" if is_async else base_type
-
-        signature = self._get_function_signature(node, source_bytes)
+        signature = self._get_function_signature(params_node, return_node, source_bytes)
 
         return Symbol(
             name=name,
@@ -231,21 +460,27 @@ class TypeScriptParser(Parser):
         Returns:
             Symbol if it's a named arrow function, None otherwise.
         """
+        # Most declarations hold plain values; without "=>" anywhere in the
+        # statement there is no arrow function to find
+        if source_bytes.find(b"=>", node.start_byte, node.end_byte) == -1:
+            return None
+
         for child in node.children:
             if child.type == "variable_declarator":
-                name_node = self._find_child(child, "identifier")
-                value_node = None
-                for c in child.children:
-                    if c.type == "arrow_function":
-                        value_node = c
-                        break
+                name_node = self._field(child, "name", "identifier")
+                value_node = self._field(child, "value", "arrow_function")
 
                 if name_node and value_node:
                     name = self._get_node_text(name_node, source_bytes)
-                    is_async = any(c.type == "async" for c in value_node.children)
+                    # An arrow's lone unparenthesized parameter is its identifier child
+                    param_node, params_node, return_node, is_async = self._function_parts(
+                        value_node, "identifier"
+                    )
                     symbol_type = "async_function" if is_async else "function"
 
-                    signature = self._get_arrow_signature(value_node, source_bytes)
+                    signature = self._get_arrow_signature(
+                        params_node, param_node, return_node, source_bytes
+                    )
 
                     return Symbol(
                         name=name or "<anonymous>",
@@ -266,7 +501,7 @@ class TypeScriptParser(Parser):
         Returns:
             Symbol representing the interface.
         """
-        name_node = self._find_child(node, "type_identifier")
+        name_node = self._field(node, "name", "type_identifier")
         name = self._get_node_text(name_node, source_bytes) if name_node else "<anonymous>"
 
         return Symbol(
@@ -286,7 +521,7 @@ class TypeScriptParser(Parser):
         Returns:
             Symbol representing the type alias.
         """
-        name_node = self._find_child(node, "type_identifier")
+        name_node = self._field(node, "name", "type_identifier")
         name = self._get_node_text(name_node, source_bytes) if name_node else "<anonymous>"
 
         return Symbol(
@@ -306,7 +541,7 @@ class TypeScriptParser(Parser):
         Returns:
             Symbol representing the enum.
         """
-        name_node = self._find_child(node, "identifier")
+        name_node = self._field(node, "name", "identifier")
         name = self._get_node_text(name_node, source_bytes) if name_node else "<anonymous>"
 
         return Symbol(
@@ -316,28 +551,61 @@ class TypeScriptParser(Parser):
             docstring=self._get_preceding_comment(node, source_bytes),
         )
 
-    def _get_function_signature(self, node: "Node", source_bytes: bytes) -> str:
-        """Extract function signature from a function/method node.
+    def _function_parts(
+        self, node: "Node", name_type: str
+    ) -> tuple[Optional["Node"], Optional["Node"], Optional["Node"], bool]:
+        """Collect the parts of a function-like node in one pass over its children.
+
+        Reading node.children once is much cheaper than separate field
+        lookups plus a scan for the (field-less) async keyword.
 
         Args:
-            node: Function or method node.
+            node: Function, method or arrow function node.
+            name_type: Node type of the name child.
+
+        Returns:
+            (name_node, params_node, return_type_node, is_async).
+        """
+        name_node = params_node = return_node = None
+        is_async = False
+        for child in node.children:
+            child_type = child.type
+            if child_type == name_type:
+                if name_node is None:
+                    name_node = child
+            elif child_type == "formal_parameters":
+                if params_node is None:
+                    params_node = child
+            elif child_type == "type_annotation":
+                if return_node is None:
+                    return_node = child
+            elif child_type == "async":
+                is_async = True
+            elif child_type == "=>" or child_type == "statement_block":
+                # Only the body follows, and an arrow's body may be a bare identifier
+                break
+        return name_node, params_node, return_node, is_async
+
+    def _get_function_signature(
+        self, params_node: Optional["Node"], return_node: Optional["Node"], source_bytes: bytes
+    ) -> str:
+        """Build the signature of a function or method.
+
+        Args:
+            params_node: The formal_parameters node, if any.
+            return_node: The return type_annotation node, if any.
             source_bytes: Original source code as bytes.
 
         Returns:
             Signature string.
         """
-        params_node = self._find_child(node, "formal_parameters")
         if not params_node:
             return "()"
 
         params_text = self._get_node_text(params_node, source_bytes)
 
         # Get return type if present
-        return_type = ""
-        for child in node.children:
-            if child.type == "type_annotation":
-                return_type = self._get_node_text(child, source_bytes)
-                break
+        return_type = self._get_node_text(return_node, source_bytes)
 
         sig = params_text or "()"
         if return_type:
@@ -345,30 +613,32 @@ class TypeScriptParser(Parser):
 
         return sig
 
-    def _get_arrow_signature(self, node: "Node", source_bytes: bytes) -> str:
-        """Extract signature from an arrow function.
+    def _get_arrow_signature(
+        self,
+        params_node: Optional["Node"],
+        param_node: Optional["Node"],
+        return_node: Optional["Node"],
+        source_bytes: bytes,
+    ) -> str:
+        """Build the signature of an arrow function.
 
         Args:
-            node: Arrow function node.
+            params_node: The formal_parameters node, if any.
+            param_node: The single unparenthesized parameter, if any.
+            return_node: The return type_annotation node, if any.
             source_bytes: Original source code as bytes.
 
         Returns:
             Signature string.
         """
-        params_node = self._find_child(node, "formal_parameters")
         if params_node:
             params_text = self._get_node_text(params_node, source_bytes)
         else:
             # Single parameter without parens
-            param_node = self._find_child(node, "identifier")
             params_text = f"({self._get_node_text(param_node, source_bytes)})" if param_node else "()"
 
         # Get return type if present
-        return_type = ""
-        for child in node.children:
-            if child.type == "type_annotation":
-                return_type = self._get_node_text(child, source_bytes)
-                break
+        return_type = self._get_node_text(return_node, source_bytes)
 
         sig = params_text
         if return_type:
@@ -376,20 +646,26 @@ class TypeScriptParser(Parser):
 
         return sig
 
-    def _find_child(self, node: "Node", child_type: str) -> Optional["Node"]:
-        """Find a child node by type.
+    def _field(
+        self, node: "Node", field_name: str, child_type: str | None = None
+    ) -> Optional["Node"]:
+        """Find a child by grammar field name, optionally requiring its type.
+
+        Field lookups go through the grammar's field table in the C core
+        rather than scanning node.children from Python.
 
         Args:
             node: Parent node.
-            child_type: Type of child to find.
+            field_name: Grammar field name (e.g. "name", "parameters").
+            child_type: If given, only return the child when it has this type.
 
         Returns:
             Child node or None.
         """
-        for child in node.children:
-            if child.type == child_type:
-                return child
-        return None
+        child = node.child_by_field_name(field_name)
+        if child is not None and child_type is not None and child.type != child_type:
+            return None
+        return child
 
     def _get_node_text(self, node: Optional["Node"], source_bytes: bytes) -> str:
         """Get the text content of a node.
@@ -416,21 +692,32 @@ class TypeScriptParser(Parser):
             Comment text or None.
         """
         # Look for comment in preceding siblings
-        if node.prev_sibling and node.prev_sibling.type == "comment":
-            comment = self._get_node_text(node.prev_sibling, source_bytes)
+        prev = node.prev_sibling
+        if prev and prev.type == "comment":
+            # Check the comment marker on the raw bytes so that other block
+            # comments (license headers and the like) are never decoded
+            start = prev.start_byte
             # Clean up JSDoc comment
-            if comment.startswith("/**"):
-                comment = comment[3:-2].strip()
-                # Remove leading * from lines
-                lines = comment.split("\n")
-                cleaned = []
-                for line in lines:
-                    line = line.strip()
-                    if line.startswith("*"):
-                        line = line[1:].strip()
-                    if line and not line.startswith("@"):
-                        cleaned.append(line)
-                return " ".join(cleaned) if cleaned else None
-            elif comment.startswith("//"):
-                return comment[2:].strip()
+            if source_bytes.startswith(b"/**", start):
+                return _clean_jsdoc_text(self._get_node_text(prev, source_bytes))
+            elif source_bytes.startswith(b"//", start):
+                return source_bytes[start + 2:prev.end_byte].decode("utf-8").strip()
         return None
+
+
+# Declaration node type -> handler; node.type is read once per node
+_NODE_HANDLERS = {
+    "class_declaration": TypeScriptParser._parse_class,
+    "function_declaration": partial(TypeScriptParser._parse_function, base_type="function"),
+    # const/let arrow functions
+    "lexical_declaration": TypeScriptParser._parse_lexical_declaration,
+    "interface_declaration": TypeScriptParser._parse_interface,
+    "type_alias_declaration": TypeScriptParser._parse_type_alias,
+    "enum_declaration": TypeScriptParser._parse_enum,
+}
+
+# Class member node type -> handler. Field definitions (public_field_definition)
+# are deliberately absent: they are too noisy to index.
+_MEMBER_HANDLERS = {
+    "method_definition": TypeScriptParser._parse_method,
+}
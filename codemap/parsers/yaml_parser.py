@@ -1,19 +1,78 @@
 """YAML parser for indexing keys and sections with full hierarchy."""
 
 import re
+from functools import partial
 from typing import Optional
 
 from .base import Parser, Symbol
+from .parse_cache import ParseCache
+
+
+def _is_key_text(text: str) -> bool:
+    """Return True if text is made only of word characters, '-' and '_'."""
+    bare = text.replace('-', '').replace('_', '')
+    # str.isalnum() and \w agree on which characters are word characters
+    return not bare or bare.isalnum()
+
+
+def _scan_key_line(line: str, stripped: str) -> Optional[tuple[int, str, bool]]:
+    """Match a line against LIST_ITEM_PATTERN, then KEY_PATTERN, with str methods.
+
+    Gives the same results as the two regexes but avoids running them on
+    every line of the file.
+
+    Args:
+        line: The raw line.
+        stripped: The line with leading whitespace removed (non-empty).
+
+    Returns:
+        (indent, key_name, is_list_item), or None if the line has no key.
+    """
+    indent = len(line) - len(stripped)
+    first = stripped[0]
+
+    if first == '-':
+        rest = stripped[1:]
+        item = rest.lstrip()
+        if len(item) < len(rest):
+            colon = item.find(':')
+            if colon > 0:
+                key = item[:colon].rstrip()
+                if key and (key[0].isalnum() or key[0] == '_') and _is_key_text(key):
+                    return indent + 2, key, True  # Account for "- "
+
+    if first in '"\'':
+        close = stripped.find(first, 1)
+        if close > 1 and stripped[close + 1:].lstrip().startswith(':'):
+            return indent, stripped[:close + 1].strip('"\''), False
+        return None
+
+    colon = stripped.find(':')
+    if colon > 0:
+        key = stripped[:colon].rstrip()
+        if key and _is_key_text(key):
+            return indent, key, False
+    return None
 
 
 class YamlParser(Parser):
     """Parser for YAML files - indexes keys recursively with full hierarchy."""
 
-    # Match YAML keys (handles quoted and unquoted keys)
+    # Match YAML keys (handles quoted and unquoted keys). parse() uses the
+    # equivalent _scan_key_line(); these document the accepted syntax.
     KEY_PATTERN = re.compile(r'^(\s*)([\w\-_]+|"[^"]+"|\'[^\']+\')\s*:')
     # Match list items that might have nested content
     LIST_ITEM_PATTERN = re.compile(r'^(\s*)-\s+(\w[\w\-_]*)\s*:')
 
+    def __init__(self, parse_cache: Optional[ParseCache] = None):
+        """Initialize the YAML parser.
+
+        Args:
+            parse_cache: Optional persistent cache consulted for files parsed
+                with a filepath.
+        """
+        self._parse_cache = parse_cache
+
     def parse(self, source: str, filepath: Optional[str] = None) -> list[Symbol]:
         """Parse YAML source and extract key symbols recursively.
 
@@ -24,40 +83,64 @@ class YamlParser(Parser):
         Returns:
             List of Symbol objects representing YAML keys/sections
         """
+        if self._parse_cache is not None and filepath:
+            return self._parse_cache.get_or_parse(
+                filepath, source, partial(self._parse_source, source)
+            )
+        return self._parse_source(source)
+
+    def _parse_source(self, source: str) -> list[Symbol]:
+        """Extract the key hierarchy from YAML source."""
+        keys, total_lines = self._collect_keys(source)
+
+        # Build hierarchical symbol tree
+        return self._build_hierarchy(keys, total_lines)
+
+    def _collect_keys(
+        self, source: str
+    ) -> tuple[list[tuple[int, str, int, bool, str, bool]], int]:
+        """Scan the source for key lines.
+
+        Each key keeps the text after its first colon and whether the next
+        line starts a list, which is all the type and preview checks look
+        at, so the full list of lines can be released before any symbols
+        are built.
+
+        Args:
+            source: The YAML source code
+
+        Returns:
+            (keys, total_lines) where each key is
+            (indent, name, line_num, is_list_item, value, opens_list).
+        """
         lines = source.split('\n')
         total_lines = len(lines)
 
-        # Parse all keys with their indentation and line numbers
-        keys: list[tuple[int, str, int, bool]] = []  # (indent, name, line_num, is_list_item)
+        keys: list[tuple[int, str, int, bool, str, bool]] = []
+        append = keys.append
+        scan = _scan_key_line
 
         for line_num, line in enumerate(lines, 1):
             # Skip comments and empty lines
             stripped = line.lstrip()
-            if not stripped or stripped.startswith('#'):
-                continue
-
-            # Check for list item with key
-            list_match = self.LIST_ITEM_PATTERN.match(line)
-            if list_match:
-                indent = len(list_match.group(1)) + 2  # Account for "- "
-                key_name = list_match.group(2)
-                keys.append((indent, key_name, line_num, True))
-                continue
-
-            # Check for regular key
-            key_match = self.KEY_PATTERN.match(line)
-            if key_match:
-                indent = len(key_match.group(1))
-                key_name = key_match.group(2).strip('"\'')
-                keys.append((indent, key_name, line_num, False))
-
-        # Build hierarchical symbol tree
-        return self._build_hierarchy(keys, lines, total_lines)
+            if stripped and stripped[0] != '#':
+                key = scan(line, stripped)
+                if key is not None:
+                    # Every key line has a colon; the value follows the first one
+                    value = line[line.find(':') + 1:].strip()
+                    # lines[line_num] is the following line (line_num is 1-based)
+                    opens_list = (
+                        not value
+                        and line_num < total_lines
+                        and lines[line_num].lstrip().startswith('-')
+                    )
+                    append((key[0], key[1], line_num, key[2], value, opens_list))
+
+        return keys, total_lines
 
     def _build_hierarchy(
         self,
-        keys: list[tuple[int, str, int, bool]],
-        lines: list[str],
+        keys: list[tuple[int, str, int, bool, str, bool]],
         total_lines: int,
     ) -> list[Symbol]:
         """Build a hierarchical symbol tree from flat key list."""
@@ -68,20 +151,27 @@ class YamlParser(Parser):
         # Stack of (indent, symbol) for tracking hierarchy
         stack: list[tuple[int, Symbol]] = []
 
-        for i, (indent, name, start_line, is_list_item) in enumerate(keys):
-            # Find end line (next key at same or lower indent, or EOF)
-            end_line = total_lines
-            for j in range(i + 1, len(keys)):
-                next_indent, _, next_line, _ = keys[j]
-                if next_indent <= indent:
-                    end_line = next_line - 1
-                    break
+        # A key ends just before the next key at the same or lower indent (or
+        # at EOF). Sweep right to left keeping a stack of the keys that can
+        # still end an earlier one; a key hides any deeper key after it.
+        end_lines = [total_lines] * len(keys)
+        following: list[tuple[int, int]] = []  # (indent, line_num)
+        for i in range(len(keys) - 1, -1, -1):
+            indent, _, start_line = keys[i][:3]
+            while following and following[-1][0] > indent:
+                following.pop()
+            if following:
+                end_lines[i] = following[-1][1] - 1
+            following.append((indent, start_line))
+
+        for i, (indent, name, start_line, is_list_item, value, opens_list) in enumerate(keys):
+            end_line = end_lines[i]
 
             # Determine symbol type
-            symbol_type = self._determine_type(lines, start_line, end_line, is_list_item)
+            symbol_type = self._determine_type(value, opens_list, is_list_item)
 
             # Extract value preview as docstring
-            docstring = self._extract_value_preview(lines, start_line)
+            docstring = self._extract_value_preview(value)
 
             symbol = Symbol(
                 name=name,
@@ -108,55 +198,27 @@ class YamlParser(Parser):
 
         return symbols
 
-    def _determine_type(
-        self, lines: list[str], start_line: int, end_line: int, is_list_item: bool
-    ) -> str:
-        """Determine the type of YAML symbol based on content."""
-        if start_line > len(lines):
-            return "key"
-
-        line = lines[start_line - 1]
-
+    def _determine_type(self, value: str, opens_list: bool, is_list_item: bool) -> str:
+        """Determine the type of YAML symbol from the text after its colon."""
         # Check if it's a list
         if is_list_item:
             return "item"
 
-        # Check what follows the colon
-        colon_idx = line.find(':')
-        if colon_idx == -1:
-            return "key"
-
-        after_colon = line[colon_idx + 1:].strip()
-
-        # Empty after colon = section/mapping
-        if not after_colon:
-            # Check if children are list items
-            if start_line < len(lines):
-                next_line = lines[start_line].lstrip()
-                if next_line.startswith('-'):
-                    return "list"
-            return "section"
+        # Empty after colon = section/mapping, or a list if the children are items
+        if not value:
+            return "list" if opens_list else "section"
 
         # Has inline value
-        if after_colon.startswith('[') or after_colon.startswith('{'):
+        first = value[0]
+        if first in '[{':
             return "collection"
-        if after_colon.startswith('|') or after_colon.startswith('>'):
+        if first in '|>':
             return "multiline"
 
         return "key"
 
-    def _extract_value_preview(self, lines: list[str], line_num: int) -> Optional[str]:
+    def _extract_value_preview(self, value: str) -> Optional[str]:
         """Extract a preview of the value for simple key-value pairs."""
-        if line_num > len(lines):
-            return None
-
-        line = lines[line_num - 1]
-        colon_idx = line.find(':')
-        if colon_idx == -1:
-            return None
-
-        value = line[colon_idx + 1:].strip()
-
         # Skip if it's a section marker or empty
         if not value or value in ('|', '>', '|-', '>-'):
             return None
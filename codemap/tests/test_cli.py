@@ -2,24 +2,23 @@
 
 import json
 import os
+import shutil
 import pytest
 from pathlib import Path
+import click
 from click.testing import CliRunner
 
-from codemap.cli import cli
+from codemap.cli import cli, init
 
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    json_loads = json.loads
 
-class TestCLI:
-    """Tests for CLI commands."""
-
-    @pytest.fixture
-    def runner(self):
-        return CliRunner()
+# Shares session and module fixtures, so run on a single xdist worker
+pytestmark = pytest.mark.xdist_group(name="cli")
 
-    @pytest.fixture
-    def sample_project(self, tmp_path: Path):
-        """Create a sample project structure."""
-        (tmp_path / "main.py").write_text('''
+_MAIN_PY = b'''
 def main():
     """Main entry point."""
     print("Hello, World!")
@@ -34,13 +33,133 @@ class Application:
     def stop(self):
         """Stop the application."""
         pass
-''')
-        (tmp_path / "utils.py").write_text('''
+'''
+
+_UTILS_PY = b'''
 def helper(x: int) -> str:
     """Helper function."""
     return str(x)
-''')
-        return tmp_path
+'''
+
+
+def _write(path: Path, data: bytes) -> None:
+    """Write a small file with one open/write/close, bypassing file objects."""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+
+def _materialize(root: Path, files: dict[str, bytes]) -> Path:
+    """Write files, given as relative path to content, under root.
+
+    Each directory is created once, however many files it holds.
+    """
+    for directory in {Path(name).parent for name in files}:
+        (root / directory).mkdir(parents=True, exist_ok=True)
+    for name, content in files.items():
+        _write(root / name, content)
+    return root
+
+
+def _init(path: Path) -> None:
+    """Index a project by calling the init command directly.
+
+    For setup steps whose output is not checked; this skips CliRunner's
+    argument parsing, context setup and stream capture.
+    """
+    init.callback(path=str(path), lang=(), exclude=(), rebuild=False)
+
+
+def _exit_code(args: list[str]) -> int:
+    """Run the CLI without CliRunner and return only its exit code.
+
+    For tests that never look at the output: it goes to pytest's own
+    capture instead of a per-call buffer and isolated environment.
+    """
+    try:
+        rv = cli.main(args, prog_name="codemap", standalone_mode=False)
+    except click.ClickException as e:
+        return e.exit_code
+    except SystemExit as e:
+        return e.code or 0
+    # Without standalone mode, ctx.exit(n) and Exit(n) are returned, not raised
+    return rv if isinstance(rv, int) else 0
+
+
+@pytest.fixture(scope="session")
+def runner():
+    return CliRunner()
+
+
+@pytest.fixture(scope="session")
+def pristine_project(tmp_path_factory):
+    """Create the sample project files once for the whole session."""
+    return _materialize(
+        tmp_path_factory.mktemp("pristine"),
+        {"main.py": _MAIN_PY, "utils.py": _UTILS_PY},
+    )
+
+
+@pytest.fixture(scope="session")
+def indexed_project(pristine_project, tmp_path_factory):
+    """The sample project, indexed once and shared by read-only tests."""
+    project = tmp_path_factory.mktemp("indexed") / "project"
+    shutil.copytree(pristine_project, project)
+    _init(project)
+    return project
+
+
+@pytest.fixture(scope="session")
+def components_layout(tmp_path_factory):
+    """A src/ tree with a nested components/ package."""
+    return _materialize(tmp_path_factory.mktemp("components_layout"), {
+        "src/main.py": b"def main(): pass",
+        "src/components/button.py": b"class Button: pass",
+    })
+
+
+@pytest.fixture(scope="session")
+def mixed_language_layout(tmp_path_factory):
+    """A Python and a JavaScript file side by side."""
+    return _materialize(tmp_path_factory.mktemp("mixed_language_layout"), {
+        "script.py": b"def py(): pass",
+        "script.js": b"function js() {}",
+    })
+
+
+@pytest.fixture(scope="session")
+def src_lib_layout(tmp_path_factory):
+    """Two sibling source directories, src/ and lib/."""
+    return _materialize(tmp_path_factory.mktemp("src_lib_layout"), {
+        "src/main.py": b"def main(): pass",
+        "lib/utils.py": b"def utils(): pass",
+    })
+
+
+def _link_copy(layout: Path, tmp_path: Path) -> Path:
+    """Clone a layout into tmp_path with hard links instead of copying bytes.
+
+    Only for tests that never write to the source files themselves: the
+    links share their content with the session-wide layout.
+    """
+    project = tmp_path / "project"
+    shutil.copytree(layout, project, copy_function=os.link)
+    return project
+
+
+class TestCLI:
+    """Tests for CLI commands."""
+
+    @pytest.fixture
+    def sample_project(self, pristine_project, tmp_path: Path):
+        """A private copy of the sample project that a test may modify."""
+        project = tmp_path / "project"
+        shutil.copytree(pristine_project, project)
+        return project
 
     def test_init_command(self, runner, sample_project, monkeypatch):
         monkeypatch.chdir(sample_project)
@@ -51,65 +170,64 @@ def helper(x: int) -> str:
         assert "Indexed" in result.output
         assert (sample_project / ".codemap").exists()
 
+    def test_init_rebuild(self, runner, sample_project, monkeypatch):
+        monkeypatch.chdir(sample_project)
+        _init(sample_project)
+        result = runner.invoke(cli, ["init", ".", "--rebuild"])
+
+        assert result.exit_code == 0
+        assert "Indexed" in result.output
+        assert (sample_project / ".codemap" / "parse-cache.db").exists()
+
     def test_init_creates_valid_json(self, runner, sample_project, monkeypatch):
         monkeypatch.chdir(sample_project)
-        runner.invoke(cli, ["init", "."])
+        _init(sample_project)
 
         # Check manifest exists
         manifest_path = sample_project / ".codemap" / ".codemap.json"
         assert manifest_path.exists()
 
-        with open(manifest_path) as f:
-            data = json.load(f)
+        data = json_loads(manifest_path.read_bytes())
 
         assert "version" in data
         assert "directories" in data
         assert data["stats"]["total_files"] == 2
 
-    def test_init_creates_directory_structure(self, runner, tmp_path, monkeypatch):
+    def test_init_creates_directory_structure(self, components_layout, tmp_path, monkeypatch):
         """Test that init creates mirrored directory structure."""
-        (tmp_path / "src").mkdir()
-        (tmp_path / "src" / "components").mkdir()
-        (tmp_path / "src" / "main.py").write_text("def main(): pass")
-        (tmp_path / "src" / "components" / "button.py").write_text("class Button: pass")
-
-        monkeypatch.chdir(tmp_path)
-        result = runner.invoke(cli, ["init", "."])
+        project = _link_copy(components_layout, tmp_path)
 
-        assert result.exit_code == 0
+        monkeypatch.chdir(project)
+        assert _exit_code(["init", "."]) == 0
 
         # Verify directory structure is mirrored
-        codemap_dir = tmp_path / ".codemap"
+        codemap_dir = project / ".codemap"
         assert (codemap_dir / "src" / ".codemap.json").exists()
         assert (codemap_dir / "src" / "components" / ".codemap.json").exists()
 
-    def test_find_command(self, runner, sample_project, monkeypatch):
-        monkeypatch.chdir(sample_project)
-        runner.invoke(cli, ["init", "."])
+    def test_find_command(self, runner, indexed_project, monkeypatch):
+        monkeypatch.chdir(indexed_project)
         result = runner.invoke(cli, ["find", "Application"])
 
         assert result.exit_code == 0
         assert "Application" in result.output
         assert "class" in result.output
 
-    def test_find_with_type_filter(self, runner, sample_project, monkeypatch):
-        monkeypatch.chdir(sample_project)
-        runner.invoke(cli, ["init", "."])
+    def test_find_with_type_filter(self, runner, indexed_project, monkeypatch):
+        monkeypatch.chdir(indexed_project)
         result = runner.invoke(cli, ["find", "run", "--type", "method"])
 
         assert result.exit_code == 0
         assert "method" in result.output
 
-    def test_find_no_results(self, runner, sample_project, monkeypatch):
-        monkeypatch.chdir(sample_project)
-        runner.invoke(cli, ["init", "."])
+    def test_find_no_results(self, runner, indexed_project, monkeypatch):
+        monkeypatch.chdir(indexed_project)
         result = runner.invoke(cli, ["find", "nonexistent_symbol"])
 
         assert "No symbols found" in result.output
 
-    def test_show_command(self, runner, sample_project, monkeypatch):
-        monkeypatch.chdir(sample_project)
-        runner.invoke(cli, ["init", "."])
+    def test_show_command(self, runner, indexed_project, monkeypatch):
+        monkeypatch.chdir(indexed_project)
         result = runner.invoke(cli, ["show", "main.py"])
 
         assert result.exit_code == 0
@@ -117,16 +235,14 @@ def helper(x: int) -> str:
         assert "Application" in result.output
         assert "main" in result.output
 
-    def test_show_not_indexed(self, runner, sample_project, monkeypatch):
-        monkeypatch.chdir(sample_project)
-        runner.invoke(cli, ["init", "."])
+    def test_show_not_indexed(self, runner, indexed_project, monkeypatch):
+        monkeypatch.chdir(indexed_project)
         result = runner.invoke(cli, ["show", "nonexistent.py"])
 
         assert "not indexed" in result.output
 
-    def test_validate_command_fresh(self, runner, sample_project, monkeypatch):
-        monkeypatch.chdir(sample_project)
-        runner.invoke(cli, ["init", "."])
+    def test_validate_command_fresh(self, runner, indexed_project, monkeypatch):
+        monkeypatch.chdir(indexed_project)
         result = runner.invoke(cli, ["validate"])
 
         assert result.exit_code == 0
@@ -134,9 +250,9 @@ def helper(x: int) -> str:
 
     def test_validate_command_stale(self, runner, sample_project, monkeypatch):
         monkeypatch.chdir(sample_project)
-        runner.invoke(cli, ["init", "."])
+        _init(sample_project)
         # Modify a file
-        (sample_project / "main.py").write_text("# modified\ndef new(): pass")
+        _write(sample_project / "main.py", b"# modified\ndef new(): pass")
         result = runner.invoke(cli, ["validate"])
 
         assert "Stale" in result.output
@@ -144,12 +260,9 @@ def helper(x: int) -> str:
 
     def test_update_command(self, runner, sample_project, monkeypatch):
         monkeypatch.chdir(sample_project)
-        runner.invoke(cli, ["init", "."])
+        _init(sample_project)
         # Modify file
-        (sample_project / "main.py").write_text('''
-def new_function():
-    pass
-''')
+        _write(sample_project / "main.py", b"\ndef new_function():\n    pass\n")
         result = runner.invoke(cli, ["update", "main.py"])
 
         assert result.exit_code == 0
@@ -157,10 +270,10 @@ def new_function():
 
     def test_update_all_command(self, runner, sample_project, monkeypatch):
         monkeypatch.chdir(sample_project)
-        runner.invoke(cli, ["init", "."])
+        _init(sample_project)
         # Modify files
-        (sample_project / "main.py").write_text("def modified1(): pass")
-        (sample_project / "utils.py").write_text("def modified2(): pass")
+        _write(sample_project / "main.py", b"def modified1(): pass")
+        _write(sample_project / "utils.py", b"def modified2(): pass")
         result = runner.invoke(cli, ["update", "--all"])
 
         assert result.exit_code == 0
@@ -171,28 +284,23 @@ def new_function():
         assert result.exit_code == 0
         assert "1.0.0" in result.output
 
-    def test_init_with_language_filter(self, runner, tmp_path, monkeypatch):
-        # Create files of different types
-        (tmp_path / "script.py").write_text("def py(): pass")
-        (tmp_path / "script.js").write_text("function js() {}")
+    def test_init_with_language_filter(self, mixed_language_layout, tmp_path, monkeypatch):
+        project = _link_copy(mixed_language_layout, tmp_path)
 
-        monkeypatch.chdir(tmp_path)
-        result = runner.invoke(cli, ["init", ".", "-l", "python"])
-
-        assert result.exit_code == 0
+        monkeypatch.chdir(project)
+        assert _exit_code(["init", ".", "-l", "python"]) == 0
 
         # Should only index Python files - check via MapStore
         from codemap.core.map_store import MapStore
-        store = MapStore.load(tmp_path)
+        store = MapStore.load(project)
         files = list(store.get_all_files())
 
         file_names = [f[0] for f in files]
         assert "script.py" in file_names
         assert "script.js" not in file_names
 
-    def test_lines_command_valid(self, runner, sample_project, monkeypatch):
-        monkeypatch.chdir(sample_project)
-        runner.invoke(cli, ["init", "."])
+    def test_lines_command_valid(self, runner, indexed_project, monkeypatch):
+        monkeypatch.chdir(indexed_project)
         result = runner.invoke(cli, ["lines", "main.py:1-10"])
 
         assert result.exit_code == 0
@@ -200,18 +308,27 @@ def new_function():
 
     def test_lines_command_stale(self, runner, sample_project, monkeypatch):
         monkeypatch.chdir(sample_project)
-        runner.invoke(cli, ["init", "."])
-        (sample_project / "main.py").write_text("# modified")
+        _init(sample_project)
+        _write(sample_project / "main.py", b"# modified")
         result = runner.invoke(cli, ["lines", "main.py:1-10"])
 
         assert "changed" in result.output.lower() or "stale" in result.output.lower()
 
-    def test_lines_command_invalid_format(self, runner, sample_project, monkeypatch):
-        monkeypatch.chdir(sample_project)
-        runner.invoke(cli, ["init", "."])
-        result = runner.invoke(cli, ["lines", "invalid_format"])
+    def test_lines_command_invalid_format(self, indexed_project, monkeypatch):
+        monkeypatch.chdir(indexed_project)
 
-        assert result.exit_code == 1
+        assert _exit_code(["lines", "invalid_format"]) == 1
+
+    def test_exit_code_reports_usage_errors_and_ctx_exit(self, monkeypatch):
+        assert _exit_code(["no-such-command"]) == 2
+
+        @click.command("exits-three")
+        @click.pass_context
+        def exits_three(ctx):
+            ctx.exit(3)
+
+        monkeypatch.setitem(cli.commands, "exits-three", exits_three)
+        assert _exit_code(["exits-three"]) == 3
 
     def test_no_codemap_error(self, runner, tmp_path, monkeypatch):
         monkeypatch.chdir(tmp_path)
@@ -220,9 +337,8 @@ def new_function():
         assert result.exit_code == 1
         assert "init" in result.output.lower()
 
-    def test_stats_command(self, runner, sample_project, monkeypatch):
-        monkeypatch.chdir(sample_project)
-        runner.invoke(cli, ["init", "."])
+    def test_stats_command(self, runner, indexed_project, monkeypatch):
+        monkeypatch.chdir(indexed_project)
         result = runner.invoke(cli, ["stats"])
 
         assert result.exit_code == 0
@@ -230,15 +346,12 @@ def new_function():
         assert "Total files" in result.output
         assert "Total symbols" in result.output
 
-    def test_stats_shows_directories(self, runner, tmp_path, monkeypatch):
+    def test_stats_shows_directories(self, runner, src_lib_layout, tmp_path, monkeypatch):
         """Test that stats command shows indexed directories."""
-        (tmp_path / "src").mkdir()
-        (tmp_path / "src" / "main.py").write_text("def main(): pass")
-        (tmp_path / "lib").mkdir()
-        (tmp_path / "lib" / "utils.py").write_text("def utils(): pass")
+        project = _link_copy(src_lib_layout, tmp_path)
 
-        monkeypatch.chdir(tmp_path)
-        runner.invoke(cli, ["init", "."])
+        monkeypatch.chdir(project)
+        _init(project)
         result = runner.invoke(cli, ["stats"])
 
         assert result.exit_code == 0
@@ -1,6 +1,6 @@
 """Tests for the C++ parser."""
 
-import os
+from pathlib import Path
 
 import pytest
 
@@ -9,16 +9,16 @@ pytest.importorskip("tree_sitter_cpp")
 
 from codemap.parsers.cpp_parser import CppParser
 
+# Shares session and module fixtures, so run on a single xdist worker
+pytestmark = pytest.mark.xdist_group(name="cpp")
 
-class TestCppParser:
-    """Tests for CppParser class."""
+FIXTURE_PATH = Path(__file__).parent / "fixtures" / "sample_module.cpp"
+try:
+    FIXTURE_SRC = FIXTURE_PATH.read_text(encoding="utf-8")
+except FileNotFoundError:
+    FIXTURE_SRC = None
 
-    @pytest.fixture
-    def parser(self):
-        return CppParser()
-
-    def test_parse_simple_class(self, parser):
-        source = '''
+SIMPLE_CLASS_SRC = '''
 /** A simple class. */
 class Point {
 public:
@@ -27,50 +27,53 @@ private:
     int x_;
 };
 '''
-        symbols = parser.parse(source)
 
-        assert len(symbols) == 1
-        assert symbols[0].name == "Point"
-        assert symbols[0].type == "class"
-        assert symbols[0].children is not None
-        assert len(symbols[0].children) == 1
-        assert symbols[0].children[0].name == "getX"
-        assert symbols[0].children[0].type == "method"
-
-    def test_parse_struct(self, parser):
-        source = '''
+STRUCT_SRC = '''
 /* A simple struct */
 struct Vector {
     double x, y, z;
     double length() const { return 0; }
 };
 '''
-        symbols = parser.parse(source)
 
-        assert len(symbols) == 1
-        assert symbols[0].name == "Vector"
-        assert symbols[0].type == "struct"
-        assert symbols[0].children is not None
-        assert len(symbols[0].children) == 1
+ENUM_SRC = '''
+enum Status {
+    Ok,
+    Error
+};
+'''
 
-    def test_parse_namespace(self, parser):
-        source = '''
+ENUM_CLASS_SRC = '''
+enum class Color {
+    Red,
+    Green,
+    Blue
+};
+'''
+
+TEMPLATE_FUNCTION_SRC = '''
+template<typename T>
+void swap(T& a, T& b) {
+    T temp = a;
+    a = b;
+    b = temp;
+}
+'''
+
+POINTER_RETURN_SRC = '''
+Point* createPoint() {
+    return new Point();
+}
+'''
+
+
+NAMESPACE_SRC = '''
 namespace math {
     int add(int a, int b) { return a + b; }
 }
 '''
-        symbols = parser.parse(source)
-
-        assert len(symbols) == 1
-        assert symbols[0].name == "math"
-        assert symbols[0].type == "namespace"
-        assert symbols[0].children is not None
-        assert len(symbols[0].children) == 1
-        assert symbols[0].children[0].name == "add"
-        assert symbols[0].children[0].type == "function"
 
-    def test_parse_namespace_with_class(self, parser):
-        source = '''
+NAMESPACE_WITH_CLASS_SRC = '''
 namespace utils {
     class Helper {
     public:
@@ -78,106 +81,124 @@ namespace utils {
     };
 }
 '''
-        symbols = parser.parse(source)
 
-        assert len(symbols) == 1
-        assert symbols[0].name == "utils"
-        assert symbols[0].type == "namespace"
-        assert symbols[0].children[0].name == "Helper"
-        assert symbols[0].children[0].type == "class"
-
-    def test_parse_enum(self, parser):
-        source = '''
-enum Status {
-    Ok,
-    Error
+TEMPLATE_CLASS_SRC = '''
+template<typename T>
+class Container {
+public:
+    void add(T item) {}
+    size_t size() const { return 0; }
 };
 '''
-        symbols = parser.parse(source)
 
-        assert len(symbols) == 1
-        assert symbols[0].name == "Status"
-        assert symbols[0].type == "enum"
+TOP_LEVEL_FUNCTION_SRC = '''
+/* Add two numbers */
+int add(int a, int b) {
+    return a + b;
+}
+'''
 
-    def test_parse_enum_class(self, parser):
-        source = '''
-enum class Color {
-    Red,
-    Green,
-    Blue
-};
+MULTIPLE_CLASSES_SRC = '''
+class A { void foo() {} };
+class B { void bar() {} };
+class C { void baz() {} };
 '''
-        symbols = parser.parse(source)
 
-        assert len(symbols) == 1
-        assert symbols[0].name == "Color"
-        assert symbols[0].type == "enum"
+ANONYMOUS_CLASS_SRC = '''
+class {
+    int x;
+} instance;
+'''
 
-    def test_parse_template_class(self, parser):
-        source = '''
-template<typename T>
-class Container {
+DOCSTRING_EXTRACTION_SRC = '''
+/**
+ * Calculate the sum.
+ * @param a First number
+ * @param b Second number
+ * @return The sum
+ */
+int sum(int a, int b) {
+    return a + b;
+}
+'''
+
+CLASS_WITH_CONSTRUCTOR_SRC = '''
+class Point {
 public:
-    void add(T item) {}
-    size_t size() const { return 0; }
+    Point(int x, int y) : x_(x), y_(y) {}
+    int getX() const { return x_; }
+private:
+    int x_, y_;
 };
 '''
+
+
+class TestCppParser:
+    """Tests for CppParser class."""
+
+    @pytest.fixture(scope="module")
+    def parser(self):
+        return CppParser()
+
+    @pytest.mark.parametrize(
+        "source,name,type_,children",
+        [
+            (SIMPLE_CLASS_SRC, "Point", "class", [("getX", "method")]),
+            (STRUCT_SRC, "Vector", "struct", [("length", "method")]),
+            (ENUM_SRC, "Status", "enum", []),
+            (ENUM_CLASS_SRC, "Color", "enum", []),
+            (TEMPLATE_FUNCTION_SRC, "swap", "template_function", []),
+            (POINTER_RETURN_SRC, "createPoint", "function", []),
+        ],
+        ids=["class", "struct", "enum", "enum_class", "template_function", "pointer_return"],
+    )
+    def test_parse_top_level_symbol(self, parser, source, name, type_, children):
         symbols = parser.parse(source)
 
         assert len(symbols) == 1
-        assert symbols[0].name == "Container"
-        assert symbols[0].type == "template_class"
+        assert symbols[0].name == name
+        assert symbols[0].type == type_
+        assert [(c.name, c.type) for c in symbols[0].children or []] == children
+
+    def test_parse_namespace(self, parser):
+        symbols = parser.parse(NAMESPACE_SRC)
+
+        assert len(symbols) == 1
+        assert symbols[0].name == "math"
+        assert symbols[0].type == "namespace"
         assert symbols[0].children is not None
-        assert len(symbols[0].children) == 2
+        assert len(symbols[0].children) == 1
+        assert symbols[0].children[0].name == "add"
+        assert symbols[0].children[0].type == "function"
 
-    def test_parse_template_function(self, parser):
-        source = '''
-template<typename T>
-void swap(T& a, T& b) {
-    T temp = a;
-    a = b;
-    b = temp;
-}
-'''
-        symbols = parser.parse(source)
+    def test_parse_namespace_with_class(self, parser):
+        symbols = parser.parse(NAMESPACE_WITH_CLASS_SRC)
 
         assert len(symbols) == 1
-        assert symbols[0].name == "swap"
-        assert symbols[0].type == "template_function"
+        assert symbols[0].name == "utils"
+        assert symbols[0].type == "namespace"
+        assert symbols[0].children[0].name == "Helper"
+        assert symbols[0].children[0].type == "class"
 
-    def test_parse_top_level_function(self, parser):
-        source = '''
-/* Add two numbers */
-int add(int a, int b) {
-    return a + b;
-}
-'''
-        symbols = parser.parse(source)
+    def test_parse_template_class(self, parser):
+        symbols = parser.parse(TEMPLATE_CLASS_SRC)
 
         assert len(symbols) == 1
-        assert symbols[0].name == "add"
-        assert symbols[0].type == "function"
-        assert symbols[0].signature == "(int a, int b)"
+        assert symbols[0].name == "Container"
+        assert symbols[0].type == "template_class"
+        assert symbols[0].children is not None
+        assert len(symbols[0].children) == 2
 
-    def test_parse_function_with_pointer_return(self, parser):
-        source = '''
-Point* createPoint() {
-    return new Point();
-}
-'''
-        symbols = parser.parse(source)
+    def test_parse_top_level_function(self, parser):
+        symbols = parser.parse(TOP_LEVEL_FUNCTION_SRC)
 
         assert len(symbols) == 1
-        assert symbols[0].name == "createPoint"
+        assert symbols[0].name == "add"
         assert symbols[0].type == "function"
+        assert symbols[0].signature == "(int a, int b)"
 
     def test_parse_multiple_classes(self, parser):
-        source = '''
-class A { void foo() {} };
-class B { void bar() {} };
-class C { void baz() {} };
-'''
-        symbols = parser.parse(source)
+        symbols = parser.parse(MULTIPLE_CLASSES_SRC)
 
         assert len(symbols) == 3
         names = [s.name for s in symbols]
@@ -186,23 +207,15 @@ class C { void baz() {} };
         assert "C" in names
 
     def test_skip_anonymous_class(self, parser):
-        source = '''
-class {
-    int x;
-} instance;
-'''
-        symbols = parser.parse(source)
+        symbols = parser.parse(ANONYMOUS_CLASS_SRC)
 
         assert len(symbols) == 0
 
     def test_parse_fixture_file(self, parser):
         """Test parsing the C++ fixture file."""
-        fixture_path = os.path.join(
-            os.path.dirname(__file__), "fixtures", "sample_module.cpp"
-        )
-        with open(fixture_path, "r") as f:
-            source = f.read()
-        symbols = parser.parse(source, fixture_path)
+        if FIXTURE_SRC is None:
+            pytest.skip("sample_module.cpp fixture missing")
+        symbols = parser.parse(FIXTURE_SRC, str(FIXTURE_PATH))
 
         # Should find multiple symbols
         assert len(symbols) >= 8
@@ -226,18 +239,7 @@ class {
         assert "function" in types
 
     def test_docstring_extraction(self, parser):
-        source = '''
-/**
- * Calculate the sum.
- * @param a First number
- * @param b Second number
- * @return The sum
- */
-int sum(int a, int b) {
-    return a + b;
-}
-'''
-        symbols = parser.parse(source)
+        symbols = parser.parse(DOCSTRING_EXTRACTION_SRC)
 
         assert len(symbols) == 1
         assert symbols[0].docstring is not None
@@ -255,16 +257,7 @@ int sum(int a, int b) {
         assert parser.language == "cpp"
 
     def test_class_with_constructor(self, parser):
-        source = '''
-class Point {
-public:
-    Point(int x, int y) : x_(x), y_(y) {}
-    int getX() const { return x_; }
-private:
-    int x_, y_;
-};
-'''
-        symbols = parser.parse(source)
+        symbols = parser.parse(CLASS_WITH_CONSTRUCTOR_SRC)
 
         assert len(symbols) == 1
         assert symbols[0].name == "Point"
@@ -7,84 +7,35 @@ pytest.importorskip("tree_sitter_c_sharp")
 
 from codemap.parsers.csharp_parser import CSharpParser
 
+# Shares session and module fixtures, so run on a single xdist worker
+pytestmark = pytest.mark.xdist_group(name="csharp")
 
-class TestCSharpParser:
-    """Tests for CSharpParser class."""
-
-    @pytest.fixture
-    def parser(self):
-        return CSharpParser()
 
-    def test_parse_simple_class(self, parser):
-        source = '''
+CLASS_SRC = '''
 public class User
 {
     public int Id { get; set; }
     public string Name { get; set; }
 }
 '''
-        symbols = parser.parse(source)
-
-        assert len(symbols) == 1
-        assert symbols[0].name == "User"
-        assert symbols[0].type == "class"
-
-    def test_parse_class_with_methods(self, parser):
-        source = '''
-public class Calculator
-{
-    public int Add(int a, int b)
-    {
-        return a + b;
-    }
 
-    public int Subtract(int a, int b)
-    {
-        return a - b;
-    }
-}
-'''
-        symbols = parser.parse(source)
-
-        assert len(symbols) == 1
-        calc = symbols[0]
-        assert calc.name == "Calculator"
-        assert calc.type == "class"
-        assert len(calc.children) == 2
-        method_names = [c.name for c in calc.children]
-        assert "Add" in method_names
-        assert "Subtract" in method_names
-
-    def test_parse_interface(self, parser):
-        source = '''
+INTERFACE_SRC = '''
 public interface IUserService
 {
     User GetUser(int id);
     void CreateUser(string name);
 }
 '''
-        symbols = parser.parse(source)
 
-        assert len(symbols) == 1
-        assert symbols[0].name == "IUserService"
-        assert symbols[0].type == "interface"
-
-    def test_parse_struct(self, parser):
-        source = '''
+STRUCT_SRC = '''
 public struct Point
 {
     public int X;
     public int Y;
 }
 '''
-        symbols = parser.parse(source)
 
-        assert len(symbols) == 1
-        assert symbols[0].name == "Point"
-        assert symbols[0].type == "struct"
-
-    def test_parse_enum(self, parser):
-        source = '''
+ENUM_SRC = '''
 public enum Status
 {
     Active,
@@ -92,14 +43,24 @@ public enum Status
     Pending
 }
 '''
-        symbols = parser.parse(source)
 
-        assert len(symbols) == 1
-        assert symbols[0].name == "Status"
-        assert symbols[0].type == "enum"
 
-    def test_parse_async_method(self, parser):
-        source = '''
+CLASS_WITH_METHODS_SRC = '''
+public class Calculator
+{
+    public int Add(int a, int b)
+    {
+        return a + b;
+    }
+
+    public int Subtract(int a, int b)
+    {
+        return a - b;
+    }
+}
+'''
+
+ASYNC_METHOD_SRC = '''
 public class Service
 {
     public async Task<User> GetUserAsync(int id)
@@ -109,18 +70,8 @@ public class Service
     }
 }
 '''
-        symbols = parser.parse(source)
 
-        assert len(symbols) == 1
-        service = symbols[0]
-        assert len(service.children) >= 1
-        method = service.children[0]
-        assert method.name == "GetUserAsync"
-        # Note: async detection depends on parser implementation
-        assert method.type in ("method", "async_method")
-
-    def test_parse_constructor(self, parser):
-        source = '''
+CONSTRUCTOR_SRC = '''
 public class User
 {
     private string name;
@@ -136,17 +87,8 @@ public class User
     }
 }
 '''
-        symbols = parser.parse(source)
 
-        assert len(symbols) == 1
-        user = symbols[0]
-        assert user.name == "User"
-        method_names = [c.name for c in user.children]
-        assert "User" in method_names  # Constructor
-        assert "GetName" in method_names
-
-    def test_parse_multiple_classes(self, parser):
-        source = '''
+MULTIPLE_CLASSES_SRC = '''
 class First
 {
     void Method1() {}
@@ -162,18 +104,8 @@ class Third
     void Method3() {}
 }
 '''
-        symbols = parser.parse(source)
 
-        assert len(symbols) == 3
-        names = [s.name for s in symbols]
-        assert "First" in names
-        assert "Second" in names
-        assert "Third" in names
-
-    def test_parse_fixture_file(self, parser):
-        """Test parsing the C# fixture file without namespace wrapper."""
-        # Test with code that doesn't have a namespace wrapper
-        source = '''
+MIXED_DECLARATIONS_SRC = '''
 public class User
 {
     public int Id { get; set; }
@@ -197,8 +129,79 @@ public enum UserStatus
     Inactive
 }
 '''
+
+
+class TestCSharpParser:
+    """Tests for CSharpParser class."""
+
+    @pytest.fixture(scope="module")
+    def parser(self):
+        return CSharpParser()
+
+    @pytest.mark.parametrize(
+        "source,name,type_",
+        [
+            (CLASS_SRC, "User", "class"),
+            (INTERFACE_SRC, "IUserService", "interface"),
+            (STRUCT_SRC, "Point", "struct"),
+            (ENUM_SRC, "Status", "enum"),
+        ],
+        ids=["class", "interface", "struct", "enum"],
+    )
+    def test_parse_top_level_symbol(self, parser, source, name, type_):
         symbols = parser.parse(source)
 
+        assert len(symbols) == 1
+        assert symbols[0].name == name
+        assert symbols[0].type == type_
+
+    def test_parse_class_with_methods(self, parser):
+        symbols = parser.parse(CLASS_WITH_METHODS_SRC)
+
+        assert len(symbols) == 1
+        calc = symbols[0]
+        assert calc.name == "Calculator"
+        assert calc.type == "class"
+        assert len(calc.children) == 2
+        method_names = [c.name for c in calc.children]
+        assert "Add" in method_names
+        assert "Subtract" in method_names
+
+    def test_parse_async_method(self, parser):
+        symbols = parser.parse(ASYNC_METHOD_SRC)
+
+        assert len(symbols) == 1
+        service = symbols[0]
+        assert len(service.children) >= 1
+        method = service.children[0]
+        assert method.name == "GetUserAsync"
+        # Note: async detection depends on parser implementation
+        assert method.type in ("method", "async_method")
+
+    def test_parse_constructor(self, parser):
+        symbols = parser.parse(CONSTRUCTOR_SRC)
+
+        assert len(symbols) == 1
+        user = symbols[0]
+        assert user.name == "User"
+        method_names = [c.name for c in user.children]
+        assert "User" in method_names  # Constructor
+        assert "GetName" in method_names
+
+    def test_parse_multiple_classes(self, parser):
+        symbols = parser.parse(MULTIPLE_CLASSES_SRC)
+
+        assert len(symbols) == 3
+        names = [s.name for s in symbols]
+        assert "First" in names
+        assert "Second" in names
+        assert "Third" in names
+
+    def test_parse_fixture_file(self, parser):
+        """Test parsing the C# fixture file without namespace wrapper."""
+        # Test with code that doesn't have a namespace wrapper
+        symbols = parser.parse(MIXED_DECLARATIONS_SRC)
+
         # Should find multiple symbols
         assert len(symbols) >= 3
 
@@ -12,18 +12,20 @@ pytestmark = pytest.mark.skipif(
     reason="tree-sitter-css not installed"
 )
 
+# Read once, when the module is imported
+SAMPLE_CSS = (Path(__file__).parent / "fixtures" / "sample_styles.css").read_bytes().decode("utf-8")
 
-@pytest.fixture
+
+@pytest.fixture(scope="module")
 def parser():
     """Create a CSS parser instance."""
     return CssParser()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_css():
     """Load sample CSS fixture."""
-    fixture_path = Path(__file__).parent / "fixtures" / "sample_styles.css"
-    return fixture_path.read_text()
+    return SAMPLE_CSS
 
 
 class TestCssParser:
@@ -39,51 +41,27 @@ class TestCssParser:
         """Test parsing empty CSS."""
         symbols = parser.parse("")
         assert symbols == []
-
-    def test_parse_class_selector(self, parser):
-        """Test parsing class selector."""
-        css = ".button { color: red; }"
-        symbols = parser.parse(css)
-
-        assert len(symbols) == 1
-        assert symbols[0].name == ".button"
-        assert symbols[0].type == "class"
-
-    def test_parse_id_selector(self, parser):
-        """Test parsing ID selector."""
-        css = "#header { background: blue; }"
-        symbols = parser.parse(css)
-
-        assert len(symbols) == 1
-        assert symbols[0].name == "#header"
-        assert symbols[0].type == "id"
-
-    def test_parse_element_selector(self, parser):
-        """Test parsing element selector."""
-        css = "body { margin: 0; }"
-        symbols = parser.parse(css)
-
-        assert len(symbols) == 1
-        assert symbols[0].name == "body"
-        assert symbols[0].type == "selector"
-
-    def test_parse_pseudo_selector(self, parser):
-        """Test parsing pseudo selector."""
-        css = ":root { --color: red; }"
-        symbols = parser.parse(css)
-
-        assert len(symbols) == 1
-        assert symbols[0].name == ":root"
-        assert symbols[0].type == "pseudo"
-
-    def test_parse_complex_selector(self, parser):
-        """Test parsing complex selector."""
-        css = ".nav ul li a { color: blue; }"
+        assert parser.parse(" \n\t\n") == []
+
+    @pytest.mark.parametrize(
+        "css,name,type_",
+        [
+            (".button { color: red; }", ".button", "class"),
+            ("#header { background: blue; }", "#header", "id"),
+            ("body { margin: 0; }", "body", "selector"),
+            (":root { --color: red; }", ":root", "pseudo"),
+            # First part of a compound selector determines the type
+            (".nav ul li a { color: blue; }", ".nav ul li a", "class"),
+        ],
+        ids=["class", "id", "element", "pseudo", "complex"],
+    )
+    def test_parse_selector(self, parser, css, name, type_):
+        """Test parsing a single rule's selector."""
         symbols = parser.parse(css)
 
         assert len(symbols) == 1
-        assert symbols[0].name == ".nav ul li a"
-        assert symbols[0].type == "class"  # First part determines type
+        assert symbols[0].name == name
+        assert symbols[0].type == type_
 
     def test_parse_multiple_selectors(self, parser):
         """Test parsing rule with multiple selectors."""
@@ -197,6 +175,7 @@ class TestCssParser:
         assert len(symbols) == 1
         assert symbols[0].docstring == "Primary button style"
 
+    @pytest.mark.slow
     def test_parse_sample_fixture(self, parser, sample_css):
         """Test parsing the sample CSS fixture."""
         symbols = parser.parse(sample_css)
@@ -1,18 +1,23 @@
 """Tests for the Go parser."""
 
-import pytest
+from pathlib import Path
 
-# Skip all tests if tree-sitter-go is not installed
-pytest.importorskip("tree_sitter_go")
+import pytest
 
-from codemap.parsers.go_parser import GoParser
+FIXTURE_PATH = Path(__file__).parent / "fixtures" / "sample_module.go"
+FIXTURE_SRC = FIXTURE_PATH.read_bytes().decode("utf-8")
 
 
 class TestGoParser:
     """Tests for GoParser class."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def parser(self):
+        # Imported here so collecting (or deselecting) these tests never
+        # loads the Go grammar; skips every test if it is not installed
+        pytest.importorskip("tree_sitter_go")
+        from codemap.parsers.go_parser import GoParser
+
         return GoParser()
 
     def test_parse_simple_function(self, parser):
@@ -94,16 +99,10 @@ func Multiply(a, b int) int {
         assert "Subtract" in names
         assert "Multiply" in names
 
+    @pytest.mark.slow
     def test_parse_fixture_file(self, parser):
         """Test parsing the Go fixture file."""
-        import os
-        fixture_path = os.path.join(
-            os.path.dirname(__file__), "fixtures", "sample_module.go"
-        )
-        with open(fixture_path, "r") as f:
-            source = f.read()
-
-        symbols = parser.parse(source, fixture_path)
+        symbols = parser.parse(FIXTURE_SRC, str(FIXTURE_PATH))
 
         # Should find multiple symbols
         assert len(symbols) > 0
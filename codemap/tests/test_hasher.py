@@ -1,39 +1,32 @@
 """Tests for the hasher module."""
 
+import io
+
 import pytest
 from pathlib import Path
 
-from codemap.core.hasher import hash_file, hash_content
+from codemap.core import hasher
+from codemap.core.hasher import hash_file, hash_files, hash_content, _hash_stream
 
 
 class TestHashContent:
     """Tests for hash_content function."""
 
-    def test_hash_content_returns_12_chars(self):
-        content = b"hello world"
-        result = hash_content(content)
+    @pytest.mark.parametrize(
+        "payload",
+        [b"hello world", b"test content", b"", "Hello, 世界!".encode("utf-8")],
+        ids=["ascii", "text", "empty", "unicode"],
+    )
+    def test_hash_content_shape(self, payload):
+        result = hash_content(payload)
         assert len(result) == 12
-
-    def test_hash_content_is_deterministic(self):
-        content = b"test content"
-        result1 = hash_content(content)
-        result2 = hash_content(content)
-        assert result1 == result2
+        assert hash_content(payload) == result
 
     def test_hash_content_different_for_different_content(self):
         content1 = b"hello"
         content2 = b"world"
         assert hash_content(content1) != hash_content(content2)
 
-    def test_hash_content_empty_bytes(self):
-        result = hash_content(b"")
-        assert len(result) == 12
-
-    def test_hash_content_unicode(self):
-        content = "Hello, 世界!".encode("utf-8")
-        result = hash_content(content)
-        assert len(result) == 12
-
 
 class TestHashFile:
     """Tests for hash_file function."""
@@ -59,7 +52,50 @@ class TestHashFile:
             hash_file(nonexistent)
 
     def test_hash_file_binary_content(self, tmp_path: Path):
+        content = bytes(range(256))
         test_file = tmp_path / "binary.bin"
-        test_file.write_bytes(bytes(range(256)))
-        result = hash_file(test_file)
-        assert len(result) == 12
+        test_file.write_bytes(content)
+        assert hash_file(test_file) == hash_content(content)
+
+    def test_hash_file_larger_than_chunk(self, tmp_path: Path):
+        content = bytes(range(256)) * (hasher._CHUNK_SIZE // 256 + 3)
+        test_file = tmp_path / "large.bin"
+        test_file.write_bytes(content)
+        assert hash_file(test_file) == hash_content(content)
+
+    def test_hash_stream_returns_12_chars(self):
+        assert len(_hash_stream(io.BytesIO(b"hello world"))) == 12
+
+    def test_hash_stream_empty(self):
+        assert _hash_stream(io.BytesIO(b"")) == hash_content(b"")
+
+    def test_hash_stream_across_chunks(self, monkeypatch):
+        monkeypatch.setattr(hasher, "_CHUNK_SIZE", 7)
+        content = bytes(range(256)) * 3
+        assert _hash_stream(io.BytesIO(content)) == hash_content(content)
+
+    def test_hash_stream_larger_than_chunk(self, tmp_path: Path):
+        content = bytes(range(256)) * (hasher._CHUNK_SIZE // 256 + 3)
+        test_file = tmp_path / "large.bin"
+        test_file.write_bytes(content)
+        with open(test_file, "rb") as f:
+            assert _hash_stream(f) == hash_content(content)
+
+    def test_hash_file_streams_large_files(self, tmp_path: Path, monkeypatch):
+        monkeypatch.setattr(hasher, "_CHUNK_SIZE", 64)
+        content = bytes(range(256)) * 4
+        test_file = tmp_path / "large.bin"
+        test_file.write_bytes(content)
+        assert hash_file(test_file) == hash_content(content)
+
+    def test_hash_files_matches_hash_file(self, tmp_path: Path):
+        paths = []
+        for i in range(5):
+            path = tmp_path / f"f{i}.txt"
+            path.write_bytes(b"x" * i * 1000)
+            paths.append(path)
+        missing = tmp_path / "missing.txt"
+
+        result = hash_files(paths + [missing], max_workers=3)
+
+        assert result == {path: hash_file(path) for path in paths}
@@ -12,18 +12,20 @@ pytestmark = pytest.mark.skipif(
     reason="tree-sitter-html not installed"
 )
 
+# Read once, when the module is imported
+SAMPLE_HTML = (Path(__file__).parent / "fixtures" / "sample_page.html").read_bytes().decode("utf-8")
 
-@pytest.fixture
+
+@pytest.fixture(scope="module")
 def parser():
     """Create an HTML parser instance."""
     return HtmlParser()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_html():
     """Load sample HTML fixture."""
-    fixture_path = Path(__file__).parent / "fixtures" / "sample_page.html"
-    return fixture_path.read_text()
+    return SAMPLE_HTML
 
 
 class TestHtmlParser:
@@ -40,6 +42,7 @@ class TestHtmlParser:
         """Test parsing empty HTML."""
         symbols = parser.parse("")
         assert symbols == []
+        assert parser.parse(" \n\t\n") == []
 
     def test_parse_minimal_html(self, parser):
         """Test parsing minimal HTML document."""
@@ -47,77 +50,28 @@ class TestHtmlParser:
         symbols = parser.parse(html)
         assert symbols == []  # No semantic elements or IDs
 
-    def test_parse_element_with_id(self, parser):
-        """Test parsing elements with ID attributes."""
-        html = '<div id="main-content">Hello</div>'
-        symbols = parser.parse(html)
-
-        assert len(symbols) == 1
-        assert symbols[0].name == "#main-content"
-        assert symbols[0].type == "id"
-
-    def test_parse_semantic_header(self, parser):
-        """Test parsing semantic header element."""
-        html = '<header class="site-header">Content</header>'
-        symbols = parser.parse(html)
-
-        assert len(symbols) == 1
-        assert symbols[0].name == "<header.site-header>"
-        assert symbols[0].type == "element"
-
-    def test_parse_semantic_nav(self, parser):
-        """Test parsing semantic nav element."""
-        html = "<nav><ul><li>Item</li></ul></nav>"
-        symbols = parser.parse(html)
-
-        assert len(symbols) == 1
-        assert symbols[0].name == "<nav>"
-        assert symbols[0].type == "element"
-
-    def test_parse_semantic_main(self, parser):
-        """Test parsing semantic main element."""
-        html = "<main>Main content here</main>"
-        symbols = parser.parse(html)
-
-        assert len(symbols) == 1
-        assert symbols[0].name == "<main>"
-        assert symbols[0].type == "element"
-
-    def test_parse_semantic_section(self, parser):
-        """Test parsing semantic section element."""
-        html = '<section id="intro">Introduction</section>'
-        symbols = parser.parse(html)
-
-        assert len(symbols) == 1
-        assert symbols[0].name == "#intro"  # ID takes precedence
-        assert symbols[0].type == "id"
-
-    def test_parse_semantic_article(self, parser):
-        """Test parsing semantic article element."""
-        html = "<article><h1>Title</h1><p>Content</p></article>"
-        symbols = parser.parse(html)
-
-        assert len(symbols) == 1
-        assert symbols[0].name == "<article>"
-        assert symbols[0].type == "element"
-
-    def test_parse_semantic_aside(self, parser):
-        """Test parsing semantic aside element."""
-        html = '<aside class="sidebar">Sidebar</aside>'
-        symbols = parser.parse(html)
-
-        assert len(symbols) == 1
-        assert symbols[0].name == "<aside.sidebar>"
-        assert symbols[0].type == "element"
-
-    def test_parse_semantic_footer(self, parser):
-        """Test parsing semantic footer element."""
-        html = "<footer>Copyright 2025</footer>"
-        symbols = parser.parse(html)
-
-        assert len(symbols) == 1
-        assert symbols[0].name == "<footer>"
-        assert symbols[0].type == "element"
+    @pytest.mark.parametrize(
+        "html,name,type_",
+        [
+            ('<div id="main-content">Hello</div>', "#main-content", "id"),
+            ('<header class="site-header">Content</header>', "<header.site-header>", "element"),
+            ("<nav><ul><li>Item</li></ul></nav>", "<nav>", "element"),
+            ("<main>Main content here</main>", "<main>", "element"),
+            # ID takes precedence over the semantic tag
+            ('<section id="intro">Introduction</section>', "#intro", "id"),
+            ("<article><h1>Title</h1><p>Content</p></article>", "<article>", "element"),
+            ('<aside class="sidebar">Sidebar</aside>', "<aside.sidebar>", "element"),
+            ("<footer>Copyright 2025</footer>", "<footer>", "element"),
+        ],
+        ids=["id", "header", "nav", "main", "section", "article", "aside", "footer"],
+    )
+    def test_parse_single_element(self, parser, html, name, type_):
+        """Test parsing an element with an ID or a semantic tag."""
+        symbols = parser.parse(html)
+
+        assert len(symbols) == 1
+        assert symbols[0].name == name
+        assert symbols[0].type == type_
 
     def test_parse_form_element(self, parser):
         """Test parsing form element."""
@@ -150,6 +104,16 @@ class TestHtmlParser:
         assert len(symbols[0].children[0].children) == 1
         assert symbols[0].children[0].children[0].name == "#logo"
 
+    def test_parse_deep_unindexed_wrappers(self, parser):
+        """Test that deep plain-div nesting is walked once, not per ancestor."""
+        depth = 300
+        html = "<main>" + "<div>" * depth + '<p id="deep">x</p>' + "</div>" * depth + "</main>"
+        symbols = parser.parse(html)
+
+        assert [s.name for s in symbols] == ["<main>"]
+        assert [c.name for c in symbols[0].children] == ["#deep"]
+        assert symbols[0].children[0].children is None
+
     def test_parse_line_numbers(self, parser):
         """Test that line numbers are correctly extracted."""
         html = '''<html>
@@ -176,6 +140,7 @@ class TestHtmlParser:
         assert 'type="email"' in sig
         assert 'name="email"' in sig
 
+    @pytest.mark.slow
     def test_parse_sample_fixture(self, parser, sample_html):
         """Test parsing the sample HTML fixture."""
         symbols = parser.parse(sample_html)
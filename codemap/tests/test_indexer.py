@@ -1,11 +1,53 @@
 """Tests for the indexer module."""
 
 import json
+import os
+import threading
 import pytest
 from pathlib import Path
 
-from codemap.core.indexer import Indexer
+from codemap.core.hasher import hash_files
+from codemap.core.indexer import Indexer, _parse_source
 from codemap.core.map_store import MapStore
+from codemap.parsers.python_parser import PythonParser
+from codemap.utils.file_utils import _get_extensions_for_languages, get_language
+
+
+@pytest.fixture
+def record_parses(monkeypatch):
+    """Return a function that records which files an indexer's Python parser parses."""
+
+    def install(indexer: Indexer) -> list[str]:
+        parsed = []
+        parse = indexer._parsers["python"].parse
+
+        def recording_parse(source, filepath=""):
+            parsed.append(Path(filepath).name)
+            return parse(source, filepath)
+
+        monkeypatch.setattr(indexer._parsers["python"], "parse", recording_parse)
+        return parsed
+
+    return install
+
+
+@pytest.fixture
+def record_flushes(monkeypatch):
+    """Return a function that makes an indexer set an Event after each flush_pending()."""
+
+    def install(indexer: Indexer) -> threading.Event:
+        flushed = threading.Event()
+        flush_pending = indexer.flush_pending
+
+        def recording_flush():
+            result = flush_pending()
+            flushed.set()
+            return result
+
+        monkeypatch.setattr(indexer, "flush_pending", recording_flush)
+        return flushed
+
+    return install
 
 
 class TestIndexer:
@@ -106,6 +148,35 @@ class Class1:
         # Should only index src/main.py
         assert result["total_files"] == 1
 
+    def test_excluded_directories_not_walked(self, tmp_path: Path, monkeypatch):
+        """Test that excluded directories are pruned rather than listed and filtered."""
+        (tmp_path / "src" / "migrations").mkdir(parents=True)
+        (tmp_path / "src" / "migrations" / "0001.py").write_text("def up(): pass")
+        (tmp_path / "src" / "main.py").write_text("def main(): pass")
+        (tmp_path / "node_modules" / "pkg").mkdir(parents=True)
+        (tmp_path / "node_modules" / "pkg" / "index.js").write_text("function f() {}")
+
+        walked = []
+        scandir = os.scandir
+
+        def recording_scandir(path):
+            walked.append(Path(path).relative_to(tmp_path))
+            return scandir(path)
+
+        monkeypatch.setattr("codemap.utils.file_utils.os.scandir", recording_scandir)
+        result = Indexer(root=tmp_path).index_all()
+
+        assert result["total_files"] == 1
+        assert Path("src") in walked
+        assert Path("node_modules") not in walked
+        assert Path("src/migrations") not in walked
+
+    def test_discovered_extensions_map_back_to_language(self):
+        """Test that every extension discovered for a language resolves to it."""
+        for language in ["python", "typescript", "javascript", "c", "cpp", "php"]:
+            for ext in _get_extensions_for_languages([language]):
+                assert get_language(Path(f"file{ext.upper()}")) == language
+
     def test_index_filters_by_language(self, tmp_path: Path):
         (tmp_path / "script.py").write_text("def py(): pass")
         (tmp_path / "script.js").write_text("function js() {}")
@@ -163,6 +234,103 @@ def new_function():
         entry = store.get_file("src/module.py")
         assert len(entry.symbols) == 2
 
+    def test_update_file_counts_changed_symbols(self, tmp_path: Path):
+        """Test that symbols_changed counts edited symbols, not the change in total."""
+        test_file = tmp_path / "test.py"
+        test_file.write_text("def keep(): pass\n\ndef edit(a): pass\n")
+
+        indexer = Indexer(root=tmp_path)
+        indexer.index_all()
+
+        # One symbol replaced by another: the total is unchanged
+        test_file.write_text("def keep(): pass\n\ndef edit(a, b): pass\n")
+        assert indexer.update_file(test_file)["symbols_changed"] == 2
+
+        # Moving a symbol down changes its lines, not the symbol
+        test_file.write_text("\n\ndef keep(): pass\n\ndef edit(a, b): pass\n")
+        assert indexer.update_file(test_file)["symbols_changed"] == 0
+
+    def test_schedule_update_coalesces_rapid_writes(self, tmp_path: Path, monkeypatch):
+        """Test that a burst of writes is reindexed once, with one save."""
+        (tmp_path / "src").mkdir()
+        (tmp_path / "lib").mkdir()
+        indexer = Indexer(root=tmp_path)
+        indexer.index_all()
+
+        indexed = []
+        index_file = indexer._index_file
+        saves = []
+        save = indexer.map_store.save
+        monkeypatch.setattr(indexer, "_index_file", lambda p: indexed.append(p) or index_file(p))
+        monkeypatch.setattr(indexer.map_store, "save", lambda: saves.append(1) or save())
+
+        for i in range(20):
+            (tmp_path / "src" / "a.py").write_text(f"def a{i}(): pass")
+            indexer.schedule_update(tmp_path / "src" / "a.py", debounce_seconds=60)
+        (tmp_path / "lib" / "b.py").write_text("def b(): pass")
+        indexer.schedule_update(tmp_path / "lib" / "b.py", debounce_seconds=60)
+        result = indexer.flush_pending()
+
+        assert result == {"updated": 2, "errors": []}
+        assert len(indexed) == 2
+        assert len(saves) == 1
+        assert [s.name for s in indexer.map_store.get_file("src/a.py").symbols] == ["a19"]
+        assert indexer.map_store.manifest.stats["total_files"] == 2
+        assert indexer.flush_pending() == {"updated": 0, "errors": []}
+
+    def test_schedule_update_flushes_after_delay(self, tmp_path: Path, record_flushes):
+        """Test that scheduled updates are applied once the timer fires."""
+        indexer = Indexer(root=tmp_path)
+        indexer.index_all()
+
+        flushed = record_flushes(indexer)
+        (tmp_path / "a.py").write_text("def a(): pass")
+        indexer.schedule_update(tmp_path / "a.py", debounce_seconds=0.05)
+
+        assert flushed.wait(timeout=10)
+        assert indexer.map_store.get_file("a.py") is not None
+        assert MapStore.load(tmp_path).get_file("a.py") is not None
+
+    def test_timer_flush_waits_for_other_updates(self, tmp_path: Path, record_flushes):
+        """Test that a timer flush doesn't run while another thread changes the index."""
+        indexer = Indexer(root=tmp_path)
+        indexer.index_all()
+
+        flushed = record_flushes(indexer)
+        (tmp_path / "a.py").write_text("def a(): pass")
+        with indexer._lock:
+            indexer.schedule_update(tmp_path / "a.py", debounce_seconds=0)
+            assert not flushed.wait(timeout=0.2)
+            assert indexer.map_store.get_file("a.py") is None
+
+        assert flushed.wait(timeout=10)
+        assert indexer.map_store.get_file("a.py") is not None
+
+    def test_update_file_keeps_stats_without_loading_other_maps(self, tmp_path: Path):
+        (tmp_path / "src").mkdir()
+        (tmp_path / "lib").mkdir()
+        (tmp_path / "src" / "a.py").write_text("def a(): pass")
+        (tmp_path / "lib" / "b.py").write_text("def b(): pass\ndef c(): pass")
+
+        Indexer(root=tmp_path).index_all()
+        indexer = Indexer.load_existing(tmp_path)
+
+        (tmp_path / "src" / "a.py").write_text("class A:\n    def m(self): pass")
+        indexer.update_file(tmp_path / "src" / "a.py")
+        (tmp_path / "src" / "new.py").write_text("def n(): pass")
+        indexer.update_file(tmp_path / "src" / "new.py")
+
+        assert "lib" not in indexer.map_store._dir_maps
+        stats = dict(MapStore.load(tmp_path).manifest.stats)
+        assert (stats["total_files"], stats["total_symbols"]) == (3, 5)
+
+        (tmp_path / "src" / "new.py").unlink()
+        indexer.update_file(tmp_path / "src" / "new.py")
+
+        store = MapStore.load(tmp_path)
+        assert store.manifest.stats["total_files"] == 2
+        assert store.manifest.stats["total_symbols"] == 4
+
     def test_update_deleted_file(self, tmp_path: Path):
         # Create and index a file
         test_file = tmp_path / "test.py"
@@ -204,6 +372,40 @@ def new_function():
         stale = indexer.validate_all()
         assert "test.py" in stale
 
+    def test_validate_all_skips_unchanged_stat(self, tmp_path: Path, monkeypatch):
+        """Test that files with their indexed mtime and size aren't read."""
+        test_file = tmp_path / "test.py"
+        test_file.write_text("def func(): pass")
+        os.utime(test_file, ns=(1_600_000_000_000_000_000, 1_600_000_000_000_000_000))
+
+        indexer = Indexer(root=tmp_path)
+        indexer.index_all()
+        assert indexer.map_store.get_file("test.py").mtime_ns == 1_600_000_000_000_000_000
+
+        hashed = []
+        monkeypatch.setattr(
+            "codemap.core.indexer.hash_files",
+            lambda paths: hashed.extend(paths) or hash_files(hashed),
+        )
+        assert indexer.validate_all() == []
+        assert indexer.validate_file("test.py")
+        assert hashed == []
+
+        # Same size, different mtime: hashed, and found stale
+        test_file.write_text("def fun2(): pass")
+        assert indexer.validate_all() == ["test.py"]
+        assert hashed == [tmp_path / "test.py"]
+
+    def test_recent_mtime_not_trusted(self, tmp_path: Path):
+        """Test that a just-written file is always hashed to validate it."""
+        (tmp_path / "test.py").write_text("def func(): pass")
+
+        indexer = Indexer(root=tmp_path)
+        indexer.index_all()
+
+        assert indexer.map_store.get_file("test.py").mtime_ns == 0
+        assert "mtime_ns" not in indexer.map_store.get_file("test.py").to_dict()
+
     def test_validate_file(self, tmp_path: Path):
         test_file = tmp_path / "test.py"
         test_file.write_text("def func(): pass")
@@ -259,6 +461,22 @@ def broken(
         assert valid_entry is not None
         assert len(valid_entry.symbols) == 1
 
+    def test_syntax_error_parsed_once(self):
+        """Test that only content that isn't UTF-8 is parsed a second time."""
+        calls = []
+
+        class BrokenParser(PythonParser):
+            def parse(self, source, filepath=""):
+                calls.append(type(source))
+                raise SyntaxError("invalid syntax")
+
+        assert _parse_source(BrokenParser(), b"def broken(\n", "broken.py") == []
+        assert calls == [bytes]
+
+        calls.clear()
+        assert _parse_source(BrokenParser(), b"def broken(\x80\n", "broken.py") == []
+        assert calls == [bytes, str]
+
     def test_handles_encoding_error(self, tmp_path: Path):
         # Create a file with invalid UTF-8
         test_file = tmp_path / "binary.py"
@@ -270,6 +488,20 @@ def broken(
         # Should handle gracefully
         assert result["total_files"] == 1
 
+    def test_parses_raw_bytes_with_universal_newlines(self, tmp_path: Path):
+        (tmp_path / "crlf.py").write_bytes(b'def f(a,\r\n      b):\r\n    """Doc."""\r\n')
+        (tmp_path / "latin.py").write_bytes(
+            b'# -*- coding: latin-1 -*-\ndef g():\n    """caf\xe9"""\n'
+        )
+
+        indexer = Indexer(root=tmp_path)
+        indexer.index_all()
+
+        crlf = indexer.map_store.get_file("crlf.py").symbols[0]
+        assert crlf.lines == (1, 3)
+        assert crlf.signature == "(a, b)"
+        assert indexer.map_store.get_file("latin.py").symbols[0].docstring == "café"
+
     def test_update_all_stale(self, tmp_path: Path):
         (tmp_path / "file1.py").write_text("def f1(): pass")
         (tmp_path / "file2.py").write_text("def f2(): pass")
@@ -304,3 +536,113 @@ def broken(
         # Should only have file2.py
         assert len(files) == 1
         assert files[0][0] == "file2.py"
+
+    def test_reindex_reuses_parse_cache(self, tmp_path: Path, record_parses):
+        """Test that unchanged files are not parsed again by a later index_all."""
+        (tmp_path / "same.py").write_text("def same(): pass")
+        (tmp_path / "edited.py").write_text("def old(): pass")
+
+        indexer = Indexer(root=tmp_path)
+        indexer.index_all()
+        indexer.close()
+
+        (tmp_path / "edited.py").write_text("def new(): pass")
+
+        indexer = Indexer(root=tmp_path)
+        parsed = record_parses(indexer)
+        result = indexer.index_all()
+        indexer.close()
+
+        assert parsed == ["edited.py"]
+        assert result["total_symbols"] == 2
+        store = MapStore.load(tmp_path)
+        assert store.get_file("same.py").symbols[0].name == "same"
+        assert store.get_file("edited.py").symbols[0].name == "new"
+
+    def test_parse_cache_persists_without_close(self, tmp_path: Path, record_parses):
+        """Test that index_all commits the parse cache, as the CLI never closes it."""
+        (tmp_path / "a.py").write_text("def a(): pass")
+        Indexer(root=tmp_path).index_all()
+
+        indexer = Indexer(root=tmp_path)
+        parsed = record_parses(indexer)
+        indexer.index_all()
+        indexer.close()
+
+        assert parsed == []
+        assert MapStore.load(tmp_path).get_file("a.py").symbols[0].name == "a"
+
+    def test_rebuild_reparses_cached_files(self, tmp_path: Path, record_parses):
+        """Test that index_all(rebuild=True) ignores the parse cache."""
+        (tmp_path / "a.py").write_text("def a(): pass")
+        indexer = Indexer(root=tmp_path)
+        indexer.index_all()
+
+        parsed = record_parses(indexer)
+        indexer.index_all()
+        assert parsed == []
+
+        result = indexer.index_all(rebuild=True)
+        indexer.close()
+
+        assert parsed == ["a.py"]
+        assert result["total_symbols"] == 1
+
+    def test_parse_cache_version_tracks_runtime(self, monkeypatch):
+        """Test that the cache key changes with the Python and grammar versions."""
+        from codemap.core import indexer as indexer_module
+
+        monkeypatch.setattr(indexer_module.sys, "version_info", (3, 99, 0))
+        monkeypatch.setattr(indexer_module.metadata, "version", lambda name: "1.0")
+        indexer_module._parse_cache_version.cache_clear()
+        try:
+            first = indexer_module._parse_cache_version()
+            monkeypatch.setattr(
+                indexer_module.metadata,
+                "version",
+                lambda name: "2.0" if name == "tree-sitter-go" else "1.0",
+            )
+            indexer_module._parse_cache_version.cache_clear()
+            second = indexer_module._parse_cache_version()
+        finally:
+            # Recomputed with the real versions on next use
+            indexer_module._parse_cache_version.cache_clear()
+
+        assert "python3.99" in first
+        assert "tree-sitter-go=1.0" in first
+        assert second != first
+
+    def test_index_all_keeps_no_trees(self, tmp_path: Path):
+        """Test that bulk indexing doesn't hold trees meant for incremental reparses."""
+        pytest.importorskip("tree_sitter_css")
+        for i in range(3):
+            (tmp_path / f"s{i}.css").write_text(f".c{i} {{ color: red; }}")
+
+        indexer = Indexer(root=tmp_path, languages=["css"])
+        indexer.index_all(max_workers=1)
+        assert len(indexer._parsers["css"]._tree_cache) == 0
+
+        (tmp_path / "s0.css").write_text(".c0 { color: blue; }")
+        indexer.update_file(tmp_path / "s0.css")
+        indexer.close()
+        assert len(indexer._parsers["css"]._tree_cache) == 1
+
+    def test_index_all_parallel_matches_serial(self, tmp_path: Path):
+        """Test that parsing in worker processes gives the serial result."""
+        for root in (tmp_path / "serial", tmp_path / "parallel"):
+            root.mkdir()
+            for i in range(10):
+                (root / f"module{i}.py").write_text(f"def func{i}(): pass\n\nclass C{i}: pass\n")
+            (root / "broken.py").write_text("def broken(:\n")
+
+        serial = Indexer(root=tmp_path / "serial").index_all(max_workers=1)
+        parallel = Indexer(root=tmp_path / "parallel").index_all(max_workers=2)
+
+        assert parallel == serial
+        assert serial["total_files"] == 11
+        assert serial["total_symbols"] == 20
+        serial_store = MapStore.load(tmp_path / "serial")
+        parallel_store = MapStore.load(tmp_path / "parallel")
+        assert {rel: entry.symbols for rel, entry in parallel_store.get_all_files()} == {
+            rel: entry.symbols for rel, entry in serial_store.get_all_files()
+        }
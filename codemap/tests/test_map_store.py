@@ -1,11 +1,13 @@
 """Tests for the map store module."""
 
 import json
+import threading
+
 import pytest
 from pathlib import Path
 
-from codemap.core.map_store import MapStore, RootManifest, DirectoryMap, FileEntry
-from codemap.parsers.base import Symbol
+from codemap.core.map_store import MapStore, RootManifest, DirectoryMap, FileEntry, _write_json
+from codemap.parsers.base import Symbol, SymbolTable, pack_symbols, unpack_symbols
 
 
 class TestMapStore:
@@ -35,6 +37,64 @@ class TestMapStore:
         assert entry is not None
         assert entry.hash == "abc123def456"
 
+    def test_save_writes_only_changed_directories(self, tmp_path: Path):
+        store = MapStore(tmp_path)
+        store.update_file("root.py", "h1", "python", 10, [])
+        store.update_file("src/module.py", "h2", "python", 20, [])
+        store.update_stats()
+        store.save()
+
+        root_map = tmp_path / ".codemap" / "_root.codemap.json"
+        src_map = tmp_path / ".codemap" / "src" / ".codemap.json"
+        root_before = root_map.read_bytes()
+
+        # Loading every directory for the stats must not rewrite them all
+        store = MapStore.load(tmp_path)
+        store.update_file("src/module.py", "h3", "python", 20, [])
+        store.update_stats()
+        store.save()
+
+        assert root_map.read_bytes() == root_before
+        assert json.loads(src_map.read_bytes())["files"]["module.py"]["hash"] == "h3"
+        assert sorted(p.name for p in src_map.parent.iterdir()) == [".codemap.json"]
+
+    def test_concurrent_writes_use_separate_temp_files(self, tmp_path: Path):
+        target = tmp_path / "map.json"
+        errors = []
+
+        def write(n):
+            try:
+                for i in range(50):
+                    _write_json(target, {"writer": n, "i": i, "pad": "x" * 10000})
+            except OSError as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=write, args=(n,)) for n in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert errors == []
+        assert json.loads(target.read_bytes())["i"] == 49
+        assert [p.name for p in tmp_path.iterdir()] == ["map.json"]
+
+    def test_load_shares_repeated_strings(self, tmp_path: Path):
+        store = MapStore(tmp_path)
+        for path in ("a.py", "src/b.py"):
+            store.update_file(path, "h", "python", 10, [
+                Symbol(name="Service", type="class", lines=(1, 9), children=[
+                    Symbol(name="__init__", type="method", lines=(2, 3), signature="(self)"),
+                ]),
+            ])
+        store.save()
+
+        store = MapStore.load(tmp_path)
+        a = store.get_file("a.py").symbols[0].children[0]
+        b = store.get_file("src/b.py").symbols[0].children[0]
+        assert a.name is b.name
+        assert a.signature is b.signature
+
     def test_update_file(self, tmp_path: Path):
         store = MapStore(tmp_path)
 
@@ -232,6 +292,23 @@ class TestMapStore:
         # Should return empty manifest instead of crashing
         assert store.manifest.directories == []
 
+    @pytest.mark.parametrize("use_orjson", [True, False], ids=["orjson", "json"])
+    def test_serializers_write_same_bytes(self, tmp_path: Path, monkeypatch, use_orjson):
+        if use_orjson:
+            pytest.importorskip("orjson")
+        monkeypatch.setattr("codemap.core.map_store.ORJSON_AVAILABLE", use_orjson)
+        store = MapStore(tmp_path)
+        symbols = [Symbol(name="ünï", type="function", lines=(1, 2))]
+        store.update_file("日本.py", "h1", "python", 10, symbols)
+        store.save()
+
+        map_path = tmp_path / ".codemap" / "_root.codemap.json"
+        data = json.loads(map_path.read_bytes())
+        assert map_path.read_bytes() == json.dumps(
+            data, indent=2, sort_keys=True, ensure_ascii=False
+        ).encode("utf-8")
+        assert MapStore.load(tmp_path).get_file("日本.py").symbols[0].name == "ünï"
+
     def test_get_all_files(self, tmp_path: Path):
         store = MapStore(tmp_path)
 
@@ -370,3 +447,53 @@ class TestSymbol:
         assert sym.lines == (5, 15)
         assert len(sym.children) == 1
         assert sym.children[0].name == "nested"
+
+    def test_pack_unpack_symbols_roundtrip(self):
+        symbols = [
+            Symbol(
+                name="MyClass",
+                type="class",
+                lines=(1, 50),
+                docstring="A class.",
+                children=[
+                    Symbol(name="method", type="method", lines=(10, 20), signature="(self)")
+                ],
+            ),
+            Symbol(name="func", type="function", lines=(52, 60)),
+        ]
+
+        restored = unpack_symbols(pack_symbols(symbols))
+
+        assert restored == symbols
+
+    def test_symbol_from_dict_interns_type(self):
+        a = Symbol.from_dict({"name": "a", "type": "".join(["meth", "od"]), "lines": [1, 2]})
+        b = Symbol.from_dict({"name": "b", "type": "".join(["met", "hod"]), "lines": [3, 4]})
+
+        assert a.type is b.type
+        assert not hasattr(a, "__dict__")
+
+    def test_symbol_table_roundtrip_and_queries(self):
+        symbols = [
+            Symbol(
+                name="Outer",
+                type="class",
+                lines=(1, 30),
+                children=[
+                    Symbol(name="Inner", type="class", lines=(2, 10), children=[
+                        Symbol(name="deep", type="method", lines=(3, 4), signature="(self)"),
+                    ]),
+                    Symbol(name="run", type="method", lines=(12, 20)),
+                ],
+            ),
+            Symbol(name="helper", type="function", lines=(32, 40), docstring="Help."),
+        ]
+
+        table = SymbolTable.from_symbols(symbols)
+
+        assert len(table) == 5
+        assert table.top_level == 2
+        assert [table.names[r] for r in table.children(0)] == ["Inner", "run"]
+        assert [table.names[r] for r in table.rows_of_type("method")] == ["run", "deep"]
+        assert [table.names[r] for r in table.rows_at_line(3)] == ["Outer", "Inner", "deep"]
+        assert table.to_symbols() == symbols
@@ -0,0 +1,132 @@
+"""Tests for the persistent parse cache."""
+
+import sqlite3
+import time
+
+import pytest
+
+from codemap.parsers import parse_cache
+from codemap.parsers.base import Symbol
+from codemap.parsers.parse_cache import ParseCache
+from codemap.parsers.yaml_parser import YamlParser
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = ParseCache(tmp_path / "cache.db")
+    yield cache
+    cache.close()
+
+
+def _symbols(name):
+    return [Symbol(name=name, type="function", lines=(1, 2), signature="()")]
+
+
+class TestParseCache:
+    """Tests for ParseCache."""
+
+    def test_hit_skips_parse(self, cache):
+        calls = []
+
+        def parse():
+            calls.append(1)
+            return _symbols("a")
+
+        first = cache.get_or_parse("a.ts", b"function a() {}", parse)
+        second = cache.get_or_parse("a.ts", b"function a() {}", parse)
+
+        assert first == second == _symbols("a")
+        assert len(calls) == 1
+
+    def test_changed_content_reparses(self, cache):
+        cache.get_or_parse("a.ts", b"function a() {}", lambda: _symbols("a"))
+        result = cache.get_or_parse("a.ts", b"function b() {}", lambda: _symbols("b"))
+
+        assert result == _symbols("b")
+        assert len(cache) == 1
+
+    def test_persists_across_instances(self, tmp_path):
+        path = tmp_path / "cache.db"
+        first = ParseCache(path)
+        first.get_or_parse("a.ts", "function a() {}", lambda: _symbols("a"))
+        first.close()
+
+        second = ParseCache(path)
+        result = second.get_or_parse("a.ts", "function a() {}", lambda: pytest.fail("reparsed"))
+        second.close()
+
+        assert result == _symbols("a")
+
+    def test_version_change_empties_cache(self, tmp_path):
+        path = tmp_path / "cache.db"
+        first = ParseCache(path, version="1")
+        first.put("a.ts", "function a() {}", _symbols("a"))
+        first.close()
+
+        same = ParseCache(path, version="1")
+        assert same.get("a.ts", "function a() {}") == _symbols("a")
+        same.close()
+
+        bumped = ParseCache(path, version="2")
+        assert bumped.get("a.ts", "function a() {}") is None
+        assert len(bumped) == 0
+        bumped.close()
+
+    def test_unread_file_uses_mtime_and_size(self, cache, tmp_path):
+        source = tmp_path / "a.yaml"
+        source.write_text("a: 1\n")
+        cache.get_or_parse(str(source), None, lambda: _symbols("a"))
+
+        # Unchanged on disk: not even read again
+        assert cache.get_or_parse(str(source), None, lambda: pytest.fail("reparsed")) == _symbols("a")
+
+        source.write_text("bb: 2\n")
+        assert cache.get_or_parse(str(source), None, lambda: _symbols("bb")) == _symbols("bb")
+
+    def test_evicts_least_recently_used(self, tmp_path):
+        cache = ParseCache(tmp_path / "cache.db", max_entries=10)
+        for i in range(256):
+            cache.get_or_parse(f"{i}.ts", str(i), lambda: _symbols("x"))
+
+        assert len(cache) == 10
+        assert cache.get_or_parse("255.ts", "255", lambda: pytest.fail("evicted")) == _symbols("x")
+        cache.close()
+
+    def test_hits_and_writes_are_batched(self, cache, tmp_path):
+        cache.put("a.ts", "a", _symbols("a"))
+        cache.flush()
+        other = sqlite3.connect(tmp_path / "cache.db")
+        used = other.execute("SELECT last_used FROM cache WHERE path = 'a.ts'").fetchone()
+
+        assert cache.get("a.ts", "a") == _symbols("a")
+        cache.put("b.ts", "b", _symbols("b"))
+        assert other.execute("SELECT last_used FROM cache WHERE path = 'a.ts'").fetchone() == used
+        assert other.execute("SELECT COUNT(*) FROM cache").fetchone()[0] == 1
+
+        cache.flush()
+        assert other.execute("SELECT last_used FROM cache WHERE path = 'a.ts'").fetchone() > used
+        assert other.execute("SELECT COUNT(*) FROM cache").fetchone()[0] == 2
+        other.close()
+
+    def test_eviction_counts_pending_hits(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(parse_cache, "_EVICT_EVERY", 3)
+        cache = ParseCache(tmp_path / "cache.db", max_entries=2)
+        cache.put("a.ts", "a", _symbols("a"))
+        time.sleep(0.01)
+        cache.put("b.ts", "b", _symbols("b"))
+        time.sleep(0.01)
+        cache.get("a.ts", "a")
+        time.sleep(0.01)
+        cache.put("c.ts", "c", _symbols("c"))
+
+        assert cache.get("a.ts", "a") == _symbols("a")
+        assert cache.get("b.ts", "b") is None
+        cache.close()
+
+    def test_yaml_parser_uses_cache(self, cache):
+        parser = YamlParser(parse_cache=cache)
+        source = "name: demo\nnested:\n  key: value\n"
+
+        first = parser.parse(source, "config.yaml")
+        assert len(cache) == 1
+        assert parser.parse(source, "config.yaml") == first == YamlParser().parse(source)
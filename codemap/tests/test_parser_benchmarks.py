@@ -0,0 +1,52 @@
+"""Throughput benchmarks for the CSS, HTML and Go parsers.
+
+Opt-in: needs pytest-benchmark. To guard against regressions, save a
+baseline and compare later runs against it:
+
+    pytest codemap/tests/test_parser_benchmarks.py --benchmark-autosave
+    pytest codemap/tests/test_parser_benchmarks.py --benchmark-compare --benchmark-compare-fail=mean:10%
+"""
+
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+pytestmark = pytest.mark.slow
+
+FIXTURES = Path(__file__).parent / "fixtures"
+
+
+def _fixture(name: str) -> str:
+    return (FIXTURES / name).read_bytes().decode("utf-8")
+
+
+def test_css_parse_throughput(benchmark):
+    pytest.importorskip("tree_sitter_css")
+    from codemap.parsers.css_parser import CssParser
+
+    benchmark(CssParser().parse, _fixture("sample_styles.css"))
+
+
+def test_html_parse_throughput(benchmark):
+    pytest.importorskip("tree_sitter_html")
+    from codemap.parsers.html_parser import HtmlParser
+
+    benchmark(HtmlParser().parse, _fixture("sample_page.html"))
+
+
+def test_html_deep_nesting_throughput(benchmark):
+    pytest.importorskip("tree_sitter_html")
+    from codemap.parsers.html_parser import HtmlParser
+
+    depth = 50
+    html = "<div>" * depth + '<p id="x">x</p>' + "</div>" * depth
+    benchmark(HtmlParser().parse, html)
+
+
+def test_go_parse_throughput(benchmark):
+    pytest.importorskip("tree_sitter_go")
+    from codemap.parsers.go_parser import GoParser
+
+    benchmark(GoParser().parse, _fixture("sample_module.go"))
@@ -215,3 +215,40 @@ class Class2:
         assert symbols[1].name == "Class1"
         assert symbols[2].name == "func2"
         assert symbols[3].name == "Class2"
+
+    def test_parse_batch_matches_serial_parse(self, parser):
+        files = [
+            ("def func1():\n    pass\n", "a.py"),
+            ("class Class1:\n    def method(self):\n        pass\n", "b.py"),
+            ("async def func2(x: int) -> int:\n    return x\n", "c.py"),
+        ]
+
+        results = PythonParser.parse_batch(files, max_workers=2)
+
+        assert results == [parser.parse(source, path) for source, path in files]
+
+    def test_signature_annotations_match_unparse(self, parser):
+        source = '''
+def func(a: dict[str, list[int]], b: os.PathLike | None = None, *, c: "Fwd" = 'x') -> typing.Optional[int]:
+    pass
+'''
+        symbols = parser.parse(source)
+
+        assert symbols[0].signature == (
+            "(a: dict[str, list[int]], b: os.PathLike | None=None, *, c: 'Fwd'='x')"
+            " -> typing.Optional[int]"
+        )
+
+    def test_repeated_signatures_share_one_string(self, parser):
+        source = '''
+class A:
+    def __eq__(self, other):
+        pass
+
+class B:
+    def __eq__(self, other):
+        pass
+'''
+        symbols = parser.parse(source)
+
+        assert symbols[0].children[0].signature is symbols[1].children[0].signature
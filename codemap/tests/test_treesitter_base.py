@@ -1,5 +1,7 @@
 """Tests for the TreeSitter base parser classes."""
 
+import importlib
+
 import pytest
 
 from codemap.parsers.treesitter_base import (
@@ -9,6 +11,13 @@ from codemap.parsers.treesitter_base import (
 )
 
 
+def _parser_class(path: str) -> type:
+    """Import "module.Class" from codemap.parsers, skipping if its grammar is missing."""
+    module_name, class_name = path.rsplit(".", 1)
+    pytest.importorskip("tree_sitter_" + module_name.removesuffix("_parser"))
+    return getattr(importlib.import_module(f"codemap.parsers.{module_name}"), class_name)
+
+
 class TestLanguageConfig:
     """Tests for LanguageConfig dataclass."""
 
@@ -40,6 +49,18 @@ class TestLanguageConfig:
         assert config.export_wrappers == []
         assert config.comment_types == ["comment"]
         assert config.doc_comment_prefix is None
+        assert config.symbol_node_types == frozenset()
+
+    def test_symbol_node_types_cover_mappings_and_wrappers(self):
+        config = LanguageConfig(
+            name="test",
+            extensions=[".test"],
+            grammar_module="test",
+            node_mappings={"function": NodeMapping(symbol_type="function", name_child="identifier")},
+            export_wrappers=["export_statement"],
+        )
+
+        assert config.symbol_node_types == {"function", "export_statement"}
 
 
 class TestNodeMapping:
@@ -100,3 +121,148 @@ class TestTreeSitterAvailability:
     def test_import_base_classes(self):
         from codemap.parsers.treesitter_base import TreeSitterParser
         assert TreeSitterParser is not None
+
+    def test_parsers_share_language_and_pool(self):
+        pytest.importorskip("tree_sitter_go")
+        from codemap.parsers.go_parser import GoParser
+        from codemap.parsers.treesitter_base import _PARSER_POOL
+
+        first, second = GoParser(), GoParser()
+        assert first._language is second._language
+
+        first.parse("package main\nfunc A() {}\n")
+        second.parse("package main\nfunc B() {}\n")
+        assert _PARSER_POOL["go"].qsize() >= 1
+
+    @pytest.mark.parametrize(
+        "parser_path,attrs",
+        [
+            ("css_parser.CssParser", ["_parser"]),
+            ("html_parser.HtmlParser", ["_parser"]),
+            ("typescript_parser.TypeScriptParser", ["_ts_parser", "_tsx_parser"]),
+        ],
+        ids=["css", "html", "typescript"],
+    )
+    def test_parsers_share_language(self, parser_path, attrs):
+        """Test that each instance reuses the process-wide Language."""
+        parser_cls = _parser_class(parser_path)
+        first, second = parser_cls(), parser_cls()
+
+        for attr in attrs:
+            assert getattr(first, attr).language is getattr(second, attr).language
+
+    @pytest.mark.parametrize(
+        "parser_path,filepath,original,edited,names",
+        [
+            (
+                "go_parser.GoParser",
+                "main.go",
+                "package main\n\nfunc A() {}\n\nfunc B(x int) {}\n",
+                "package main\n\nfunc A() {}\n\nfunc Renamed(x int, y string) {}\n",
+                ["A", "Renamed"],
+            ),
+            (
+                "css_parser.CssParser",
+                "page.css",
+                "a { color: red; }\n.old { margin: 0; }\n",
+                "a { color: blue; }\n.renamed { margin: 0; }\n",
+                ["a", ".renamed"],
+            ),
+            (
+                "html_parser.HtmlParser",
+                "page.html",
+                '<div id="a">x</div>\n<nav>y</nav>\n',
+                '<div id="renamed">x</div>\n<nav>y</nav>\n',
+                ["#renamed", "<nav>"],
+            ),
+        ],
+        ids=["go", "css", "html"],
+    )
+    def test_incremental_parse_matches_full_parse(
+        self, parser_path, filepath, original, edited, names
+    ):
+        """Test that reparsing an edited file reuses its tree correctly."""
+        parser_cls = _parser_class(parser_path)
+        parser = parser_cls()
+
+        parser.parse(original, filepath)
+        incremental = parser.parse(edited, filepath)
+
+        assert incremental == parser_cls().parse(edited)
+        assert [s.name for s in incremental] == names
+        assert len(parser._tree_cache) == 1
+
+    def test_parse_lazy_defers_details_and_survives_reparse(self):
+        pytest.importorskip("tree_sitter_go")
+        from codemap.parsers.go_parser import GoParser
+        from codemap.parsers.treesitter_base import LazySymbol
+
+        parser = GoParser()
+        original = "package main\n\n// Add sums two ints.\nfunc Add(a int, b int) int { return a + b }\n"
+        lazy = parser.parse_lazy(original, "main.go")
+        # Reparsing the same file edits the cached tree incrementally
+        parser.parse("package main\n\n" + original[14:].replace("Add", "Plus"), "main.go")
+
+        assert isinstance(lazy[0], LazySymbol)
+        assert lazy[0].materialize() == GoParser().parse(original)[0]
+        assert lazy[0].docstring == "Add sums two ints."
+
+
+class TestComputeInputEdit:
+    """Tests for the tree-sitter edit calculation helper."""
+
+    def test_identical_sources(self):
+        from codemap.parsers.treesitter_base import compute_input_edit
+        assert compute_input_edit(b"same", b"same") is None
+
+    def test_insertion_points(self):
+        from codemap.parsers.treesitter_base import compute_input_edit
+        edit = compute_input_edit(b"abc\ndef", b"abc\ndXef")
+
+        assert edit["start_byte"] == 5
+        assert edit["old_end_byte"] == 5
+        assert edit["new_end_byte"] == 6
+        assert edit["start_point"] == (1, 1)
+        assert edit["new_end_point"] == (1, 2)
+
+
+class TestTreeCache:
+    """Tests for the per-file tree cache."""
+
+    def test_skip_tree_cache_keeps_no_trees(self):
+        from codemap.parsers.treesitter_base import TreeCache, skip_tree_cache
+        cache = TreeCache()
+        cache.put("a.css", b"a", "tree-a")
+
+        with skip_tree_cache():
+            assert cache.take("a.css") == (b"a", "tree-a")
+            cache.put("a.css", b"b", "tree-b")
+        assert len(cache) == 0
+
+        cache.put("a.css", b"c", "tree-c")
+        assert cache.take("a.css") == (b"c", "tree-c")
+
+
+class TestCleanComment:
+    """Tests for doc comment cleaning."""
+
+    def test_long_jsdoc_is_capped(self):
+        from codemap.parsers.treesitter_base import _clean_jsdoc
+        comment = b"/**\n" + b" * Licensed under the terms below.\n" * 500 + b" */"
+
+        cleaned = _clean_jsdoc(comment)
+
+        assert len(cleaned) == 150
+        assert cleaned.startswith("Licensed under the terms below. Licensed")
+
+    def test_jsdoc_drops_tags_and_gutters(self):
+        from codemap.parsers.treesitter_base import _clean_jsdoc
+        comment = b"/**\n * Does a thing.\n *\n * @param x the x\n */"
+
+        assert _clean_jsdoc(comment) == "Does a thing."
+
+    def test_long_line_comment_truncates_on_character_boundary(self):
+        from codemap.parsers.treesitter_base import _clean_line
+        comment = "// " + "é€😀" * 400
+
+        assert _clean_line(comment.encode("utf-8")) == ("é€😀" * 50)
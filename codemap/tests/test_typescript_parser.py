@@ -1,5 +1,7 @@
 """Tests for the TypeScript parser."""
 
+import sys
+
 import pytest
 
 # Skip all tests if tree-sitter is not available
@@ -46,6 +48,8 @@ async function fetchData(url: string): Promise<Response> {
         assert len(symbols) == 1
         assert symbols[0].name == "fetchData"
         assert symbols[0].type == "async_function"
+        # Shares the interned constant rather than building a new string
+        assert symbols[0].type is sys.intern("async_function")
 
     def test_parse_arrow_function(self, parser):
         source = '''
@@ -291,3 +295,106 @@ class Container<T> {
         assert len(symbols) == 1
         assert symbols[0].name == "Container"
         assert symbols[0].type == "class"
+
+    def test_preceding_comments(self, parser):
+        source = '''
+/**
+ * Adds two numbers.
+ * @param a first
+ */
+function add(a: number, b: number) {}
+// Négates a number.
+function neg(a: number) {}
+/* Not documentation. */
+function plain() {}
+'''
+        symbols = parser.parse(source, "test.ts")
+
+        assert [s.docstring for s in symbols] == ["Adds two numbers.", "Négates a number.", None]
+
+    def test_repeated_parse_uses_symbol_cache(self, parser):
+        source = "export function greet(name: string): string { return name; }\n"
+
+        first = parser.parse(source, "a.ts")
+        second = parser.parse(source, "b.ts")
+        parser.parse(source, "c.tsx")
+
+        assert second == first
+        assert second is not first
+        assert len(parser._symbol_cache) == 2
+
+    def test_symbol_cache_hits_are_independent(self, parser):
+        source = "export class A {\n  run(): void {}\n}\n"
+
+        first = parser.parse(source, "a.ts")
+        first[0].name = "Renamed"
+        first[0].children.clear()
+        second = parser.parse(source, "a.ts")
+        second[0].children.append(first[0])
+
+        assert second[0].name == "A"
+        assert [c.name for c in parser.parse(source, "a.ts")[0].children] == ["run"]
+
+    def test_apply_edit_matches_full_parse(self, parser):
+        original = "function a(): void {}\n\nfunction b(x: number): number { return x; }\n"
+        edited = original.replace("function b(", "function renamed(")
+        start = original.index("b(")
+
+        parser.parse(original, "edit.ts")
+        symbols = parser.apply_edit(
+            "edit.ts", edited,
+            start_byte=start, old_end_byte=start + 1, new_end_byte=start + len("renamed"),
+            start_point=(2, 9), old_end_point=(2, 10), new_end_point=(2, 16),
+        )
+
+        assert symbols == TypeScriptParser().parse(edited, "edit.ts")
+        assert [s.name for s in symbols] == ["a", "renamed"]
+
+    def test_apply_edit_recovers_from_stale_edit(self, parser):
+        original = "function a(): void {}\n"
+        edited = "function zzz(): void {}\nfunction b(): void {}\n"
+
+        parser.parse(original, "stale.ts")
+        # Edit offsets that do not describe the actual change
+        symbols = parser.apply_edit(
+            "stale.ts", edited,
+            start_byte=0, old_end_byte=0, new_end_byte=0,
+            start_point=(0, 0), old_end_point=(0, 0), new_end_point=(0, 0),
+        )
+
+        assert [s.name for s in symbols] == ["zzz", "b"]
+
+    def test_parse_many_matches_parse(self, parser):
+        files = [
+            ("function a(x: number): void {}\n", "a.ts"),
+            ("export const View = () => <div />;\n", "view.tsx"),
+            ("class K { async m() {} }\n", "k.ts"),
+        ]
+
+        results = parser.parse_many(files, max_workers=2)
+
+        assert results == [TypeScriptParser().parse(source, path) for source, path in files]
+
+    def test_parse_many_serves_persistent_cache_hits(self, tmp_path):
+        from codemap.parsers.parse_cache import ParseCache
+
+        cache = ParseCache(tmp_path / "cache.db")
+        files = [("function a() {}\n", "a.ts"), ("function b() {}\n", "b.ts")]
+        TypeScriptParser(parse_cache=cache).parse_many(files)
+
+        fresh = TypeScriptParser(parse_cache=cache)
+        fresh._parse_detached = lambda item: pytest.fail("parsed a cached file")
+        results = fresh.parse_many(files)
+        cache.close()
+
+        assert [[s.name for s in symbols] for symbols in results] == [["a"], ["b"]]
+
+    def test_plain_declarations_are_skipped(self, parser):
+        source = '''
+const limit = 5;
+const arrow = "=>";
+let handler = (event: Event): void => {};
+'''
+        symbols = parser.parse(source, "test.ts")
+
+        assert [(s.name, s.signature) for s in symbols] == [("handler", "(event: Event) : void")]
@@ -91,6 +91,24 @@ second:
         assert symbols[0].lines[1] == 3  # Ends before 'second'
         assert symbols[1].lines[0] == 4
 
+    def test_line_ranges_after_dedent(self, parser):
+        source = '''a:
+  b:
+    c: 1
+    d: 2
+  e: 3
+f: 4
+'''
+        symbols = parser.parse(source)
+        a, f = symbols
+        b, e = a.children
+
+        assert a.lines == (1, 5)
+        assert b.lines == (2, 4)
+        assert [c.lines for c in b.children] == [(3, 3), (4, 4)]
+        assert e.lines == (5, 5)
+        assert f.lines == (6, 7)
+
     def test_value_preview_as_docstring(self, parser):
         source = '''name: "My Application"
 description: "A really long description that goes on and on"
@@ -167,3 +185,25 @@ other: value2
         extensions = parser.supported_extensions()
         assert ".yaml" in extensions
         assert ".yml" in extensions
+
+    def test_key_scan_matches_patterns(self, parser):
+        """The str-method line scanner agrees with the documented regexes."""
+        from codemap.parsers.yaml_parser import _scan_key_line
+
+        lines = [
+            "key: v", "  nested-key :", "\tkey_1: x", "- name: a", "-  item : b",
+            "-name: c", "- 'quoted': d", "'': e", "\"a\"b: f", "\"x y\" : g",
+            "- -dash: h", "- _under: i", "ключ: j", "- ² : k", "a b: l", "url: http://x",
+            "- : m", "-: n", "\"'\": o",
+        ]
+        for line in lines:
+            stripped = line.lstrip()
+            expected = None
+            match = parser.LIST_ITEM_PATTERN.match(line)
+            if match:
+                expected = (len(match.group(1)) + 2, match.group(2), True)
+            else:
+                match = parser.KEY_PATTERN.match(line)
+                if match:
+                    expected = (len(match.group(1)), match.group(2).strip("\"'"), False)
+            assert _scan_key_line(line, stripped) == expected, line
@@ -3,11 +3,38 @@
 from __future__ import annotations
 
 import fnmatch
+import os
 from pathlib import Path
 from typing import Iterator
 
 from .config import Config, DEFAULT_EXCLUDE_PATTERNS
 
+# Directory names excluded wherever they appear, whatever the patterns say
+_EXCLUDED_DIR_NAMES = frozenset(
+    ("node_modules", "__pycache__", ".venv", "venv", "dist", "build", ".git")
+)
+
+# File extensions for each supported language
+_LANGUAGE_EXTENSIONS: dict[str, tuple[str, ...]] = {
+    "python": (".py", ".pyi"),
+    "typescript": (".ts", ".tsx"),
+    "javascript": (".js", ".jsx"),
+    "markdown": (".md", ".markdown"),
+    "yaml": (".yaml", ".yml"),
+    "kotlin": (".kt", ".kts"),
+    "swift": (".swift",),
+    "c": (".c", ".h"),  # Default to C for .h files
+    "cpp": (".cpp", ".hpp", ".cc", ".hh", ".cxx", ".hxx"),
+    "html": (".html", ".htm"),
+    "css": (".css",),
+    "php": (".php", ".phtml"),
+}
+
+# Reverse lookup used by get_language, built once at import
+_EXTENSION_TO_LANGUAGE: dict[str, str] = {
+    ext: lang for lang, exts in _LANGUAGE_EXTENSIONS.items() for ext in exts
+}
+
 
 def discover_files(
     root: Path,
@@ -28,29 +55,58 @@ def discover_files(
         config = Config()
 
     # Determine extensions based on languages
-    extensions = _get_extensions_for_languages(languages or config.languages)
-
-    for path in root.rglob("*"):
-        if not path.is_file():
+    extensions = frozenset(_get_extensions_for_languages(languages or config.languages))
+    patterns = config.exclude_patterns
+    # Patterns that, once they match a directory, match everything inside it
+    dir_patterns = _get_dir_patterns(patterns)
+
+    # Depth first, each directory's files before its subdirectories' (as
+    # os.walk), using the file types the directory listing already returned
+    stack = [(str(root), "")]
+    while stack:
+        dirpath, rel_dir = stack.pop()
+        try:
+            with os.scandir(dirpath) as it:
+                entries = list(it)
+        except OSError:
             continue
 
-        # Check extension
-        if not any(path.suffix == ext for ext in extensions):
-            continue
+        subdirs = []
+        for entry in entries:
+            name = entry.name
+            try:
+                is_dir = entry.is_dir()
+            except OSError:
+                is_dir = False
 
-        # Get relative path for pattern matching
-        try:
-            rel_path = path.relative_to(root)
-        except ValueError:
-            continue
+            if is_dir:
+                # Prune excluded directories so their subtrees are never
+                # listed; symlinked directories aren't followed
+                rel_path = os.path.join(rel_dir, name)
+                if not entry.is_symlink() and not _is_excluded_dir(
+                    rel_path, name, patterns, dir_patterns
+                ):
+                    subdirs.append((entry.path, rel_path))
+                continue
 
-        rel_str = str(rel_path)
+            # Check extension
+            if os.path.splitext(name)[1] not in extensions:
+                continue
 
-        # Check exclude patterns
-        if should_exclude(rel_str, config.exclude_patterns):
-            continue
+            # Check exclude patterns against the path relative to root
+            if should_exclude(os.path.join(rel_dir, name), patterns):
+                continue
+
+            # Skip broken symlinks, sockets and the like
+            try:
+                if not entry.is_file():
+                    continue
+            except OSError:
+                continue
+
+            yield Path(entry.path)
 
-        yield path
+        stack.extend(reversed(subdirs))
 
 
 def should_exclude(filepath: str, patterns: list[str] | None = None) -> bool:
@@ -79,11 +135,53 @@ def should_exclude(filepath: str, patterns: list[str] | None = None) -> bool:
         parts = filepath.split("/")
         for part in parts:
             # Check if directory name matches common excludes
-            if part in ("node_modules", "__pycache__", ".venv", "venv", "dist", "build", ".git"):
+            if part in _EXCLUDED_DIR_NAMES:
                 return True
     return False
 
 
+def _get_dir_patterns(patterns: list[str]) -> list[str]:
+    """Get the forms of exclude patterns that can exclude whole directories.
+
+    A pattern ending in "*" that matches "dir/" matches every path below
+    dir too, so the directory can be skipped without listing it.
+
+    Args:
+        patterns: Exclude patterns, as passed to should_exclude().
+
+    Returns:
+        Patterns to match against a directory path with a trailing separator.
+    """
+    dir_patterns = []
+    for pattern in patterns:
+        if pattern.endswith("*"):
+            dir_patterns.append(pattern)
+            if "**" in pattern:
+                dir_patterns.append(pattern.replace("**", "*"))
+    return dir_patterns
+
+
+def _is_excluded_dir(
+    rel_dir: str, name: str, patterns: list[str], dir_patterns: list[str]
+) -> bool:
+    """Check if every file below a directory would be excluded by should_exclude().
+
+    Args:
+        rel_dir: Directory path relative to the root.
+        name: The directory's own name.
+        patterns: Exclude patterns; should_exclude() only applies its
+            built-in directory names when there is at least one.
+        dir_patterns: Patterns from _get_dir_patterns().
+
+    Returns:
+        True if the directory can be skipped entirely.
+    """
+    if patterns and name in _EXCLUDED_DIR_NAMES:
+        return True
+    rel_dir += os.sep
+    return any(fnmatch.fnmatch(rel_dir, pattern) for pattern in dir_patterns)
+
+
 def _get_extensions_for_languages(languages: list[str]) -> list[str]:
     """Get file extensions for given languages.
 
@@ -93,26 +191,9 @@ def _get_extensions_for_languages(languages: list[str]) -> list[str]:
     Returns:
         List of file extensions.
     """
-    extension_map = {
-        "python": [".py", ".pyi"],
-        "typescript": [".ts", ".tsx"],
-        "javascript": [".js", ".jsx"],
-        "markdown": [".md", ".markdown"],
-        "yaml": [".yaml", ".yml"],
-        "kotlin": [".kt", ".kts"],
-        "swift": [".swift"],
-        "c": [".c", ".h"],
-        "cpp": [".cpp", ".hpp", ".cc", ".hh", ".cxx", ".hxx"],
-        "html": [".html", ".htm"],
-        "css": [".css"],
-        "php": [".php", ".phtml"],
-    }
-
     extensions = []
     for lang in languages:
-        lang_lower = lang.lower()
-        if lang_lower in extension_map:
-            extensions.extend(extension_map[lang_lower])
+        extensions.extend(_LANGUAGE_EXTENSIONS.get(lang.lower(), ()))
     return extensions
 
 
@@ -132,6 +213,18 @@ def count_lines(filepath: Path) -> int:
         return 0
 
 
+def count_lines_in(content: bytes) -> int:
+    """Count the lines in content already read, as count_lines() would for its file.
+
+    Args:
+        content: File content with newlines normalized to \\n.
+
+    Returns:
+        Number of lines, counting a final line without a newline.
+    """
+    return content.count(b"\n") + (content[-1:] not in (b"", b"\n"))
+
+
 def get_language(filepath: Path) -> str | None:
     """Determine the language of a file based on extension.
 
@@ -141,33 +234,4 @@ def get_language(filepath: Path) -> str | None:
     Returns:
         Language name or None if unknown.
     """
-    suffix = filepath.suffix.lower()
-    extension_to_lang = {
-        ".py": "python",
-        ".pyi": "python",
-        ".ts": "typescript",
-        ".tsx": "typescript",
-        ".js": "javascript",
-        ".jsx": "javascript",
-        ".md": "markdown",
-        ".markdown": "markdown",
-        ".yaml": "yaml",
-        ".yml": "yaml",
-        ".kt": "kotlin",
-        ".kts": "kotlin",
-        ".swift": "swift",
-        ".c": "c",
-        ".h": "c",  # Default to C for .h files
-        ".cpp": "cpp",
-        ".hpp": "cpp",
-        ".cc": "cpp",
-        ".hh": "cpp",
-        ".cxx": "cpp",
-        ".hxx": "cpp",
-        ".html": "html",
-        ".htm": "html",
-        ".css": "css",
-        ".php": "php",
-        ".phtml": "php",
-    }
-    return extension_to_lang.get(suffix)
+    return _EXTENSION_TO_LANGUAGE.get(filepath.suffix.lower())